@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+"""
+Micro-benchmark of 'digit.Amount' construction cost and per-instance memory.
+
+Usage: python3 benchmarks/amount.py [count ...]
+"""
+
+import os, sys, time, tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+from amounts.utils import digit
+
+FIELDS = ["numeric", "string", "scope", "string_no_scope", "decimal_precision", "bin", "hex", "hex_no_fp", "byte", "unicode", "overflow", "underflow"]
+
+def construct(values: list[str], type: digit.Type, touch: list[str]):
+	"""
+	Construct an amount for each value, and access the specified representations.
+	"""
+	amounts = []
+	for value in values:
+		amount = digit.Amount(value, digit.Category.MIDDLE, type)
+		for field in touch:
+			getattr(amount, field)
+		amounts.append(amount)
+	return amounts
+
+def measure(values: list[str], type: digit.Type, touch: list[str]):
+	"""
+	Returns the construction time in nanoseconds per instance, and the memory in bytes per instance.
+	"""
+	start = time.perf_counter()
+	construct(values, type, touch)
+	elapsed = time.perf_counter() - start
+	tracemalloc.start()
+	before = tracemalloc.get_traced_memory()[0]
+	amounts = construct(values, type, touch)
+	after = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	del amounts
+	return elapsed / len(values) * 1e9, (after - before) / len(values)
+
+def main():
+	counts = [int(count) for count in sys.argv[1:]] or [10 ** 5, 10 ** 6]
+	scenarios = [
+		("construct only", []),
+		("string fields", ["string", "string_no_scope"]),
+		("all fields", FIELDS)
+	]
+	print(f"{'type':<8} {'count':>9} {'scenario':<15} {'ns/instance':>12} {'bytes/instance':>15}")
+	for count in counts:
+		for type, values in [(digit.Type.INTEGER, [str(i) for i in range(count)]), (digit.Type.DECIMAL, [f"{i}.25" for i in range(count)])]:
+			for name, touch in scenarios:
+				elapsed, memory = measure(values, type, touch)
+				print(f"{type.value:<8} {count:>9} {name:<15} {elapsed:>12.0f} {memory:>15.0f}")
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark of the library API import time and first-result latency, each measured in a fresh interpreter.
+
+Usage: python3 benchmarks/api.py [--runs 20] [--save] [--compare] [--threshold 25]
+"""
+
+import argparse, json, os, statistics, subprocess, sys
+
+import baseline
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src")
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import amounts
+imported = time.perf_counter()
+next(amounts.generate(minimum = 1, maximum = 10000, middle = 2200))
+first = time.perf_counter()
+print(json.dumps({"import": imported - start, "first": first - start, "modules": sorted(name for name in ["argparse", "decimal", "struct"] if name in sys.modules)}))
+"""
+
+def measure(runs: int) -> dict[str, float]:
+	"""
+	Returns the median import time and first-result latency in milliseconds.
+	"""
+	imports = []
+	firsts = []
+	for i in range(runs):
+		result = json.loads(subprocess.run([sys.executable, "-c", PROBE], cwd = SRC, capture_output = True, text = True, check = True).stdout)
+		if "argparse" in result["modules"]:
+			print("WARNING: generating the first result imported 'argparse'")
+		imports.append(result["import"] * 1000)
+		firsts.append(result["first"] * 1000)
+	return {"api.import_ms": statistics.median(imports), "api.first_result_ms": statistics.median(firsts)}
+
+def main():
+	parser = argparse.ArgumentParser(description = "Benchmark the library API import time and first-result latency.")
+	parser.add_argument("--runs"     , type   = int         , default = 20, help = "number of fresh interpreters")
+	parser.add_argument("--save"     , action = "store_true",               help = "save the results to the baseline")
+	parser.add_argument("--compare"  , action = "store_true",               help = "exit with an error on regressions against the baseline, or on metrics without a baseline")
+	parser.add_argument("--threshold", type   = float       , default = 25, help = "regression threshold in percent")
+	args = parser.parse_args()
+	results = measure(args.runs)
+	stored = baseline.load(BASELINE)
+	baseline.report(stored, results)
+	if args.save:
+		baseline.save(BASELINE, results)
+	if args.compare:
+		regressions = baseline.compare(stored, results, args.threshold)
+		for regression in regressions:
+			print(f"REGRESSION: {regression}")
+		missing = baseline.missing(stored, results)
+		for name in missing:
+			print(f"MISSING: {name} has no baseline, save it with '--save'")
+		if regressions or missing:
+			sys.exit(1)
+
+if __name__ == "__main__":
+	main()
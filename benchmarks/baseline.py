@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+"""
+Helpers for storing benchmark results as a JSON baseline, and for flagging regressions against it.
+"""
+
+import json, os
+
+def load(path: str) -> dict[str, float]:
+	"""
+	Load a baseline, or return an empty one if it does not exist.
+	"""
+	if not os.path.isfile(path):
+		return {}
+	with open(path, "r", encoding = "UTF-8") as stream:
+		return json.load(stream)
+
+def save(path: str, results: dict[str, float], merge: bool = True):
+	"""
+	Save results to a baseline, keeping other metrics already stored in it.
+	"""
+	tmp = load(path) if merge else {}
+	tmp.update(results)
+	with open(path, "w", encoding = "UTF-8") as stream:
+		json.dump(dict(sorted(tmp.items())), stream, indent = "\t")
+		stream.write("\n")
+
+def compare(baseline: dict[str, float], results: dict[str, float], threshold: float) -> list[str]:
+	"""
+	Compare results to a baseline, where lower values are better.\n
+	Returns a list of regressions greater than the threshold, in percent.
+	"""
+	tmp = []
+	for name, value in results.items():
+		if name in baseline and baseline[name] > 0:
+			change = (value - baseline[name]) / baseline[name] * 100
+			if change > threshold:
+				tmp.append(f"{name}: {baseline[name]:.6g} -> {value:.6g} (+{change:.1f}%)")
+	return tmp
+
+def missing(baseline: dict[str, float], results: dict[str, float]) -> list[str]:
+	"""
+	Get the names of the results without a baseline, e.g., of new cases that were never saved.
+	"""
+	return [name for name in results if name not in baseline]
+
+def report(baseline: dict[str, float], results: dict[str, float]):
+	"""
+	Print results side by side with a baseline.
+	"""
+	width = max([len(name) for name in results] + [6])
+	print(f"{'metric':<{width}} {'baseline':>14} {'current':>14} {'change':>9}")
+	for name, value in results.items():
+		if name in baseline and baseline[name] > 0:
+			print(f"{name:<{width}} {baseline[name]:>14.6g} {value:>14.6g} {(value - baseline[name]) / baseline[name] * 100:>+8.1f}%")
+		else:
+			print(f"{name:<{width}} {'-':>14} {value:>14.6g} {'-':>9}")
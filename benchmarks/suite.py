@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark suite of 'digit.Amount' construction, each fuzz category, and 'Amounts.run()' across quotes and magnitudes.\n
+Reports the best time per call in microseconds, and the peak memory per call in kilobytes measured with 'tracemalloc'.
+
+Usage: python3 benchmarks/suite.py [--filter run.] [--repeats 5] [--api] [--save] [--compare] [--threshold 25]
+"""
+
+import argparse, collections, os, sys, time, tracemalloc, typing
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+import baseline
+
+from amounts.main import create
+from amounts.utils import boundary, digit, encoding, fuzz, general, ieee754, locales, memo, scripts
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+MAGNITUDES = [1, 10, 100, 1000]
+
+MIN_TIME = 0.05
+
+def consume(iterable: typing.Iterable[str]):
+	"""
+	Exhaust an iterable without keeping its entries.
+	"""
+	collections.deque(iterable, maxlen = 0)
+
+def run_cold(amounts: typing.Any):
+	"""
+	Generate the wordlist with an empty memoisation cache, so the categories memoised by previous calls are not reused.
+	"""
+	memo.CACHE.clear()
+	consume(amounts.run())
+
+def render_cold(types: tuple[str, ...]) -> list[str]:
+	"""
+	Get the boundaries of the types with an empty cache, so the boundaries computed by previous calls are not reused.
+	"""
+	boundary.boundaries.cache_clear()
+	return boundary.render(types)
+
+def amounts(digits: int = 4) -> tuple[digit.Amount, digit.Amount, digit.Amount]:
+	"""
+	Get fresh minimum, maximum, and middle amounts with the specified number of digits, so no lazy representations are cached yet.
+	"""
+	middle = "2" * digits
+	return (
+		digit.Amount("1", digit.Category.MINIMUM, digit.Type.INTEGER),
+		digit.Amount("9" * digits, digit.Category.MAXIMUM, digit.Type.INTEGER),
+		digit.Amount(middle, digit.Category.MIDDLE, digit.Type.INTEGER)
+	)
+
+def cases() -> list[tuple[str, typing.Callable[[], tuple], typing.Callable[..., typing.Any]]]:
+	"""
+	Get all benchmark cases as (name, setup, function), where the setup returns the function arguments and is not timed.
+	"""
+	tmp = [
+		("amount.integer", lambda: ("2200",)   , lambda value: digit.Amount(value, digit.Category.MIDDLE, digit.Type.INTEGER)),
+		("amount.decimal", lambda: ("2200.25",), lambda value: digit.Amount(value, digit.Category.MIDDLE, digit.Type.DECIMAL))
+	]
+	for name in ["separators", "zeros", "scopes", "currencies"]:
+		tmp.append((f"fuzz.{name}", lambda: (amounts()[2],), lambda middle, function = getattr(fuzz, name): consume(function(middle))))
+	tmp.extend([
+		("fuzz.brackets" , lambda: (amounts()[2], general.Quote.DOUBLE, False), lambda middle, quote, ignore: consume(fuzz.brackets(middle, quote, ignore))),
+		("fuzz.flows"    , lambda: (*amounts()[:2], False)                    , lambda minimum, maximum, ignore: consume(fuzz.flows(minimum, maximum, ignore))),
+		("fuzz.notations", lambda: (*amounts(), False)                        , lambda minimum, maximum, middle, ignore: consume(fuzz.notations(minimum, maximum, middle, ignore))),
+		("fuzz.other"    , lambda: (amounts()[2], False)                      , lambda middle, ignore: consume(fuzz.other(middle, ignore))),
+		("fuzz.lengths"  , lambda: (False,)                                   , lambda ignore: consume(fuzz.lengths(ignore)))
+	])
+	tmp.append(("locales.all", lambda: (amounts()[2], tuple(locales.LOCALES)), locales.render))
+	tmp.append(("scripts.all.1000", lambda: ([str(i) for i in range(1000)], (*scripts.SCRIPTS, scripts.MIXED)), scripts.render))
+	for stage in encoding.Stage.all():
+		tmp.append((f"encode.{stage.value}.1000", lambda: ([f"\x27{i:,}.00\x27" for i in range(1000)],), lambda entries, stage = stage: consume(encoding.chain(entries, (stage,)))))
+	tmp.append(("boundary.all", lambda: ((*boundary.INTEGERS, *boundary.FLOATS, "decimal(12,2)", "decimal(38,10)"),), render_cold))
+	for precision in ieee754.Precision.all():
+		tmp.append((f"ieee754.{precision.name.lower()}.1000", lambda: ([f"{i}.25" for i in range(1000)],), lambda values, precision = precision: ieee754.encode(values, precision)))
+	for name, representations in [("all", digit.BULK), ("none", ())]:
+		tmp.append((f"sweep.{name}.10000", lambda: (digit.Sweep("1", "10000", "1"),), lambda sweep, representations = representations: consume(sweep.amounts(representations))))
+	for quotes in ["none", "all"]:
+		for digits in MAGNITUDES:
+			tmp.append((f"run.{quotes}.{digits}d", lambda quotes = quotes, digits = digits: (create("1", "9" * digits, "2" * digits, "", quotes),), run_cold))
+	return tmp
+
+def measure(setup: typing.Callable[[], tuple], function: typing.Callable[..., typing.Any], repeats: int) -> tuple[float, float]:
+	"""
+	Returns the best time per call in microseconds, and the peak memory per call in kilobytes.
+	"""
+	loops = 1
+	while True:
+		arguments = [setup() for i in range(loops)]
+		start = time.perf_counter()
+		for args in arguments:
+			function(*args)
+		elapsed = time.perf_counter() - start
+		if elapsed >= MIN_TIME or loops >= 10 ** 6:
+			break
+		loops *= 10
+	best = elapsed / loops
+	for i in range(repeats - 1):
+		arguments = [setup() for i in range(loops)]
+		start = time.perf_counter()
+		for args in arguments:
+			function(*args)
+		best = min(best, (time.perf_counter() - start) / loops)
+	args = setup()
+	tracemalloc.start()
+	function(*args)
+	peak = tracemalloc.get_traced_memory()[1]
+	tracemalloc.stop()
+	return best * 1e6, peak / 1024
+
+def run(filter: str, repeats: int) -> dict[str, float]:
+	"""
+	Run all benchmark cases whose names contain the filter.
+	"""
+	results = {}
+	for name, setup, function in cases():
+		if filter in name:
+			elapsed, peak = measure(setup, function, repeats)
+			results[f"suite.{name}.us"] = elapsed
+			results[f"suite.{name}.peak_kb"] = peak
+	return results
+
+def main():
+	parser = argparse.ArgumentParser(description = "Benchmark 'digit.Amount', each fuzz category, and 'Amounts.run()'.")
+	parser.add_argument("--filter"   , type   = str         , default = "", help = "run only the cases whose names contain the filter")
+	parser.add_argument("--repeats"  , type   = int         , default = 5 , help = "number of timed repeats, the best one is reported")
+	parser.add_argument("--api"      , action = "store_true",               help = "also run the library API benchmark")
+	parser.add_argument("--save"     , action = "store_true",               help = "save the results to the baseline")
+	parser.add_argument("--compare"  , action = "store_true",               help = "exit with an error on regressions against the baseline, or on cases without a baseline")
+	parser.add_argument("--threshold", type   = float       , default = 25, help = "regression threshold in percent")
+	args = parser.parse_args()
+	results = run(args.filter, args.repeats)
+	if args.api:
+		import api
+		results.update(api.measure(20))
+	stored = baseline.load(BASELINE)
+	baseline.report(stored, results)
+	if args.save:
+		baseline.save(BASELINE, results)
+	if args.compare:
+		regressions = baseline.compare(stored, results, args.threshold)
+		for regression in regressions:
+			print(f"REGRESSION: {regression}")
+		missing = baseline.missing(stored, results)
+		for name in missing:
+			print(f"MISSING: {name} has no baseline, save it with '--save'")
+		if regressions or missing:
+			sys.exit(1)
+
+if __name__ == "__main__":
+	main()
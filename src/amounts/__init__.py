@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+"""
+Generate a wordlist to fuzz amounts or any other numerical values.
+
+Usage:
+
+	import amounts
+
+	for entry in amounts.generate(minimum = 1, maximum = 10000, middle = 2200, quotes = "all"):
+		print(entry)
+
+Importing the package is cheap, all modules are imported on the first call.
+"""
+
+__all__ = ["generate", "open_indexed"]
+
+def __quotes(quotes: str | list):
+	"""
+	Convert quotes to comma-separated quote types.
+	"""
+	if isinstance(quotes, str):
+		return quotes
+	return (",").join(getattr(quote, "name", str(quote)).lower() for quote in quotes)
+
+def generate(minimum: int | float | str | None = None, maximum: int | float | str | None = None, middle: int | float | str | None = None, quotes: str | list = "none", ignore: bool = False, dedup: str = "exact", false_positive: float = 0.001, shard: str = "", offset: int = 0, count: int | None = None, hook = None, combine: bool = False, limit: int | None = None, sample: str = "random", seed: int | None = None, max_length: int | str | None = None, locales: str | list = "", ieee754: str | list = "", since: str = "", priority: bool = False, top: int | None = None, only: str | list = "", skip: str | list = "", scripts: str | list = "", encode: str | list = "", variants: bool = False, profile: str | list = ""):
+	"""
+	Generate a wordlist to fuzz amounts or any other numerical values.\n
+	Minimum, maximum, and middle amounts can be integers, decimals, or their string representations.\n
+	Quotes can be comma-separated quote types, e.g., 'single,double' or 'all', or a list of quote types or 'general.Quote' members.\n
+	Shard can be in the 'i/n' format, e.g., '1/4', to generate only one of 'n' disjoint parts of the wordlist.\n
+	Offset and count select a window of the wordlist, e.g., to resume a previous run.\n
+	Hook can be a function, which is called with a dictionary of statistics once the generation is exhausted or closed, i.e., the time spent, the entries produced, and the duplicates removed per category.\n
+	Combine generates the full cross product of scopes, currency symbols, digit groupings, brackets, and quotes instead, and limit selects a 'random' or 'stratified' sample of it in one pass, reproducible with a seed.\n
+	Max length appends long digits, decimals, and scoped values for the powers of two from 1K up to the maximum length, e.g., '8M', as 'Payload' objects that are written in chunks, use 'str()' to materialize them.\n
+	Locales can be comma-separated locale names, e.g., 'en-in,de-ch' or 'all', or a list of locale names, to format the middle amount with each locale's grouping and separators, with each ISO 4217 currency symbol and code.\n
+	IEEE 754 can be comma-separated precisions, e.g., 'half,single' or 'all', or a list of precisions, to add the bit patterns of the amounts and their nearest representable neighbours to the notations.\n
+	Since can be the path of a previous wordlist in any output format, to generate only the entries that are not already present in it, using an on-disk fingerprint index saved next to it.\n
+	Priority ranks the entries by their expected impact, e.g., boundaries, overflows, and notations first, and top selects only the specified number of the highest ranked entries.\n
+	Only and skip can be comma-separated category names, e.g., 'notations,flows', or a list of category names, to generate only or to skip the categories, including third-party categories registered with 'amounts.utils.registry.register()' or installed through the 'amounts.categories' entry points.\n
+	Scripts can be comma-separated digit script names, e.g., 'fullwidth,arabic,mixed' or 'all', or a list of script names, to translate the digits of the middle amount and of its separators, zeros, scopes, and currencies to each script.\n
+	Encode can be comma-separated encoding stages, e.g., 'url,base64', or a list of stages, applied in order to each entry as it streams out, or, with variants, each applied on its own alongside the entry as it is.\n
+	Profile can be comma-separated type profiles, e.g., 'int64,uint8,postgres-numeric(12,2)', or a list of type profiles, to add the edge values and their neighbours of each integer, floating-point, or fixed-point column type.\n
+	Returns a lazy iterator over unique entries, without printing or prompting.\n
+	Raises 'ValueError' if the arguments are invalid.
+	"""
+	from .main import create
+	if middle is None:
+		raise ValueError("Middle amount is required")
+	return create("" if minimum is None else str(minimum), "" if maximum is None else str(maximum), str(middle), "", __quotes(quotes), ignore, dedup, false_positive, shard, offset, count, hook, combine, limit, sample if limit is not None or seed is not None else "", seed, "" if max_length is None else str(max_length), locales if isinstance(locales, str) else (",").join(locales), ieee754 if isinstance(ieee754, str) else (",").join(getattr(precision, "name", str(precision)).lower() for precision in ieee754), since, priority, top, only if isinstance(only, str) else (",").join(only), skip if isinstance(skip, str) else (",").join(skip), scripts if isinstance(scripts, str) else (",").join(scripts), encode if isinstance(encode, str) else (",").join(getattr(stage, "value", str(stage)) for stage in encode), variants, profile if isinstance(profile, str) else (",").join(profile)).run()
+
+def open_indexed(path: str):
+	"""
+	Open a wordlist saved in the indexed output format for random access.\n
+	Returns a reader that supports 'len()', iteration, and indexing, where each entry is read in constant time.\n
+	Raises 'ValueError' if the file is not in the indexed format.
+	"""
+	from .utils import file
+	return file.IndexedReader(path)
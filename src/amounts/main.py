@@ -1,48 +1,435 @@
 #!/usr/bin/env python3
 
-from .utils import array, config, digit, file, general, fuzz, validate
+from .utils import boundary, combine, config, dedup, digit, file, general, fuzz, ieee754, locales, memo, payload, priority, registry, scripts, shard, stats, template
+
+import collections, itertools, os, sys, time, typing
+
+if typing.TYPE_CHECKING:
+	from .utils import delta, encoding
 
 class Amounts:
 
-	def __init__(self, minimum: digit.Amount, maximum: digit.Amount, middle: digit.Amount, quotes: list[general.Quote], ignore: bool):
+	def __init__(self, minimum: digit.Amount, maximum: digit.Amount, middle: digit.Amount | digit.Sweep, quotes: list[general.Quote], ignore: bool, deduplicator: dedup.Dedup | None = None, shards: tuple[int, int] | None = None, offset: int = 0, count: int | None = None, recorder: stats.Stats | None = None, combinatorial: bool = False, limit: int | None = None, sampling: combine.Sample = combine.Sample.RANDOM, seed: int | None = None, max_length: int = 0, locale_names: list[str] | None = None, precisions: list[ieee754.Precision] | None = None, since: "delta.Since | None" = None, ranked: bool = False, top: int | None = None, categories: list[registry.Category] | None = None, script_names: list[str] | None = None, stages: "list[encoding.Stage] | None" = None, variants: bool = False, profiles: list[str] | None = None):
 		self.__minimum = minimum
 		self.__maximum = maximum
 		self.__middle  = middle
 		self.__quotes  = quotes
 		self.__ignore  = ignore
+		self.__dedup   = deduplicator or dedup.Dedup()
+		self.__shards  = shards
+		self.__offset  = offset
+		self.__count   = count
+		self.__stats   = recorder
+		self.__keys    = (memo.key(minimum), memo.key(maximum))
+		self.__combine = combinatorial
+		self.__limit   = limit
+		self.__sample  = sampling
+		self.__seed    = seed
+		self.__length  = max_length
+		self.__locales = tuple(locale_names or ())
+		self.__floats  = tuple(precisions or ())
+		self.__since   = since
+		self.__ranked  = ranked or top is not None
+		self.__top     = top
+		self.__select  = registry.categories() if categories is None else categories
+		self.__fields  = () if combinatorial else registry.representations(self.__select)
+		self.__scripts = tuple(script_names or ())
+		self.__stages  = tuple(stages or ())
+		self.__keep    = variants
+		self.__types   = tuple(profiles or ())
+		self.__encoded = None
+
+	def parameters(self) -> dict[str, typing.Any]:
+		"""
+		Get the normalized parameters that determine the wordlist, e.g., to use them as a cache key.\n
+		Third-party categories are included with the names and versions of their distributions, so upgrading a plugin changes the key.
+		"""
+		sweep = isinstance(self.__middle, digit.Sweep)
+		return {
+			"minimum"       : self.__minimum.string if self.__minimum else None,
+			"maximum"       : self.__maximum.string if self.__maximum else None,
+			"middle"        : None if sweep else self.__middle.string,
+			"sweep"         : str(self.__middle) if sweep else None,
+			"quotes"        : [quote.name.lower() for quote in self.__quotes],
+			"ignore"        : self.__ignore,
+			"dedup"         : self.__dedup.strategy.value,
+			"false_positive": getattr(self.__dedup, "false_positive", None),
+			"shard"         : "/".join(map(str, self.__shards)) if self.__shards else None,
+			"offset"        : self.__offset,
+			"count"         : self.__count,
+			"combine"       : self.__combine,
+			"limit"         : self.__limit,
+			"sample"        : self.__sample.value if self.__limit is not None else None,
+			"seed"          : self.__seed,
+			"max_length"    : self.__length,
+			"locales"       : list(self.__locales),
+			"ieee754"       : [precision.name.lower() for precision in self.__floats],
+			"since"         : self.__since.path if self.__since else None,
+			"priority"      : self.__ranked,
+			"top"           : self.__top,
+			"categories"    : [category.name for category in self.__select],
+			"plugins"       : registry.plugins(self.__select),
+			"scripts"       : list(self.__scripts),
+			"encode"        : [stage.value for stage in self.__stages],
+			"variants"      : self.__keep if self.__stages else None,
+			"profile"       : list(self.__types)
+		}
+
+	def estimate(self) -> tuple[int, int]:
+		"""
+		Get the number of entries and the size in bytes of the text output format in the combinatorial mode, without generating them.\n
+		Deduplication, sampling, sharding, and windows are not taken into account.
+		"""
+		return combine.estimate(self.__middle if isinstance(self.__middle, digit.Sweep) else [self.__middle], self.__quotes)
+
+	def run(self) -> typing.Iterator[str]:
+		"""
+		Generate the wordlist lazily, one unique entry at a time.\n
+		The order is deterministic, so a shard or a window selects the same entries on every run.\n
+		Entries outside the shard are dropped before deduplication, so they are never tracked, and generation stops as soon as the window is exhausted.\n
+		In the combinatorial mode, a sample is selected before sharding, so the same sample is split across shards.\n
+		Entries are encoded before sharding and deduplication, so encoded variants that collide with other entries are dropped.\n
+		Long length payloads are distinct by construction, and are appended after deduplication, so they are never materialized.\n
+		Entries already present in a previous wordlist are dropped before the window, so a window selects the same entries of the delta on every run.\n
+		If entries are ranked, they are emitted from the highest to the lowest score once all of them are generated, and the window selects from the ranked entries.
+		"""
+		entries = self.__generate()
+		if self.__limit is not None:
+			entries = combine.sample(entries, self.estimate()[0], self.__limit, self.__sample, self.__seed)
+		if self.__stages:
+			from .utils import encoding
+			entries = encoding.chain(entries, self.__stages, self.__keep)
+		if self.__shards:
+			entries = shard.select(entries, *self.__shards)
+		entries = self.__stats.deduplicate(self.__dedup, entries) if self.__stats else self.__dedup.filter(entries)
+		if self.__length:
+			entries = itertools.chain(entries, self.__ladder())
+		if self.__since:
+			entries = self.__since.filter(entries)
+		if self.__ranked:
+			entries = self.__rank(entries)
+		if self.__offset or self.__count is not None:
+			entries = shard.window(entries, self.__offset, self.__count)
+		if self.__stats:
+			entries = self.__stats.count(entries)
+		return entries
+
+	def __rank(self, entries: typing.Iterable[str]) -> typing.Iterator[str]:
+		"""
+		Generate the entries from the highest to the lowest score, or only the top entries.
+		"""
+		scorer = priority.Scorer(self.__minimum, self.__maximum)
+		yield from priority.top(entries, scorer, self.__top) if self.__top is not None else priority.rank(entries, scorer)
+
+	def __ladder(self) -> typing.Iterator[payload.Payload]:
+		"""
+		Generate the long length payloads up to the maximum length, in the selected shard only.
+		"""
+		entries = self.__stats.measure("ladder", lambda: payload.ladder(self.__length)) if self.__stats else payload.ladder(self.__length)
+		if self.__shards:
+			entries = shard.select(entries, *self.__shards, payload.crc32)
+		return entries
+
+	def __middles(self) -> typing.Iterable[digit.Amount]:
+		"""
+		Get all middle amounts.\n
+		Only the representations used by the selected categories are computed in bulk for a sweep.
+		"""
+		return self.__middle.amounts(self.__fields) if isinstance(self.__middle, digit.Sweep) else [self.__middle]
 
-	def run(self):
-		wordlist = []
+	def __generate(self):
+		"""
+		Generate all the entries for each middle amount and each quote, including duplicates.\n
+		Middle amounts are taken in chunks, so the IEEE 754 encodings of a whole chunk are computed at once.\n
+		Boundaries of the type profiles are generated once, after all middle amounts.\n
+		Unquoted entries are regenerated for quoting instead of being kept in memory.\n
+		In the combinatorial mode, generate the full cross product for each middle amount that is distinct without its scope instead.
+		"""
+		if self.__combine:
+			for middle in combine.distinct(self.__middle if isinstance(self.__middle, digit.Sweep) else [self.__middle], self.__fields):
+				if self.__stats:
+					yield from self.__stats.measure("combinations", lambda: combine.generate(middle, self.__quotes))
+				else:
+					yield from combine.generate(middle, self.__quotes)
+			return
+		middles = iter(self.__middles())
+		while chunk := list(itertools.islice(middles, ieee754.CHUNK)):
+			self.__encoded = self.__encode(chunk)
+			for middle in chunk:
+				for quote in self.__quotes:
+					yield from self.__reorder(self.__categories(middle, quote), middle)
+					if quote != general.Quote.NONE:
+						for entry in self.__reorder(self.__categories(middle, quote), middle):
+							yield fuzz.enquote(entry, quote.value)
+		if self.__types:
+			yield from self.__boundaries()
+
+	def __boundaries(self):
+		"""
+		Generate the boundaries of the type profiles once per run, after all middle amounts, and then quote them with each quote.\n
+		Boundaries do not depend on any amount, so they are not generated again for each middle amount.
+		"""
+		yield from self.__stats.measure("boundaries", lambda: boundary.render(self.__types)) if self.__stats else boundary.render(self.__types)
 		for quote in self.__quotes:
-			tmp = []
-			tmp.extend(fuzz.separators(self.__middle))
-			tmp.extend(fuzz.zeros(self.__middle))
-			tmp.extend(fuzz.scopes(self.__middle))
-			tmp.extend(fuzz.currencies(self.__middle))
-			tmp.extend(fuzz.brackets(self.__middle, quote, self.__ignore))
-			tmp.extend(fuzz.flows(self.__minimum, self.__maximum, self.__ignore))
-			tmp.extend(fuzz.notations(self.__minimum, self.__maximum, self.__middle, self.__ignore))
-			tmp.extend(fuzz.other(self.__middle, self.__ignore))
-			tmp.extend(fuzz.lengths(self.__ignore))
-			for amount in [self.__minimum, self.__maximum, self.__middle]:
-				if amount and amount.string in tmp:
-					tmp.remove(amount.string)
-					tmp.append(amount.string)
-			wordlist.extend(tmp)
 			if quote != general.Quote.NONE:
-				wordlist.extend([fuzz.enquote(entry, quote.value) for entry in tmp])
-		return array.unique(wordlist)
+				for entry in boundary.render(self.__types):
+					yield fuzz.enquote(entry, quote.value)
+
+	def __encode(self, chunk: list[digit.Amount]) -> dict[tuple[ieee754.Precision, str], list[str]] | None:
+		"""
+		Encode the minimum, maximum, and all middle amounts of a chunk at each IEEE 754 precision at once, if any are selected, instead of encoding them for each middle amount separately.
+		"""
+		if not self.__floats or "notations" not in [category.name for category in self.__select]:
+			return None
+		return ieee754.lookup([amount.string for amount in [self.__minimum, self.__maximum, *chunk] if amount], self.__floats)
+
+	def __categories(self, middle: digit.Amount, quote: general.Quote):
+		"""
+		Generate the entries of all categories for the specified middle amount and quote.\n
+		The entries of each category are memoised on the inputs the category depends on.\n
+		If statistics are recorded, each category is measured separately.
+		"""
+		if self.__stats:
+			for name, key, entries in self.__sources(middle, quote):
+				yield from self.__stats.measure(name, lambda: self.__lookup(key, entries))
+		else:
+			get = memo.CACHE.get
+			for name, key, entries in self.__sources(middle, quote):
+				yield from get(key, entries)[0]
+
+	def __sources(self, middle: digit.Amount, quote: general.Quote) -> list[tuple[str, tuple, typing.Callable[[], typing.Iterable[str]]]]:
+		"""
+		Get the name of each selected category, the key of the inputs it depends on, and a function that generates its entries for the specified middle amount and quote.\n
+		Separators, zeros, scopes, and currencies depend only on the middle amount, and are rendered together from a single template plan, unless statistics are recorded.\n
+		Only brackets depend on the quote, and the hardcoded values of other, flows, and lengths do not depend on the middle amount.\n
+		Locales are rendered after the currencies, only if any are selected.\n
+		Digit scripts are applied to the middle amount and to the entries of the selected categories that depend only on it, after the locales, only if any are selected.\n
+		Third-party categories are called with the inputs they depend on as keyword arguments, and are keyed on the same inputs.
+		"""
+		mid     = memo.key(middle)
+		ignore  = self.__ignore
+		plan    = lambda categories, quote: template.compile_plan(categories, middle.type, middle.scope, quote, ignore)
+		names   = [category.name for category in self.__select]
+		middles = tuple(name for name in template.MIDDLE_CATEGORIES if name in names)
+		groups  = [(name,) for name in middles] if self.__stats else [middles] if middles else []
+		tmp = [(group[0], (group, mid), lambda group = group: template.render(plan(group, general.Quote.NONE), middle)) for group in groups]
+		if self.__locales:
+			tmp.append(("locales", ("locales", mid, self.__locales), lambda: locales.render(middle, self.__locales)))
+		if self.__scripts:
+			base = lambda: [middle.string, *memo.CACHE.get((middles, mid), lambda: template.render(plan(middles, general.Quote.NONE), middle))[0]]
+			tmp.append(("scripts", ("scripts", mid, middles, self.__scripts), lambda: scripts.render(base(), self.__scripts)))
+		builtin = {
+			"brackets" : [("brackets", ("brackets", mid, quote.value, ignore), lambda: template.render(plan(("brackets",), quote), middle))],
+			"flows"    : [("flows", ("flows", *self.__keys, ignore), lambda: fuzz.flows(self.__minimum, self.__maximum, ignore))],
+			"notations": [("notations", ("notations", *self.__keys, mid, ignore, self.__floats), lambda: fuzz.notations(self.__minimum, self.__maximum, middle, ignore, self.__floats, self.__encoded))],
+			"other"    : [("other", ("other", mid), lambda: fuzz.other(middle, True)), ("other", ("hardcoded", ignore), lambda: () if ignore else fuzz.hardcoded())],
+			"lengths"  : [("lengths", ("lengths", ignore), lambda: fuzz.lengths(ignore))]
+		}
+		inputs = {
+			registry.Input.MINIMUM: (self.__minimum, self.__keys[0]),
+			registry.Input.MAXIMUM: (self.__maximum, self.__keys[1]),
+			registry.Input.MIDDLE : (middle, mid),
+			registry.Input.QUOTE  : (quote, quote.value),
+			registry.Input.IGNORE : (ignore, ignore)
+		}
+		for category in self.__select:
+			if category.name in builtin:
+				tmp.extend(builtin[category.name])
+			elif category.name not in template.MIDDLE_CATEGORIES:
+				key = (category, *(inputs[input][1] for input in category.inputs))
+				tmp.append((category.name, key, lambda category = category: category.function(**{input.value: inputs[input][0] for input in category.inputs})))
+		return tmp
+
+	def __lookup(self, key: tuple, entries: typing.Callable[[], typing.Iterable[str]]) -> tuple[str, ...]:
+		"""
+		Get the memoised entries of a category, and record the cache hit or miss if statistics are recorded.
+		"""
+		results, hit = memo.CACHE.get(key, entries)
+		if self.__stats:
+			self.__stats.lookup(hit)
+		return results
+
+	def __reorder(self, entries: typing.Iterable[str], middle: digit.Amount):
+		"""
+		Move the minimum, maximum, and middle amounts to the end.\n
+		The first occurrence of each amount is held back, and the held back amounts are emitted once the entries are exhausted.
+		"""
+		strings = [amount.string for amount in [self.__minimum, self.__maximum, middle] if amount]
+		skip = collections.Counter(strings)
+		found = collections.Counter()
+		for entry in entries:
+			if found[entry] < skip[entry]:
+				found[entry] += 1
+				if self.__stats:
+					self.__stats.hold()
+				continue
+			yield entry
+		held = []
+		removed = collections.Counter()
+		for string in strings:
+			if removed[string] < found[string]:
+				removed[string] += 1
+				held.append(string)
+			elif string in held:
+				held.remove(string)
+				held.append(string)
+		yield from self.__stats.measure("reorder", lambda: held) if self.__stats else held
 
 # ----------------------------------------
 
+def create(minimum: str = "", maximum: str = "", middle: str = "", sweep: str = "", quotes: str = "", ignore: bool = False, dedup_strategy: str = "", false_positive: float = 0.001, shards: str = "", offset: int = 0, count: int | None = None, hook: typing.Callable[[dict[str, typing.Any]], typing.Any] | None = None, combinatorial: bool = False, limit: int | None = None, sampling: str = "", seed: int | None = None, max_length: str = "", locale_names: str = "", precisions: str = "", since: str = "", ranked: bool = False, top: int | None = None, only: str = "", skip: str = "", script_names: str = "", stages: str = "", variants: bool = False, profiles: str = "") -> Amounts:
+	"""
+	Validate the arguments with the same rules as the CLI, and create the amounts.\n
+	If the hook is specified, statistics are recorded, and the hook is called with them once the generation is exhausted or closed.\n
+	Raises 'ValueError' if the arguments are invalid.
+	"""
+	messages = []
+	if sweep:
+		min_amount, max_amount, messages = digit.validate_limits(minimum, maximum)
+		if middle:
+			messages.append("Middle amount and sweep cannot be used together")
+		elif not messages:
+			mid_amount, message = digit.validate_sweep(sweep, min_amount, max_amount)
+			if message:
+				messages.append(message)
+	elif not middle:
+		messages.append("Middle amount or sweep is required")
+	else:
+		min_amount, max_amount, mid_amount, messages = digit.validate_range(minimum, maximum, middle)
+	quote_list, message = general.validate_quotes(quotes)
+	if message:
+		messages.append(message)
+	if dedup_strategy and dedup_strategy not in [strategy.value for strategy in dedup.Strategy.all()]:
+		messages.append("Supported deduplication strategies are 'exact', 'hash', 'bloom', or 'none'")
+	if not 0 < false_positive < 1:
+		messages.append("False positive rate must be greater than zero and lesser than one")
+	shard_pair = None
+	if shards:
+		shard_pair, message = shard.validate_shard(shards)
+		if message:
+			messages.append(message)
+	if offset < 0 or (count is not None and count < 0):
+		messages.append("Offset and count must be non-negative integers")
+	if limit is not None and limit < 0:
+		messages.append("Limit must be a non-negative integer")
+	if sampling and sampling not in [method.value for method in combine.Sample.all()]:
+		messages.append("Supported sampling methods are 'random' or 'stratified'")
+	if (limit is not None or sampling or seed is not None) and not combinatorial:
+		messages.append("Limit, sampling method, and seed can only be used in the combinatorial mode")
+	length = 0
+	if max_length:
+		length, message = payload.validate_length(max_length)
+		if message:
+			messages.append(message)
+	locale_list, message = locales.validate_locales(locale_names)
+	if message:
+		messages.append(message)
+	elif locale_list and combinatorial:
+		messages.append("Locales cannot be used in the combinatorial mode")
+	precision_list, message = ieee754.validate_precisions(precisions)
+	if message:
+		messages.append(message)
+	elif precision_list and combinatorial:
+		messages.append("IEEE 754 precisions cannot be used in the combinatorial mode")
+	if since and not os.path.isfile(since):
+		messages.append("Previous wordlist does not exist or is not a file")
+	if top is not None and top < 0:
+		messages.append("Top must be a non-negative integer")
+	category_list, message = registry.validate_categories(only, skip)
+	if message:
+		messages.append(message)
+	elif (only or skip) and combinatorial:
+		messages.append("Categories cannot be selected in the combinatorial mode")
+	script_list, message = scripts.validate_scripts(script_names)
+	if message:
+		messages.append(message)
+	elif script_list and combinatorial:
+		messages.append("Digit scripts cannot be used in the combinatorial mode")
+	stage_list = []
+	if stages:
+		from .utils import encoding
+		stage_list, message = encoding.validate_stages(stages)
+		if message:
+			messages.append(message)
+		elif encoding.Stage.BASE64 in stage_list and length:
+			messages.append("Base64 encoding cannot be used with the maximum length")
+	if variants and not stage_list:
+		messages.append("Encoded variants require at least one encoding stage")
+	profile_list, message = boundary.validate_profiles(profiles)
+	if message:
+		messages.append(message)
+	elif profile_list and combinatorial:
+		messages.append("Type profiles cannot be used in the combinatorial mode")
+	if messages:
+		raise ValueError(("\n").join(messages))
+	previous = None
+	if since:
+		from .utils import delta
+		previous = delta.Since(since)
+	return Amounts(min_amount, max_amount, mid_amount, quote_list, ignore, dedup.get(dedup.Strategy(dedup_strategy or dedup.Strategy.EXACT.value), false_positive), shard_pair, offset, count, stats.Stats(hook) if hook else None, combinatorial, limit, combine.Sample(sampling or combine.Sample.RANDOM.value), seed, length, locale_list, precision_list, previous, ranked, top, category_list, script_list, stage_list, variants, profile_list)
+
+def run_batch(rows: list, out: str, format: file.Format, strategy: dedup.Strategy, false_positive: float):
+	"""
+	Generate wordlists for all manifest rows in parallel.\n
+	If the output is a directory, save the results of each row to a separate file, otherwise, save the results to a single file tagged with row names.
+	"""
+	from .utils import batch
+	start = time.perf_counter()
+	summary = batch.Summary(strategy)
+	if os.path.isdir(out):
+		for name, results in summary.collect(batch.run(rows, strategy, false_positive)):
+			path = os.path.join(out, f"{name}{format.extension}")
+			if not file.write_array(results, path, format):
+				print(f"Cannot save the results to '{path}'")
+		print(f"Results have been saved to '{out}'")
+	else:
+		file.overwrite_array((entry for name, results in summary.collect(batch.run(rows, strategy, false_positive)) for entry in batch.tag(name, results)), out, format)
+	log = sys.stderr if out == file.STDOUT else sys.stdout
+	print(summary.summary(), file = log)
+	print(batch.throughput(len(rows), start), file = log)
+
 def main():
+	from .utils import validate
 	(success, args) = validate.Validate().validate_args()
 	if success:
-		config.banner()
-		amounts = Amounts(args.minimum, args.maximum, args.middle, args.quotes, args.ignore)
-		results = amounts.run()
-		if results:
-			file.overwrite_array(results, args.out)
+		if args.out != file.STDOUT:
+			config.banner()
+		if args.cache_stats:
+			from .utils import cache
+			print(cache.DiskCache(args.cache_dir, args.cache_limit).summary())
+		elif args.serve:
+			from .utils import serve
+			serve.serve(args.serve, args.cache_size)
+		elif args.batch:
+			run_batch(args.batch, args.out, args.format, args.dedup, args.false_positive)
+		else:
+			deduplicator = dedup.get(args.dedup, args.false_positive)
+			recorder = stats.Stats() if args.stats else None
+			since = None
+			if args.since:
+				from .utils import delta
+				since = delta.Since(args.since)
+			amounts = Amounts(args.minimum, args.maximum, args.sweep or args.middle, args.quotes, args.ignore, deduplicator, args.shard, args.offset, args.count, recorder, args.combine, args.limit, args.sample, args.seed, args.max_length, args.locales, args.ieee754, since, args.priority, args.top, args.categories, args.scripts, args.encode, args.encode_variants, args.profile)
+			if args.estimate:
+				count, size = amounts.estimate()
+				print(f"Estimated entries: {count}")
+				print(f"Estimated size: {size} bytes")
+				return
+			log = sys.stderr if args.out == file.STDOUT else sys.stdout
+			if args.cache_dir and (args.limit is None or args.seed is not None) and not args.since:
+				from .utils import cache
+				disk = cache.DiskCache(args.cache_dir, args.cache_limit)
+				file.overwrite_stream(lambda: disk.open(amounts.parameters(), args.format, lambda path: file.write_array(amounts.run(), path, args.format, recorder)), args.out)
+				if disk.hit:
+					print("Results have been read from the cache", file = log)
+					return
+			else:
+				file.overwrite_array(amounts.run(), args.out, args.format, recorder)
+			print(deduplicator.summary(), file = log)
+			if since:
+				print(since.summary(), file = log)
+			if recorder:
+				print(recorder.summary(args.stats), file = log)
 
 if __name__ == "__main__":
 	main()
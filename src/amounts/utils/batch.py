@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+
+from . import boundary, dedup, digit, general, wordlist
+
+import concurrent.futures, csv, dataclasses, functools, json, os, re, time, typing
+
+@dataclasses.dataclass
+class Row:
+	"""
+	Class for storing manifest row details.
+	"""
+	name    : str
+	minimum : digit.Amount | None
+	maximum : digit.Amount | None
+	middle  : digit.Amount
+	quotes  : list[general.Quote]
+	ignore  : bool
+	profiles: list[str] = dataclasses.field(default_factory = list)
+
+# ----------------------------------------
+
+def __read_records(manifest: str) -> typing.Iterator[dict[str, typing.Any]]:
+	"""
+	Read records from a CSV or JSONL manifest.\n
+	JSONL is detected by the file extension or by the first non-whitespace character.
+	"""
+	with open(manifest, "r", encoding = "UTF-8", newline = "") as stream:
+		head = stream.read(4096).lstrip()
+		stream.seek(0)
+		if manifest.lower().endswith((".jsonl", ".ndjson", ".json")) or head.startswith("{"):
+			for line in stream:
+				line = line.strip()
+				if line:
+					yield json.loads(line)
+		else:
+			for record in csv.DictReader(stream):
+				yield {key.strip().lower(): value for key, value in record.items() if key}
+
+def __to_string(value: typing.Any):
+	"""
+	Convert a manifest value to a stripped string.
+	"""
+	return "" if value is None else str(value).strip()
+
+def __to_bool(value: typing.Any, default: bool):
+	"""
+	Convert a manifest value to a boolean.
+	"""
+	if isinstance(value, bool):
+		return value
+	value = __to_string(value).lower()
+	return value in ["true", "yes", "y", "1"] if value else default
+
+def read_manifest(manifest: str, quotes: list[general.Quote], ignore: bool, profiles: list[str] | None = None) -> tuple[list[Row], list[str]]:
+	"""
+	Read and validate rows from a CSV or JSONL manifest.\n
+	The specified quotes, ignore, and type profile values are used for rows that leave them empty.\n
+	Returns a list of error messages on failure.
+	"""
+	rows = []
+	messages = []
+	names = set()
+	try:
+		for number, record in enumerate(__read_records(manifest), 1):
+			name = __to_string(record.get("name")) or str(number)
+			minimum, maximum, middle, errors = digit.validate_range(__to_string(record.get("minimum")), __to_string(record.get("maximum")), __to_string(record.get("middle")))
+			row_quotes = quotes
+			if __to_string(record.get("quotes")):
+				row_quotes, error = general.validate_quotes(__to_string(record.get("quotes")))
+				if error:
+					errors.append(error)
+			row_profiles = profiles or []
+			if __to_string(record.get("profile")):
+				row_profiles, error = boundary.validate_profiles(__to_string(record.get("profile")))
+				if error:
+					errors.append(error)
+			if not re.fullmatch(r"[\w\-\.]+", name):
+				errors.append("Name must contain only letters, digits, underscores, hyphens, and dots")
+			elif name in names:
+				errors.append(f"Name '{name}' is not unique")
+			names.add(name)
+			if errors:
+				messages.extend(f"Manifest row {number}: {error}" for error in errors)
+			else:
+				rows.append(Row(name, minimum, maximum, middle, row_quotes, __to_bool(record.get("ignore"), ignore), row_profiles))
+	except (OSError, UnicodeDecodeError, json.JSONDecodeError, csv.Error) as ex:
+		messages.append(f"Cannot read the manifest: {ex}")
+	if not rows and not messages:
+		messages.append("Manifest does not contain any rows")
+	return rows, messages
+
+# ----------------------------------------
+
+def __generate(strategy: dedup.Strategy, false_positive: float, row: Row) -> tuple[str, wordlist.Wordlist, int, int]:
+	"""
+	Generate a wordlist for a single manifest row.\n
+	The results are collected in a compact wordlist, which is also returned to the main process as a single buffer.\n
+	Exact deduplication is done directly over the wordlist, instead of keeping a separate set of strings.\n
+	Returns the row name, the results, the number of duplicates dropped, and the number of bytes used for deduplication.
+	"""
+	from ..main import Amounts
+	exact = strategy == dedup.Strategy.EXACT
+	deduplicator = dedup.NoDedup() if exact else dedup.get(strategy, false_positive)
+	results = wordlist.Wordlist(exact)
+	results.extend(Amounts(row.minimum, row.maximum, row.middle, row.quotes, row.ignore, deduplicator, profiles = row.profiles).run())
+	if exact:
+		return row.name, results, results.dropped, results.memory()
+	return row.name, results, deduplicator.dropped, deduplicator.memory()
+
+def run(rows: list[Row], strategy: dedup.Strategy = dedup.Strategy.EXACT, false_positive: float = 0.001, workers: int | None = None) -> typing.Iterator[tuple[str, wordlist.Wordlist, int, int]]:
+	"""
+	Generate wordlists for all manifest rows across a process pool sized to the CPU cores.\n
+	Results are yielded in the manifest order.
+	"""
+	workers = workers or os.cpu_count() or 1
+	chunksize = max(1, len(rows) // (workers * 4))
+	with concurrent.futures.ProcessPoolExecutor(max_workers = workers) as executor:
+		yield from executor.map(functools.partial(__generate, strategy, false_positive), rows, chunksize = chunksize)
+
+class Summary:
+
+	def __init__(self, strategy: dedup.Strategy):
+		"""
+		Class for summarizing deduplication across manifest rows.
+		"""
+		self.__strategy = strategy
+		self.__dropped  = 0
+		self.__memory   = 0
+
+	def collect(self, results: typing.Iterable[tuple[str, wordlist.Wordlist, int, int]]) -> typing.Iterator[tuple[str, wordlist.Wordlist]]:
+		"""
+		Collect deduplication details while streaming the results of all manifest rows.
+		"""
+		for name, entries, dropped, memory in results:
+			self.__dropped += dropped
+			self.__memory = max(self.__memory, memory)
+			yield name, entries
+
+	def summary(self):
+		"""
+		Get a summary of the duplicates dropped and the peak memory used per row.
+		"""
+		return f"Deduplication ({self.__strategy.value}): {self.__dropped} duplicates dropped, at most {self.__memory} bytes used per row"
+
+def tag(name: str, results: wordlist.Wordlist):
+	"""
+	Prefix each entry in a list with a tab-separated name.
+	"""
+	return [f"{name}\t{entry}" for entry in results]
+
+def throughput(rows: int, start: float):
+	"""
+	Get a throughput summary for the specified number of rows processed since the start time.
+	"""
+	elapsed = max(time.perf_counter() - start, 1e-9)
+	return f"Processed {rows} rows in {elapsed:.2f} seconds ({rows / elapsed:.2f} rows per second)"
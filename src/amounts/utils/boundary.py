@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+
+from . import array, digit, ieee754
+
+import dataclasses, functools, math, re
+
+WIDTHS = (8, 16, 32, 64, 128)
+
+INTEGERS: dict[str, tuple[int, int]] = {
+	**{f"int{bits}": (-(1 << (bits - 1)), (1 << (bits - 1)) - 1) for bits in WIDTHS},
+	**{f"uint{bits}": (0, (1 << bits) - 1) for bits in WIDTHS}
+}
+
+@dataclasses.dataclass(frozen = True)
+class FloatDetails:
+	"""
+	Class for storing binary floating-point details, i.e., the precision in bits including the implicit bit, the minimum and maximum exponents of normal values, and the matching IEEE 754 precision.
+	"""
+	precision: int
+	minimum  : int
+	maximum  : int
+	width    : ieee754.Precision
+
+FLOATS: dict[str, FloatDetails] = {
+	"float32": FloatDetails(24, -126, 127, ieee754.Precision.SINGLE),
+	"float64": FloatDetails(53, -1022, 1023, ieee754.Precision.DOUBLE)
+}
+
+DECIMALS = ("decimal", "numeric")
+
+MAX_PRECISION = 1000
+
+@dataclasses.dataclass(frozen = True)
+class DatabaseDetails:
+	"""
+	Class for storing database details, i.e., the aliases of its numeric column types, the names of its fixed-point column types, and the maximum precision and scale of them.
+	"""
+	aliases  : dict[str, str]
+	decimals : tuple[str, ...]
+	precision: int
+	scale    : int
+
+DATABASES: dict[str, DatabaseDetails] = {
+	"postgres": DatabaseDetails({"smallint": "int16", "int2": "int16", "integer": "int32", "int": "int32", "int4": "int32", "bigint": "int64", "int8": "int64", "real": "float32", "float4": "float32", "double": "float64", "float8": "float64"}, ("numeric", "decimal"), 1000, 1000),
+	"mysql"   : DatabaseDetails({"tinyint": "int8", "smallint": "int16", "int": "int32", "integer": "int32", "bigint": "int64", "float": "float32", "double": "float64"}, ("decimal", "numeric"), 65, 30),
+	"mssql"   : DatabaseDetails({"tinyint": "uint8", "smallint": "int16", "int": "int32", "bigint": "int64", "real": "float32", "float": "float64"}, ("decimal", "numeric"), 38, 38),
+	"oracle"  : DatabaseDetails({"binary_float": "float32", "binary_double": "float64"}, ("number",), 38, 38)
+}
+
+PROFILE = re.compile(r"(?:(?P<database>[a-z]+)-)?(?P<type>[a-z_]+\d*)(?:\((?P<precision>\d+)(?:,(?P<scale>\d+))?\))?")
+
+# ----------------------------------------
+
+def __scaled(value: int, scale: int) -> str:
+	"""
+	Format an integer number of units of '10 ** -scale' as a decimal string, with plain integer arithmetic.
+	"""
+	if not scale:
+		return str(value)
+	sign = digit.Scope.MINUS.value if value < 0 else ""
+	base, decimal = divmod(abs(value), 10 ** scale)
+	return f"{sign}{base}.{decimal:0{scale}d}"
+
+def __integers(minimum: int, maximum: int) -> list[str]:
+	"""
+	Test the minimum and maximum values of an integer type, and their neighbours, i.e., the values one outside and one inside the range.
+	"""
+	return [str(value) for value in [minimum - 1, minimum, minimum + 1, maximum - 1, maximum, maximum + 1]]
+
+def __floats(details: FloatDetails) -> list[str]:
+	"""
+	Test the extremes of a binary floating-point type, i.e., the largest finite value, exactly and as the shortest decimal that round-trips, the largest integer that rounds to it, and the smallest integer that rounds to infinity, with both scopes.\n
+	Also test the smallest normal value, the largest and smallest subnormal values, the neighbours of one, i.e., one plus and minus the machine epsilon, and the first integer that cannot be represented exactly.\n
+	Extremes are exact integers computed with plain integer arithmetic, and only the small values are converted to floats, which are represented as the shortest decimals that round-trip at the width of the type.
+	"""
+	shortest = lambda value: ieee754.shortest(value, details.width)
+	precision = details.precision
+	largest = ((1 << precision) - 1) << (details.maximum - precision + 1)
+	overflow = ((1 << (precision + 1)) - 1) << (details.maximum - precision)
+	tmp = []
+	for scope in [digit.Scope.NONE, digit.Scope.MINUS]:
+		scope = scope.value
+		tmp.extend(scope + value for value in [str(largest), shortest(float(largest)), str(overflow - 1), str(overflow)])
+	subnormal = details.minimum - precision + 1
+	tmp.extend([
+		shortest(math.ldexp(1, details.minimum)),
+		shortest(math.ldexp((1 << (precision - 1)) - 1, subnormal)),
+		shortest(math.ldexp(1, subnormal)),
+		digit.Scope.MINUS.value + shortest(math.ldexp(1, subnormal)),
+		shortest(1 + math.ldexp(1, 1 - precision)),
+		shortest(1 - math.ldexp(1, -precision)),
+		str(1 << precision),
+		str((1 << precision) + 1)
+	])
+	return tmp
+
+def __decimals(precision: int, scale: int) -> list[str]:
+	"""
+	Test the extremes of a fixed-point column type with the specified precision and scale, i.e., the largest and smallest values, the values one unit in the last place inside and outside the range, and the smallest nonzero values.\n
+	Also test the values with one more decimal place that round up out of the range, or to the smallest nonzero value, and the ones that round down.\n
+	All values are scaled integers formatted with plain integer arithmetic.
+	"""
+	largest = 10 ** precision - 1
+	tmp = []
+	for sign in [1, -1]:
+		tmp.extend([
+			__scaled(sign * (largest - 1), scale),
+			__scaled(sign * largest, scale),
+			__scaled(sign * (largest + 1), scale),
+			__scaled(sign * (largest * 10 + 4), scale + 1),
+			__scaled(sign * (largest * 10 + 5), scale + 1),
+			__scaled(sign, scale),
+			__scaled(sign * 4, scale + 1),
+			__scaled(sign * 5, scale + 1)
+		])
+	return tmp
+
+@functools.lru_cache(maxsize = None)
+def boundaries(type: str) -> tuple[str, ...]:
+	"""
+	Get the boundary values of a resolved type, e.g., 'int64', 'float32', or 'decimal(12,2)'.\n
+	Boundaries are computed once per type, so many profiles across many rows cost a dictionary lookup each.
+	"""
+	if type in INTEGERS:
+		return tuple(__integers(*INTEGERS[type]))
+	if type in FLOATS:
+		return tuple(__floats(FLOATS[type]))
+	match = PROFILE.fullmatch(type)
+	return tuple(__decimals(int(match["precision"]), int(match["scale"] or 0)))
+
+def render(types: tuple[str, ...]) -> list[str]:
+	"""
+	Get the boundary values of all the specified resolved types.
+	"""
+	tmp = []
+	for type in types:
+		tmp.extend(boundaries(type))
+	return tmp
+
+# ----------------------------------------
+
+def __resolve(profile: str) -> tuple[str, str]:
+	"""
+	Resolve a type profile, e.g., 'int8', 'uint64', 'float32', 'decimal(12,2)', or 'postgres-numeric(12,2)', to an integer type, a floating-point type, or a fixed-point type with its precision and scale.\n
+	Returns an empty string and an error message on failure.
+	"""
+	match = PROFILE.fullmatch(profile)
+	if not match:
+		return "", f"Type profile '{profile}' is invalid"
+	database, type = match["database"], match["type"]
+	details = DatabaseDetails({}, DECIMALS, MAX_PRECISION, MAX_PRECISION)
+	if database:
+		if database not in DATABASES:
+			return "", "Supported databases are 'postgres', 'mysql', 'mssql', or 'oracle'"
+		details = DATABASES[database]
+		type = details.aliases.get(type, type)
+	if type in details.decimals:
+		precision, scale = int(match["precision"] or 0), int(match["scale"] or 0)
+		if not 0 < precision <= details.precision or scale > min(precision, details.scale):
+			return "", f"Type profile '{profile}' must have a precision between 1 and {details.precision}, and a scale between 0 and the precision, and at most {details.scale}"
+		return f"decimal({precision},{scale})", ""
+	if match["precision"] is None and (type in INTEGERS or type in FLOATS) and (not database or type in details.aliases.values()):
+		return type, ""
+	return "", f"Type profile '{profile}' is not supported, e.g., {', '.join(INTEGERS)}, {', '.join(FLOATS)}, or 'decimal(p,s)', optionally prefixed by a database, e.g., 'postgres-numeric(12,2)'"
+
+def validate_profiles(value: str) -> tuple[list[str], str]:
+	"""
+	Validate comma-separated type profiles, where commas inside parentheses separate a precision and a scale.\n
+	Returns a list of resolved types, or an empty list and an error message on failure.
+	"""
+	tmp = []
+	message = ""
+	if value:
+		profiles = array.remove_empty_strings(re.findall(r"[^,(]*(?:\([^)]*\))?", value.lower().replace(" ", "")))
+		if not profiles:
+			message = "No type profiles were specified"
+		else:
+			for profile in profiles:
+				type, message = __resolve(profile)
+				if message:
+					tmp = []
+					break
+				tmp.append(type)
+			tmp = array.unique(tmp)
+	return tmp, message
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+from . import config, file
+
+import hashlib, json, os, tempfile, time, typing
+
+LIMIT = 1024 ** 3
+
+LOOKUPS = "lookups"
+
+TEMPORARY = ".tmp-"
+
+TEMPORARY_AGE = 3600
+
+HIT = b"h"
+
+MISS = b"m"
+
+class DiskCache:
+
+	def __init__(self, directory: str, limit: int = LIMIT):
+		"""
+		Class for caching generated wordlists on disk, keyed by a hash of the normalized parameters, the output format, and the application version.\n
+		Wordlists are written to a temporary file and atomically renamed, so concurrent runs never read a partial wordlist.\n
+		The least recently used wordlists are evicted once the total size exceeds the limit.\n
+		The directory is created only on the first write, so reading the statistics never creates it.
+		"""
+		self.directory = directory
+		self.limit     = limit
+		self.hit       = None
+
+	def key(self, parameters: dict[str, typing.Any], format: file.Format) -> str:
+		"""
+		Get the cache key for the specified parameters and output format.
+		"""
+		data = json.dumps({"parameters": parameters, "format": format.value, "version": config.APP_VERSION}, sort_keys = True)
+		return hashlib.sha256(data.encode(file.ENCODING)).hexdigest()
+
+	def __path(self, key: str, format: file.Format):
+		"""
+		Get the path of a cached wordlist.
+		"""
+		return os.path.join(self.directory, key + format.extension)
+
+	def __record(self, hit: bool):
+		"""
+		Record a cache hit or miss by appending a single byte to the lookups file, which is safe across concurrent runs.
+		"""
+		self.hit = hit
+		try:
+			descriptor = os.open(os.path.join(self.directory, LOOKUPS), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+			try:
+				os.write(descriptor, HIT if hit else MISS)
+			finally:
+				os.close(descriptor)
+		except OSError:
+			pass
+
+	def open(self, parameters: dict[str, typing.Any], format: file.Format, write: typing.Callable[[str], bool]) -> typing.BinaryIO | None:
+		"""
+		Open a cached wordlist for reading, or write it with the specified function to a temporary file first, and cache it.\n
+		The wordlist is opened before it can be evicted, so it can be read even if a concurrent run evicts it.\n
+		Returns 'None' on failure.
+		"""
+		key = self.key(parameters, format)
+		path = self.__path(key, format)
+		try:
+			stream = open(path, "rb")
+			os.utime(path)
+			self.__record(True)
+			return stream
+		except FileNotFoundError:
+			os.makedirs(self.directory, exist_ok = True)
+			self.__record(False)
+		descriptor, temporary = tempfile.mkstemp(prefix = TEMPORARY, suffix = format.extension, dir = self.directory)
+		os.close(descriptor)
+		if not write(temporary):
+			os.remove(temporary)
+			return None
+		stream = open(temporary, "rb")
+		os.replace(temporary, path)
+		self.evict(path)
+		return stream
+
+	def __entries(self) -> list[tuple[float, int, str]]:
+		"""
+		Get the modification time, the size, and the path of each cached wordlist, and remove temporary files left behind by interrupted runs.
+		"""
+		tmp = []
+		now = time.time()
+		if not os.path.isdir(self.directory):
+			return tmp
+		for entry in os.scandir(self.directory):
+			try:
+				if not entry.is_file() or entry.name == LOOKUPS:
+					continue
+				stat = entry.stat()
+				if entry.name.startswith(TEMPORARY):
+					if now - stat.st_mtime > TEMPORARY_AGE:
+						os.remove(entry.path)
+					continue
+				tmp.append((stat.st_mtime, stat.st_size, entry.path))
+			except OSError:
+				pass
+		return tmp
+
+	def evict(self, keep: str = ""):
+		"""
+		Remove the least recently used wordlists until the total size is within the limit, except the specified one.
+		"""
+		entries = sorted(self.__entries())
+		total = sum(size for mtime, size, path in entries)
+		for mtime, size, path in entries:
+			if total <= self.limit:
+				break
+			if path == keep:
+				continue
+			try:
+				os.remove(path)
+				total -= size
+			except OSError:
+				pass
+
+	def stats(self) -> dict[str, typing.Any]:
+		"""
+		Get the number of cached wordlists, their total size, and the hit rate across all runs.
+		"""
+		entries = self.__entries()
+		lookups = b""
+		try:
+			with open(os.path.join(self.directory, LOOKUPS), "rb") as stream:
+				lookups = stream.read()
+		except FileNotFoundError:
+			pass
+		hits = lookups.count(HIT)
+		misses = lookups.count(MISS)
+		return {
+			"directory": self.directory,
+			"entries"  : len(entries),
+			"bytes"    : sum(size for mtime, size, path in entries),
+			"limit"    : self.limit,
+			"hits"     : hits,
+			"misses"   : misses,
+			"hit_rate" : hits / (hits + misses) if hits + misses else 0
+		}
+
+	def summary(self) -> str:
+		"""
+		Get a summary of the cache statistics.
+		"""
+		stats = self.stats()
+		return ("\n").join([
+			f"Cache directory: {stats['directory']}",
+			f"Cached wordlists: {stats['entries']}",
+			f"Size: {stats['bytes']} out of {stats['limit']} bytes",
+			f"Lookups: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate'] * 100:.1f}% hit rate)"
+		])
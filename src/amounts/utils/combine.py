@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+
+from . import digit, general
+
+import collections, enum, itertools, typing
+
+ENCODING = "UTF-8"
+
+class Sample(enum.Enum):
+	"""
+	Enum containing sampling methods.
+	"""
+	RANDOM     = "random"
+	STRATIFIED = "stratified"
+
+	@classmethod
+	def all(cls):
+		"""
+		Get all sampling methods.
+		"""
+		return [cls.RANDOM, cls.STRATIFIED]
+
+SCOPES = [digit.Scope.MINUS, digit.Scope.PLUS, digit.Scope.NONE]
+
+CURRENCIES = [general.Currency.USD, general.Currency.EUR, general.Currency.GBP]
+
+SEPARATORS = [general.Separator.SPACE, general.Separator.COMMA, general.Separator.DOT]
+
+BRACKETS = [general.Bracket.PARENTHESIS, general.Bracket.SQUARE, general.Bracket.CURLY, general.Bracket.ANGLE]
+
+# ----------------------------------------
+
+def __prefixes() -> list[str]:
+	"""
+	Get all combinations of a scope and an optional currency symbol before or after it.\n
+	Without a scope, a currency symbol before and after it is the same, so it is included once.
+	"""
+	tmp = []
+	for scope in SCOPES:
+		scope = scope.value
+		tmp.append(scope)
+		for currency in CURRENCIES:
+			currency = currency.value
+			tmp.append(currency + scope)
+			if scope:
+				tmp.append(scope + currency)
+	return tmp
+
+PREFIXES = __prefixes()
+
+def __group(amount: digit.Amount, separator: str):
+	"""
+	Group the integer digits of the amount by three using the specified separator, without its scope.
+	"""
+	base, point, decimal = amount.string_no_scope.partition(general.Separator.DOT.value)
+	head = len(base) % 3 or 3
+	return separator.join([base[:head]] + [base[i:i+3] for i in range(head, len(base), 3)]) + point + decimal
+
+def __groupings(amount: digit.Amount) -> list[str]:
+	"""
+	Get the amount without its scope, ungrouped and grouped by each separator.\n
+	Amounts with up to three integer digits cannot be grouped, so they are included once.
+	"""
+	tmp = [amount.string_no_scope]
+	if len(amount.string_no_scope.partition(general.Separator.DOT.value)[0]) > 3:
+		tmp.extend(__group(amount, separator.value) for separator in SEPARATORS)
+	return tmp
+
+def __enclosures(quotes: list[general.Quote]) -> list[tuple[str, str]]:
+	"""
+	Get all combinations of an optional bracket and a quote, as the left and the right side of an entry.
+	"""
+	brackets = [("", "")] + [(bracket.value.left, bracket.value.right) for bracket in BRACKETS]
+	return [(left + quote.value, quote.value + right) for (left, right), quote in itertools.product(brackets, quotes)]
+
+def generate(amount: digit.Amount, quotes: list[general.Quote]) -> typing.Iterator[str]:
+	"""
+	Generate the full cross product of scopes, currency symbols, digit groupings, brackets, and quotes for the amount.\n
+	Entries are distinct by construction, and the product is iterated lazily.\n
+	Every scope is added to the amount without its scope, so middle amounts must be distinct without their scopes, see 'distinct()'.
+	"""
+	enclosures = __enclosures(quotes)
+	for prefix, grouping in itertools.product(PREFIXES, __groupings(amount)):
+		value = prefix + grouping
+		for left, right in enclosures:
+			yield left + value + right
+
+def __mirrored(sweep: digit.Sweep, amount: digit.Amount) -> bool:
+	"""
+	Check if the absolute value of a negative amount of a sweep is also in the sweep, with the same digits.
+	"""
+	index, remainder = divmod(-amount.numeric - sweep.start, sweep.step)
+	if remainder or not 0 <= index < sweep.count():
+		return False
+	value = str(sweep.start + index * sweep.step)
+	return digit.Amount(value, digit.Category.MIDDLE, digit.Type.INTEGER if digit.is_integer(value) else digit.Type.DECIMAL).string_no_scope == amount.string_no_scope
+
+def distinct(middles: digit.Sweep | list[digit.Amount], representations: typing.Iterable[str] = ()) -> typing.Iterator[digit.Amount]:
+	"""
+	Get the middle amounts that are distinct without their scopes, as the cross product adds every scope to each of them.\n
+	A negative value of a sweep is skipped if its absolute value is also in the sweep, which is checked with arithmetic instead of tracking the values seen.
+	"""
+	if not isinstance(middles, digit.Sweep):
+		seen = set()
+		for middle in middles:
+			if middle.string_no_scope not in seen:
+				seen.add(middle.string_no_scope)
+				yield middle
+		return
+	for middle in middles.amounts(representations):
+		if middle.numeric >= 0 or not __mirrored(middles, middle):
+			yield middle
+
+def __size(length: int, digits: int, quotes: list[general.Quote]) -> tuple[int, int]:
+	"""
+	Get the number of entries and their total size in bytes for an amount of the specified length without its scope, and the specified number of integer digits.\n
+	All separators are one byte long, and a grouping adds a separator for every three integer digits.
+	"""
+	enclosures = __enclosures(quotes)
+	groupings = [length]
+	if digits > 3:
+		groupings.extend([length + (digits - 1) // 3] * len(SEPARATORS))
+	count = len(PREFIXES) * len(groupings) * len(enclosures)
+	tmp = sum(len(prefix.encode(ENCODING)) for prefix in PREFIXES) * len(groupings) * len(enclosures)
+	tmp += sum(groupings) * len(PREFIXES) * len(enclosures)
+	tmp += sum(len((left + right).encode(ENCODING)) for left, right in enclosures) * len(PREFIXES) * len(groupings)
+	return count, tmp
+
+def size(amount: digit.Amount, quotes: list[general.Quote]) -> tuple[int, int]:
+	"""
+	Get the number of entries and their total size in bytes for the amount, without generating them.
+	"""
+	return __size(len(amount.string_no_scope), len(amount.string_no_scope.partition(general.Separator.DOT.value)[0]), quotes)
+
+def __terms(first: int, step: int, total: int, low: int, high: int) -> int:
+	"""
+	Count the terms of an ascending arithmetic sequence that are in the inclusive interval.
+	"""
+	start = max(0, -((first - low) // step))
+	stop = min(total - 1, (high - first) // step)
+	return max(0, stop - start + 1)
+
+def __lengths(sweep: digit.Sweep) -> dict[int, int]:
+	"""
+	Count the distinct absolute values of an integer sweep by their number of digits, with plain integer arithmetic per number of digits instead of per value.\n
+	The non-negative values, and the absolute values of the negative values, are ascending sequences with the same step, so the values in both are counted once.
+	"""
+	total = sweep.count()
+	step = abs(int(sweep.step))
+	first = min(int(sweep.start), int(sweep.start) + (total - 1) * int(sweep.step))
+	last = first + (total - 1) * step
+	positive = first if first >= 0 else first + -(first // step) * step
+	positives = max(0, (last - positive) // step + 1)
+	largest = min(last, positive - step)
+	negative = -largest
+	negatives = (largest - first) // step + 1 if first < 0 else 0
+	both = 0
+	if positives and negatives and not (positive - negative) % step:
+		both = max(0, (min(positive + (positives - 1) * step, negative + (negatives - 1) * step) - max(positive, negative)) // step + 1)
+	common = max(positive, negative)
+	tmp = {}
+	for length in range(1, len(str(max(abs(first), abs(last)))) + 1):
+		low, high = 10 ** (length - 1) if length > 1 else 0, 10 ** length - 1
+		tmp[length] = __terms(positive, step, positives, low, high) + __terms(negative, step, negatives, low, high) - __terms(common, step, both, low, high)
+	return tmp
+
+def estimate(middles: typing.Iterable[digit.Amount], quotes: list[general.Quote]) -> tuple[int, int]:
+	"""
+	Get the number of entries and the size in bytes of the text output format for all middle amounts, without generating them.\n
+	Middle amounts are counted by their length and the number of their integer digits, which is all the size depends on, and only the ones that are distinct without their scopes are counted, the same as generated.\n
+	The lengths of an integer sweep are computed directly from its range, without creating an amount for each value.
+	"""
+	if isinstance(middles, digit.Sweep) and middles.type == digit.Type.INTEGER:
+		lengths = {(length, length): count for length, count in __lengths(middles).items() if count}
+	else:
+		lengths = collections.Counter((len(middle.string_no_scope), len(middle.string_no_scope.partition(general.Separator.DOT.value)[0])) for middle in distinct(middles))
+	count = 0
+	tmp = 0
+	for (length, digits), amounts in lengths.items():
+		entries, total = __size(length, digits, quotes)
+		count += entries * amounts
+		tmp += total * amounts
+	return count, tmp + max(0, count - 1)
+
+# ----------------------------------------
+
+def sample(iterable: typing.Iterable[str], total: int, limit: int, method: Sample = Sample.RANDOM, seed: int | None = None) -> typing.Iterator[str]:
+	"""
+	Select the specified number of entries out of the specified total number of entries in one pass and in constant memory, preserving their order.\n
+	'Sample.RANDOM' selects a uniform random sample, i.e., each entry is selected with the probability of the remaining selections over the remaining entries, i.e., Knuth's Algorithm S.\n
+	'Sample.STRATIFIED' splits the entries into equal consecutive strata, and selects one random entry from each stratum, so the sample is spread evenly across the whole product.\n
+	Generation stops once the last entry is selected.
+	"""
+	import random
+	generator = random.Random(seed)
+	limit = min(limit, total)
+	if limit <= 0:
+		return
+	selected = 0
+	if method == Sample.STRATIFIED:
+		target = generator.randrange(0, total // limit)
+		for index, entry in enumerate(iterable):
+			if index == target:
+				yield entry
+				selected += 1
+				if selected == limit:
+					return
+				target = generator.randrange(selected * total // limit, (selected + 1) * total // limit)
+	else:
+		for index, entry in enumerate(iterable):
+			if (total - index) * generator.random() < limit - selected:
+				yield entry
+				selected += 1
+				if selected == limit:
+					return
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+
+import array, enum, hashlib, math, sys, typing
+
+ENCODING = "UTF-8"
+
+class Strategy(enum.Enum):
+	"""
+	Enum containing deduplication strategies.
+	"""
+	EXACT = "exact"
+	HASH  = "hash"
+	BLOOM = "bloom"
+	NONE  = "none"
+
+	@classmethod
+	def all(cls):
+		"""
+		Get all deduplication strategies.
+		"""
+		return [cls.EXACT, cls.HASH, cls.BLOOM, cls.NONE]
+
+def fingerprint(entry: str) -> int:
+	"""
+	Get a non-zero 64-bit fingerprint of an entry.
+	"""
+	return int.from_bytes(hashlib.blake2b(entry.encode(ENCODING), digest_size = 8).digest(), "little") or 1
+
+def fingerprint_bytes(data: bytes | typing.Iterable[bytes]) -> int:
+	"""
+	Get a non-zero 64-bit fingerprint of an encoded entry, or of an encoded entry in chunks.
+	"""
+	if isinstance(data, (bytes, bytearray, memoryview)):
+		return int.from_bytes(hashlib.blake2b(data, digest_size = 8).digest(), "little") or 1
+	digest = hashlib.blake2b(digest_size = 8)
+	for chunk in data:
+		digest.update(chunk)
+	return int.from_bytes(digest.digest(), "little") or 1
+
+# ----------------------------------------
+
+class Dedup:
+
+	def __init__(self):
+		"""
+		Class for removing duplicates from a stream of entries.\n
+		Keeps all the entries seen in a set.
+		"""
+		self.strategy = Strategy.EXACT
+		self.dropped  = 0
+		self.__seen   = set()
+		self.__size   = 0
+
+	def add(self, entry: str):
+		"""
+		Add an entry.\n
+		Returns 'False' if the entry has already been seen.
+		"""
+		if entry in self.__seen:
+			return False
+		self.__seen.add(entry)
+		self.__size += sys.getsizeof(entry)
+		return True
+
+	def memory(self):
+		"""
+		Get the number of bytes used to track the entries seen.
+		"""
+		return sys.getsizeof(self.__seen) + self.__size
+
+	def filter(self, iterable: typing.Iterable[str]) -> typing.Iterator[str]:
+		"""
+		Remove duplicates from an iterable while streaming it.
+		"""
+		for entry in iterable:
+			if self.add(entry):
+				yield entry
+			else:
+				self.dropped += 1
+
+	def summary(self):
+		"""
+		Get a summary of the duplicates dropped and the memory used.
+		"""
+		return f"Deduplication ({self.strategy.value}): {self.dropped} duplicates dropped, {self.memory()} bytes used"
+
+class NoDedup(Dedup):
+
+	def __init__(self):
+		"""
+		Class for passing through a stream of entries that has already been deduplicated.
+		"""
+		super().__init__()
+		self.strategy = Strategy.NONE
+
+	def add(self, entry: str):
+		return True
+
+	def memory(self):
+		return 0
+
+	def filter(self, iterable: typing.Iterable[str]) -> typing.Iterator[str]:
+		return iter(iterable)
+
+class HashDedup(Dedup):
+
+	def __init__(self, capacity: int = 1024):
+		"""
+		Class for removing duplicates from a stream of entries.\n
+		Keeps 64-bit fingerprints of the entries seen in an open addressing hash table backed by a compact 'array("Q")'.\n
+		Distinct entries with the same fingerprint are treated as duplicates, which is very unlikely below billions of entries.
+		"""
+		super().__init__()
+		self.strategy = Strategy.HASH
+		self.__count  = 0
+		self.__table  = array.array("Q", bytes(8 * (1 << max(4, (2 * capacity - 1).bit_length()))))
+		self.__mask   = len(self.__table) - 1
+
+	def __insert(self, fingerprint: int):
+		"""
+		Insert a fingerprint into the table.\n
+		Returns 'False' if the fingerprint is already in the table.
+		"""
+		table = self.__table
+		mask = self.__mask
+		index = fingerprint & mask
+		while table[index]:
+			if table[index] == fingerprint:
+				return False
+			index = (index + 1) & mask
+		table[index] = fingerprint
+		return True
+
+	def __grow(self):
+		"""
+		Double the size of the table, and re-insert all the fingerprints.
+		"""
+		old = self.__table
+		self.__table = array.array("Q", bytes(16 * len(old)))
+		self.__mask = len(self.__table) - 1
+		for fingerprint in old:
+			if fingerprint:
+				self.__insert(fingerprint)
+
+	def add(self, entry: str):
+		if not self.__insert(fingerprint(entry)):
+			return False
+		self.__count += 1
+		if self.__count * 2 > len(self.__table):
+			self.__grow()
+		return True
+
+	def memory(self):
+		return self.__table.buffer_info()[1] * self.__table.itemsize
+
+class BloomDedup(Dedup):
+
+	def __init__(self, false_positive: float = 0.001, capacity: int = 1024):
+		"""
+		Class for removing duplicates from a stream of entries.\n
+		Keeps the entries seen in a scalable Bloom filter, i.e., a series of Bloom filters, each twice as large and with half the false positive rate of the previous.\n
+		The total false positive rate, i.e., the share of unique entries wrongly dropped, stays below the specified rate.
+		"""
+		super().__init__()
+		self.strategy        = Strategy.BLOOM
+		self.false_positive  = false_positive
+		self.__rate          = false_positive / 2
+		self.__capacity      = capacity
+		self.__filters: list[tuple[bytearray, int, int]] = []
+		self.__count         = 0
+		self.__add_filter()
+
+	def __add_filter(self):
+		"""
+		Add a new Bloom filter sized for the current capacity and false positive rate.
+		"""
+		bits = max(64, math.ceil(-self.__capacity * math.log(self.__rate) / math.log(2) ** 2))
+		hashes = max(1, round(bits / self.__capacity * math.log(2)))
+		self.__filters.append((bytearray((bits + 7) // 8), bits, hashes))
+		self.__count = 0
+
+	def add(self, entry: str):
+		digest = hashlib.blake2b(entry.encode(ENCODING), digest_size = 16).digest()
+		first = int.from_bytes(digest[:8], "little")
+		second = int.from_bytes(digest[8:], "little") | 1
+		for bits, size, hashes in self.__filters:
+			for i in range(hashes):
+				position = (first + i * second) % size
+				if not bits[position >> 3] & (1 << (position & 7)):
+					break
+			else:
+				return False
+		if self.__count >= self.__capacity:
+			self.__capacity *= 2
+			self.__rate /= 2
+			self.__add_filter()
+		bits, size, hashes = self.__filters[-1]
+		for i in range(hashes):
+			position = (first + i * second) % size
+			bits[position >> 3] |= 1 << (position & 7)
+		self.__count += 1
+		return True
+
+	def memory(self):
+		return sum(len(bits) for bits, size, hashes in self.__filters)
+
+# ----------------------------------------
+
+def get(strategy: Strategy, false_positive: float = 0.001) -> Dedup:
+	"""
+	Get a new deduplicator for the specified strategy.
+	"""
+	if strategy == Strategy.HASH:
+		return HashDedup()
+	elif strategy == Strategy.BLOOM:
+		return BloomDedup(false_positive)
+	elif strategy == Strategy.NONE:
+		return NoDedup()
+	return Dedup()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+
+from . import dedup, file
+
+import array, bisect, heapq, mmap, os, struct, sys, tempfile, typing
+
+EXTENSION = ".fpi"
+
+MAGIC = b"AMNTFPI\x00"
+
+VERSION = 1
+
+HEADER = "<8sIIQQQ"
+
+HEADER_SIZE = 40
+
+RUN_SIZE = 1 << 20
+
+def detect(path: str) -> file.Format:
+	"""
+	Detect the output format of a wordlist by its file extension, or by the magic of the indexed format.\n
+	Defaults to the text format.
+	"""
+	for format in [file.Format.GZIP, file.Format.NUL, file.Format.JSONL, file.Format.INDEXED]:
+		if path.endswith(format.extension) or (format == file.Format.GZIP and path.endswith(".gz")):
+			return format
+	with open(path, "rb") as stream:
+		if stream.read(len(file.INDEX_MAGIC)) == file.INDEX_MAGIC:
+			return file.Format.INDEXED
+	return file.Format.TEXT
+
+def __lines(stream: typing.BinaryIO, separator: bytes) -> typing.Iterator[bytes]:
+	"""
+	Read entries separated or terminated by the specified separator, a buffer at a time.
+	"""
+	rest = b""
+	while True:
+		data = stream.read(file.BUFFER_SIZE)
+		if not data:
+			break
+		entries = (rest + data).split(separator)
+		rest = entries.pop()
+		yield from entries
+	if rest:
+		yield rest
+
+def read(path: str, format: file.Format) -> typing.Iterator[bytes]:
+	"""
+	Read the encoded entries of a wordlist in the specified output format, without loading it into memory.
+	"""
+	if format == file.Format.INDEXED:
+		with file.IndexedReader(path) as reader:
+			for index in range(len(reader)):
+				yield reader.get_bytes(index)
+	elif format == file.Format.JSONL:
+		import json
+		with open(path, "rb") as stream:
+			for line in __lines(stream, b"\n"):
+				if line:
+					yield json.loads(line).encode(file.ENCODING)
+	elif format == file.Format.GZIP:
+		import gzip
+		with gzip.open(path, "rb") as stream:
+			yield from __lines(stream, b"\n")
+	else:
+		with open(path, "rb") as stream:
+			yield from __lines(stream, b"\x00" if format == file.Format.NUL else b"\n")
+
+# ----------------------------------------
+
+def __runs(fingerprints: typing.Iterable[int], directory: str) -> list[typing.BinaryIO]:
+	"""
+	Split fingerprints into sorted runs of at most 'RUN_SIZE' fingerprints, each in a temporary file.
+	"""
+	tmp = []
+	run = []
+	def flush():
+		stream = tempfile.TemporaryFile(dir = directory)
+		stream.write(array.array("Q", sorted(run)).tobytes())
+		stream.seek(0)
+		tmp.append(stream)
+		run.clear()
+	for fingerprint in fingerprints:
+		run.append(fingerprint)
+		if len(run) >= RUN_SIZE:
+			flush()
+	if run or not tmp:
+		flush()
+	return tmp
+
+def __read_run(stream: typing.BinaryIO) -> typing.Iterator[int]:
+	"""
+	Read a sorted run a buffer at a time.
+	"""
+	while True:
+		data = stream.read(file.BUFFER_SIZE)
+		if not data:
+			break
+		yield from array.array("Q", data)
+
+def build(path: str, out: typing.BinaryIO, directory: str) -> int:
+	"""
+	Build a fingerprint index of a wordlist, i.e., a header and a sorted table of the distinct 64-bit fingerprints of its entries, as little-endian integers.\n
+	Fingerprints are sorted in runs in temporary files, and the runs are merged, so the memory used does not grow with the size of the wordlist.\n
+	Returns the number of fingerprints.
+	"""
+	stat = os.stat(path)
+	runs = __runs(map(dedup.fingerprint_bytes, read(path, detect(path))), directory)
+	out.write(bytes(HEADER_SIZE))
+	count = 0
+	previous = 0
+	buffer = array.array("Q")
+	for fingerprint in heapq.merge(*map(__read_run, runs)):
+		if fingerprint != previous:
+			buffer.append(fingerprint)
+			previous = fingerprint
+			if len(buffer) >= file.BUFFER_SIZE:
+				count += len(buffer)
+				if sys.byteorder != "little":
+					buffer.byteswap()
+				out.write(buffer.tobytes())
+				buffer = array.array("Q")
+	count += len(buffer)
+	if sys.byteorder != "little":
+		buffer.byteswap()
+	out.write(buffer.tobytes())
+	for run in runs:
+		run.close()
+	out.seek(0)
+	out.write(struct.pack(HEADER, MAGIC, VERSION, 0, stat.st_size, stat.st_mtime_ns, count))
+	out.flush()
+	return count
+
+class Since:
+
+	def __init__(self, path: str):
+		"""
+		Class for removing the entries already present in a previous wordlist from a stream of entries.\n
+		The fingerprints of the previous wordlist are kept in an on-disk index next to it, i.e., '<path>.fpi', which is memory-mapped, and reused as long as the size and the modification time of the wordlist match.\n
+		If the index cannot be saved next to the wordlist, it is built in a temporary file on every run.\n
+		Distinct entries with the same fingerprint are treated as already present, which is very unlikely below billions of entries.
+		"""
+		self.path    = path
+		self.skipped = 0
+		self.built   = False
+		self.__map   = None
+		stat = os.stat(path)
+		index = path + EXTENSION
+		if not self.__open(index, stat):
+			self.built = True
+			directory = os.path.dirname(os.path.abspath(path))
+			try:
+				descriptor, temporary = tempfile.mkstemp(prefix = ".tmp-", suffix = EXTENSION, dir = directory)
+				with os.fdopen(descriptor, "w+b") as stream:
+					build(path, stream, directory)
+				os.replace(temporary, index)
+				self.__open(index, stat)
+			except OSError:
+				with tempfile.TemporaryFile() as stream:
+					build(path, stream, None)
+					self.__map = mmap.mmap(stream.fileno(), 0, access = mmap.ACCESS_READ)
+				self.__view()
+
+	def __open(self, index: str, stat: os.stat_result) -> bool:
+		"""
+		Memory-map an existing index.\n
+		Returns 'False' if the index does not exist, is invalid, or is stale.
+		"""
+		try:
+			with open(index, "rb") as stream:
+				self.__map = mmap.mmap(stream.fileno(), 0, access = mmap.ACCESS_READ)
+		except (OSError, ValueError):
+			return False
+		if len(self.__map) >= HEADER_SIZE:
+			magic, version, reserved, size, mtime, count = struct.unpack_from(HEADER, self.__map)
+			if magic == MAGIC and version == VERSION and (size, mtime) == (stat.st_size, stat.st_mtime_ns) and len(self.__map) == HEADER_SIZE + 8 * count:
+				self.__view()
+				return True
+		self.__map.close()
+		self.__map = None
+		return False
+
+	def __view(self):
+		"""
+		View the sorted table of fingerprints as a sequence of integers, without copying it on little-endian machines.
+		"""
+		table = memoryview(self.__map)[HEADER_SIZE:]
+		if sys.byteorder == "little":
+			self.__table = table.cast("Q")
+		else:
+			self.__table = array.array("Q", table)
+			self.__table.byteswap()
+
+	def __len__(self):
+		return len(self.__table)
+
+	def __contains__(self, entry: typing.Any):
+		fingerprint = dedup.fingerprint(entry) if isinstance(entry, str) else dedup.fingerprint_bytes(entry.chunks())
+		table = self.__table
+		index = bisect.bisect_left(table, fingerprint)
+		return index < len(table) and table[index] == fingerprint
+
+	def filter(self, iterable: typing.Iterable[str]) -> typing.Iterator[str]:
+		"""
+		Remove the entries already present in the previous wordlist from an iterable while streaming it.
+		"""
+		for entry in iterable:
+			if entry in self:
+				self.skipped += 1
+			else:
+				yield entry
+
+	def summary(self):
+		"""
+		Get a summary of the entries skipped.
+		"""
+		return f"Delta: {self.skipped} entries already in '{self.path}' skipped, {len(self)} fingerprints {'indexed' if self.built else 'reused'}"
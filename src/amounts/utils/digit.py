@@ -2,7 +2,7 @@
 
 from . import general
 
-import decimal, enum, re, struct
+import decimal, enum, re, typing
 
 class Category(enum.Enum):
 	"""
@@ -31,24 +31,40 @@ class Scope(enum.Enum):
 
 class Amount:
 
+	__slots__ = ("category", "type", "__value", "numeric", "string", "scope", "string_no_scope", "decimal_precision", "bin", "hex", "hex_no_fp", "byte", "unicode", "overflow", "underflow")
+
 	def __init__(self, value: str, category: Category, type: Type):
 		"""
-		Class for storing amount details.
-		"""
-		self.category          = category
-		self.type              = type
-		self.numeric           = decimal.Decimal(value)
-		self.string            = str(self.numeric)
-		self.scope             = self.__get_scope()
-		self.string_no_scope   = self.__get_string_no_scope()
-		self.decimal_precision = self.__get_decimal_precision()
-		self.bin               = self.__get_bin()
-		self.hex               = self.__get_hex()
-		self.hex_no_fp         = self.__get_hex_no_fp()
-		self.byte              = self.__get_byte()
-		self.unicode           = self.__get_unicode()
-		self.overflow          = self.__get_overflow()
-		self.underflow         = self.__get_underflow()
+		Class for storing amount details.\n
+		All representations are computed on first access, and cached.
+		"""
+		self.category = category
+		self.type     = type
+		self.__value  = value
+
+	def __getattr__(self, name: str):
+		"""
+		Compute a representation on first access, and cache it.\n
+		Only called for representations that are not yet computed, subsequent accesses read the cached value directly.
+		"""
+		method = Amount.__representations.get(name)
+		if not method:
+			raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+		value = method(self)
+		setattr(self, name, value)
+		return value
+
+	def __get_numeric(self):
+		"""
+		Returns the amount as a decimal number.
+		"""
+		return decimal.Decimal(self.__value)
+
+	def __get_string(self):
+		"""
+		Returns the normalized amount.
+		"""
+		return str(self.numeric)
 
 	def __get_scope(self):
 		"""
@@ -75,6 +91,7 @@ class Amount:
 		if self.type == Type.INTEGER:
 			return bin(int(self.numeric))
 		elif self.type == Type.DECIMAL:
+			import struct
 			return "0b" + format(struct.unpack("!I", struct.pack("!f", self.numeric))[0], "032b")
 
 	def __get_hex(self):
@@ -101,13 +118,13 @@ class Amount:
 		"""
 		Convert the amount to a byte escape sequence.
 		"""
-		return ("").join(f"\\x{ord(char):02x}" for char in self.string)
+		return self.string.translate(BYTE_TABLE)
 
 	def __get_unicode(self):
 		"""
 		Convert the amount to a Unicode escape sequence.
 		"""
-		return ("").join(f"\\u{ord(char):04x}" for char in self.string)
+		return self.string.translate(UNICODE_TABLE)
 
 	def __get_overflow(self, number: int = 1):
 		"""
@@ -121,6 +138,114 @@ class Amount:
 		"""
 		return str(self.numeric - number)
 
+	__representations = {
+		"numeric"          : __get_numeric,
+		"string"           : __get_string,
+		"scope"            : __get_scope,
+		"string_no_scope"  : __get_string_no_scope,
+		"decimal_precision": __get_decimal_precision,
+		"bin"              : __get_bin,
+		"hex"              : __get_hex,
+		"hex_no_fp"        : __get_hex_no_fp,
+		"byte"             : __get_byte,
+		"unicode"          : __get_unicode,
+		"overflow"         : __get_overflow,
+		"underflow"        : __get_underflow
+	}
+
+# ----------------------------------------
+
+BYTE_TABLE = str.maketrans({chr(i): f"\\x{i:02x}" for i in range(128) if chr(i) != "\n"})
+
+UNICODE_TABLE = str.maketrans({chr(i): f"\\u{i:04x}" for i in range(128) if chr(i) != "\n"})
+
+MAX_SWEEP = 1000000000
+
+BULK = ("bin", "hex", "hex_no_fp", "byte", "unicode", "overflow", "underflow")
+
+class Sweep:
+
+	def __init__(self, start: str, stop: str, step: str, chunk: int = 4096):
+		"""
+		Class for generating middle amounts for every value in an inclusive range.\n
+		Integer representations are computed in bulk, a chunk of values at a time, with C-level 'map()' and 'str.translate()' calls instead of a per-value 'Amount'.\n
+		Decimal ranges fall back to a per-value 'Amount'.
+		"""
+		self.start   = decimal.Decimal(start)
+		self.stop    = decimal.Decimal(stop)
+		self.step    = decimal.Decimal(step)
+		self.type    = Type.INTEGER if all(is_integer(value) for value in [start, stop, step]) else Type.DECIMAL
+		self.__chunk = chunk
+
+	def __len__(self):
+		return self.count()
+
+	def count(self) -> int:
+		"""
+		Get the number of values as a plain integer, which, unlike 'len()', is not limited to an index-sized integer.\n
+		Decimal floor division rounds towards zero, so a step in the wrong direction is checked separately.
+		"""
+		if (self.stop - self.start) * self.step < 0:
+			return 0
+		return int((self.stop - self.start) // self.step) + 1
+
+	def __str__(self):
+		return f"{self.start}:{self.stop}:{self.step}"
+
+	def __iter__(self):
+		return self.amounts()
+
+	def amounts(self, representations: typing.Iterable[str] = BULK):
+		"""
+		Generate the amounts, with only the specified representations computed in bulk for integer ranges.\n
+		All the other representations are computed on first access, as usual, so representations that are never used cost nothing.
+		"""
+		if self.type == Type.INTEGER:
+			return self.__integers(frozenset(representations))
+		return self.__decimals()
+
+	def __decimals(self):
+		"""
+		Generate decimal amounts one at a time.
+		"""
+		for i in range(self.count()):
+			value = self.start + i * self.step
+			yield Amount(str(value), Category.MIDDLE, Type.INTEGER if is_integer(str(value)) else Type.DECIMAL)
+
+	def __integers(self, representations: frozenset[str]):
+		"""
+		Generate integer amounts a chunk at a time.
+		"""
+		start = int(self.start)
+		step = int(self.step)
+		total = self.count()
+		for offset in range(0, total, self.__chunk):
+			first = start + offset * step
+			values = range(first, first + min(self.__chunk, total - offset) * step, step)
+			strings = list(map(str, values))
+			fields = {}
+			if "bin" in representations:
+				fields["bin"] = map(bin, values)
+			if representations & {"hex", "hex_no_fp"}:
+				fields["hex"] = fields["hex_no_fp"] = list(map(hex, values))
+			if representations & {"byte", "unicode"}:
+				joined = ("\n").join(strings)
+				if "byte" in representations:
+					fields["byte"] = joined.translate(BYTE_TABLE).split("\n")
+				if "unicode" in representations:
+					fields["unicode"] = joined.translate(UNICODE_TABLE).split("\n")
+			if "overflow" in representations:
+				fields["overflow"] = map(str, range(first + 1, values.stop + 1, step))
+			if "underflow" in representations:
+				fields["underflow"] = map(str, range(first - 1, values.stop - 1, step))
+			names = tuple(fields)
+			for string, *row in zip(strings, *fields.values()):
+				amount = Amount(string, Category.MIDDLE, Type.INTEGER)
+				amount.string = string
+				for name, value in zip(names, row):
+					setattr(amount, name, value)
+				yield amount
+
 # ----------------------------------------
 
 def is_integer(value: str):
@@ -170,3 +295,69 @@ def validate_maximum(value: str):
 	Returns 'None' and an error message on failure.
 	"""
 	return __validate(value, Category.MAXIMUM)
+
+def validate_limits(minimum: str, maximum: str) -> tuple[Amount | None, Amount | None, list[str]]:
+	"""
+	Validate minimum and maximum values, and their order.\n
+	Both values are optional, and are returned as 'None' if empty.\n
+	Returns a list of error messages on failure.
+	"""
+	messages = []
+	min_amount = None
+	max_amount = None
+	if minimum:
+		min_amount, message = validate_minimum(minimum)
+		if message:
+			messages.append(message)
+	if maximum:
+		max_amount, message = validate_maximum(maximum)
+		if message:
+			messages.append(message)
+		elif min_amount and max_amount.numeric < min_amount.numeric:
+			messages.append("Maximum amount must be greater than or equal to minimum amount")
+	return min_amount, max_amount, messages
+
+def validate_range(minimum: str, maximum: str, middle: str) -> tuple[Amount | None, Amount | None, Amount | None, list[str]]:
+	"""
+	Validate minimum, maximum, and middle values, and their order.\n
+	Minimum and maximum values are optional, and are returned as 'None' if empty.\n
+	Returns a list of error messages on failure.
+	"""
+	min_amount, max_amount, messages = validate_limits(minimum, maximum)
+	mid_amount, message = validate_middle(middle)
+	if message:
+		messages.append(message)
+	elif min_amount and mid_amount.numeric < min_amount.numeric:
+		messages.append("Middle amount must be greater than or equal to minimum amount")
+	elif max_amount and mid_amount.numeric > max_amount.numeric:
+		messages.append("Middle amount must be lesser than or equal to maximum amount")
+	return min_amount, max_amount, mid_amount, messages
+
+def validate_sweep(value: str, minimum: Amount | None, maximum: Amount | None) -> tuple[Sweep | None, str]:
+	"""
+	Validate a range in the 'start:stop[:step]' format, where the stop value is inclusive.\n
+	Returns 'None' and an error message on failure.
+	"""
+	tmp = None
+	message = ""
+	parts = value.split(":")
+	if len(parts) not in [2, 3]:
+		message = "Sweep must be in the 'start:stop' or 'start:stop:step' format"
+	elif not all(is_integer(part) or is_decimal(part) for part in parts):
+		message = "Sweep start, stop, and step must be either integers or decimals"
+	else:
+		start, stop, step = parts[0], parts[1], parts[2] if len(parts) > 2 else "1"
+		sweep = Sweep(start, stop, step)
+		if sweep.step == 0:
+			message = "Sweep step must not be equal to zero"
+		elif not sweep.count():
+			message = "Sweep must contain at least one value, use a negative step for descending ranges"
+		elif sweep.count() > MAX_SWEEP:
+			message = f"Sweep must contain at most {MAX_SWEEP} values"
+		elif minimum and min(sweep.start, sweep.stop) < minimum.numeric:
+			message = "Sweep start and stop must be greater than or equal to minimum amount"
+		elif maximum and max(sweep.start, sweep.stop) > maximum.numeric:
+			message = "Sweep start and stop must be lesser than or equal to maximum amount"
+		else:
+			tmp = sweep
+	return tmp, message
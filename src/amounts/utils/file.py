@@ -1,21 +1,303 @@
 #!/usr/bin/env python3
 
-import os
+from . import wordlist
+
+import enum, os, sys, time, typing
 
 ENCODING = "UTF-8"
 
-def overwrite_array(array: list[str], out: str):
+STDOUT = "-"
+
+BUFFER_SIZE = 64 * 1024
+
+class Format(enum.Enum):
+	"""
+	Enum containing output formats.
+	"""
+	TEXT    = "text"
+	NUL     = "nul"
+	JSONL   = "jsonl"
+	GZIP    = "gzip"
+	INDEXED = "indexed"
+
+	@classmethod
+	def all(cls):
+		"""
+		Get all output formats.
+		"""
+		return [cls.TEXT, cls.NUL, cls.JSONL, cls.GZIP, cls.INDEXED]
+
+	@property
+	def extension(self):
+		"""
+		Get the file extension of the output format.
+		"""
+		return {
+			Format.TEXT   : ".txt",
+			Format.NUL    : ".nul",
+			Format.JSONL  : ".jsonl",
+			Format.GZIP   : ".txt.gz",
+			Format.INDEXED: ".idx"
+		}[self]
+
+# ----------------------------------------
+
+INDEX_MAGIC = b"AMNTIDX\x00"
+
+INDEX_VERSION = 1
+
+INDEX_HEADER = "<8sIIQQ"
+
+INDEX_HEADER_SIZE = 32
+
+def __open(out: str):
+	"""
+	Open an output file, or the standard output if the output file is '-', for buffered binary writing.
+	"""
+	if out == STDOUT:
+		return open(sys.stdout.fileno(), "wb", buffering = BUFFER_SIZE, closefd = False)
+	return open(out, "wb", buffering = BUFFER_SIZE)
+
+def __write_text(array: typing.Iterable[str], stream: typing.BinaryIO):
+	"""
+	Write entries separated by newlines.\n
+	Payloads cannot be concatenated with strings, so they are written in chunks instead.\n
+	Wordlists are written as a whole, without copying their arena.
+	"""
+	if isinstance(array, wordlist.Wordlist):
+		array.write(stream)
+		return
+	separator = ""
+	for entry in array:
+		try:
+			stream.write((separator + entry).encode(ENCODING))
+		except TypeError:
+			stream.write(separator.encode(ENCODING))
+			entry.write(stream)
+		separator = "\n"
+
+def __write_nul(array: typing.Iterable[str], stream: typing.BinaryIO):
 	"""
-	Write a list to an output file.\n
-	If the output file exists, prompt to overwrite it.
+	Write entries terminated by NUL characters, so entries can contain newlines.
 	"""
+	if isinstance(array, wordlist.Wordlist):
+		array.write(stream, b"\x00", True)
+		return
+	for entry in array:
+		try:
+			stream.write((entry + "\x00").encode(ENCODING))
+		except TypeError:
+			entry.write(stream)
+			stream.write(b"\x00")
+
+def __write_jsonl(array: typing.Iterable[str], stream: typing.BinaryIO):
+	"""
+	Write entries as JSON strings, one per line.\n
+	Payloads consist of digits, scopes, and decimal points only, so they are written in chunks without escaping.
+	"""
+	import json
+	for entry in array:
+		try:
+			stream.write((json.dumps(entry, ensure_ascii = False) + "\n").encode(ENCODING))
+		except TypeError:
+			stream.write(b"\x22")
+			entry.write(stream)
+			stream.write(b"\x22\n")
+
+def __write_gzip(array: typing.Iterable[str], stream: typing.BinaryIO):
+	"""
+	Write entries separated by newlines, and compress them while streaming.
+	"""
+	import gzip
+	with gzip.GzipFile(fileobj = stream, mode = "wb", compresslevel = 6) as compressed:
+		__write_text(array, compressed)
+
+def __write_indexed(array: typing.Iterable[str], stream: typing.BinaryIO):
+	"""
+	Write entries in the indexed format, i.e., a header, a payload blob, and an offsets table.\n
+	The header stores the number of entries and the position of the offsets table.\n
+	The offsets table stores the position of each entry and the end of the last entry, as little-endian 64-bit integers.
+	"""
+	import array as arrays, struct
+	stream.write(bytes(INDEX_HEADER_SIZE))
+	offsets = arrays.array("Q")
+	position = INDEX_HEADER_SIZE
+	for entry in array:
+		offsets.append(position)
+		try:
+			data = entry.encode(ENCODING)
+			stream.write(data)
+			position += len(data)
+		except AttributeError:
+			position += entry.write(stream)
+	offsets.append(position)
+	if sys.byteorder != "little":
+		offsets.byteswap()
+	stream.write(offsets.tobytes())
+	stream.seek(0)
+	stream.write(struct.pack(INDEX_HEADER, INDEX_MAGIC, INDEX_VERSION, 0, len(offsets) - 1, position))
+
+class __Counter:
+
+	def __init__(self, stream: typing.BinaryIO):
+		"""
+		Class for counting the bytes written to a binary stream.\n
+		Rewritten bytes, e.g., the header of the indexed format, are counted once.
+		"""
+		self.__stream   = stream
+		self.__position = 0
+		self.size       = 0
+
+	def __getattr__(self, name: str):
+		return getattr(self.__stream, name)
+
+	def write(self, data: bytes):
+		self.__position += len(data)
+		self.size = max(self.size, self.__position)
+		return self.__stream.write(data)
+
+	def seek(self, offset: int, whence: int = os.SEEK_SET):
+		self.__position = self.__stream.seek(offset, whence)
+		return self.__position
+
+def write_array(array: typing.Iterable[str], out: str, format: Format = Format.TEXT, recorder: typing.Any = None):
+	"""
+	Stream a list or any other iterable to an output file in the specified format.\n
+	If the recorder is specified, the bytes written and the time spent are recorded with 'recorder.written()'.\n
+	Returns 'False' on failure.
+	"""
+	writers = {
+		Format.TEXT   : __write_text,
+		Format.NUL    : __write_nul,
+		Format.JSONL  : __write_jsonl,
+		Format.GZIP   : __write_gzip,
+		Format.INDEXED: __write_indexed
+	}
+	try:
+		start = time.perf_counter()
+		with __open(out) as stream:
+			if recorder:
+				stream = __Counter(stream)
+			writers[format](array, stream)
+		if recorder:
+			recorder.written(stream.size, time.perf_counter() - start)
+		return True
+	except BrokenPipeError:
+		return True
+	except Exception as ex:
+		return False
+
+def overwrite_array(array: typing.Iterable[str], out: str, format: Format = Format.TEXT, recorder: typing.Any = None):
+	"""
+	Stream a list or any other iterable to an output file in the specified format.\n
+	If the output file exists, prompt to overwrite it.\n
+	If the output file is '-', stream to the standard output without prompting.
+	"""
+	if out == STDOUT:
+		if not write_array(array, out, format, recorder):
+			print("Cannot stream the results to the standard output", file = sys.stderr)
+		return
 	confirm = "yes"
 	if os.path.isfile(out):
 		print(f"'{out}' already exists")
 		confirm = input("Overwrite the output file (yes): ")
 	if confirm.lower() in ["yes", "y"]:
-		try:
-			open(out, "w", encoding = ENCODING).write(("\n").join(array))
+		if write_array(array, out, format, recorder):
 			print(f"Results have been saved to '{out}'")
-		except Exception as ex:
+		else:
 			print(f"Cannot save the results to '{out}'")
+
+def copy_stream(opener: typing.Callable[[], typing.BinaryIO | None], out: str):
+	"""
+	Copy a binary stream returned by the opener to an output file as is.\n
+	Returns 'False' on failure.
+	"""
+	import shutil
+	try:
+		source = opener()
+		if not source:
+			return False
+		with source, __open(out) as stream:
+			shutil.copyfileobj(source, stream, BUFFER_SIZE)
+		return True
+	except BrokenPipeError:
+		return True
+	except Exception as ex:
+		return False
+
+def overwrite_stream(opener: typing.Callable[[], typing.BinaryIO | None], out: str):
+	"""
+	Copy a binary stream returned by the opener to an output file as is, e.g., a cached wordlist.\n
+	The opener is called only after the overwrite is confirmed.\n
+	If the output file exists, prompt to overwrite it.\n
+	If the output file is '-', stream to the standard output without prompting.
+	"""
+	if out == STDOUT:
+		if not copy_stream(opener, out):
+			print("Cannot stream the results to the standard output", file = sys.stderr)
+		return
+	confirm = "yes"
+	if os.path.isfile(out):
+		print(f"'{out}' already exists")
+		confirm = input("Overwrite the output file (yes): ")
+	if confirm.lower() in ["yes", "y"]:
+		if copy_stream(opener, out):
+			print(f"Results have been saved to '{out}'")
+		else:
+			print(f"Cannot save the results to '{out}'")
+
+# ----------------------------------------
+
+class IndexedReader:
+
+	def __init__(self, path: str):
+		"""
+		Class for reading entries from a file in the indexed format.\n
+		The file is memory-mapped, and each entry is read in constant time without reading the rest of the file.\n
+		Raises 'ValueError' if the file is not in the indexed format.
+		"""
+		import mmap, struct
+		self.__struct = struct
+		with open(path, "rb") as stream:
+			self.__map = mmap.mmap(stream.fileno(), 0, access = mmap.ACCESS_READ)
+		if len(self.__map) < INDEX_HEADER_SIZE:
+			self.close()
+			raise ValueError(f"'{path}' is not in the indexed format")
+		magic, version, reserved, self.__count, self.__table = struct.unpack_from(INDEX_HEADER, self.__map)
+		if magic != INDEX_MAGIC or version != INDEX_VERSION or self.__table + 8 * (self.__count + 1) > len(self.__map):
+			self.close()
+			raise ValueError(f"'{path}' is not in the indexed format")
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args: typing.Any):
+		self.close()
+
+	def __len__(self):
+		return self.__count
+
+	def __iter__(self):
+		for index in range(self.__count):
+			yield self[index]
+
+	def __getitem__(self, index: int):
+		return self.get_bytes(index).decode(ENCODING)
+
+	def get_bytes(self, index: int) -> bytes:
+		"""
+		Get the raw bytes of the entry at the specified index.\n
+		Negative indexes count from the end.
+		"""
+		if index < 0:
+			index += self.__count
+		if not 0 <= index < self.__count:
+			raise IndexError("Entry index out of range")
+		start, end = self.__struct.unpack_from("<QQ", self.__map, self.__table + 8 * index)
+		return self.__map[start:end]
+
+	def close(self):
+		"""
+		Close the memory map.
+		"""
+		self.__map.close()
@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 
-from . import digit, general
+from . import digit, general, ieee754
 
-import decimal
+import decimal, typing
 
 # ----------------------------------------
 
@@ -26,58 +26,51 @@ def __separate(amount: digit.Amount, separator: str, group_by: int):
 	tmp = amount.scope.value + tmp[::-1] + decimal
 	return tmp
 
-def separators(middle: digit.Amount) -> set[str]:
+def separators(middle: digit.Amount) -> typing.Iterator[str]:
 	"""
 	Test grouping and separating digits using separators.
 	"""
-	tmp = []
 	for separator in [general.Separator.SPACE, general.Separator.COMMA, general.Separator.DOT]:
 		separator = separator.value
-		tmp.append(__separate(middle, separator, 3))
-	return tmp
+		yield __separate(middle, separator, 3)
 
 # ----------------------------------------
 
-def zeros(middle: digit.Amount) -> set[str]:
+def zeros(middle: digit.Amount) -> typing.Iterator[str]:
 	"""
 	Test adding leading zeros and trailing decimal zeros using separators.
 	"""
 	zeros = "00"
-	tmp = [middle.scope.value + zeros + middle.string_no_scope]
+	yield middle.scope.value + zeros + middle.string_no_scope
 	for separator in [general.Separator.COMMA, general.Separator.DOT]:
 		separator = separator.value
 		if middle.type == digit.Type.INTEGER:
-			tmp.append(middle.string + separator + zeros)
+			yield middle.string + separator + zeros
 		elif middle.type == digit.Type.DECIMAL:
 			replaced = middle.string.replace(general.Separator.DOT.value, separator)
-			tmp.extend([replaced, replaced + zeros])
-	return tmp
+			yield from [replaced, replaced + zeros]
 
 # ----------------------------------------
 
-def scopes(middle: digit.Amount) -> set[str]:
+def scopes(middle: digit.Amount) -> typing.Iterator[str]:
 	"""
 	Test prepending and appending scopes.
 	"""
-	tmp = []
 	for scope in [digit.Scope.MINUS, digit.Scope.PLUS, digit.Scope.NONE]:
 		scope = scope.value
-		tmp.extend([scope + middle.string_no_scope, middle.string_no_scope + scope])
-	return tmp
+		yield from [scope + middle.string_no_scope, middle.string_no_scope + scope]
 
 # ----------------------------------------
 
-def currencies(middle: digit.Amount) -> set[str]:
+def currencies(middle: digit.Amount) -> typing.Iterator[str]:
 	"""
 	Test prepending fiat currency symbols with and without scopes.
 	"""
-	tmp = []
 	for currency in [general.Currency.USD, general.Currency.EUR, general.Currency.GBP]:
 		currency = currency.value
 		for scope in [digit.Scope.MINUS, digit.Scope.PLUS, digit.Scope.NONE]:
 			scope = scope.value
-			tmp.extend([currency + scope + middle.string_no_scope, scope + currency + middle.string_no_scope])
-	return tmp
+			yield from [currency + scope + middle.string_no_scope, scope + currency + middle.string_no_scope]
 
 # ----------------------------------------
 
@@ -87,11 +80,10 @@ def enquote(string: str, quote: str):
 	"""
 	return quote + string.replace(quote, f"\\{quote}") + quote
 
-def brackets(middle: digit.Amount, quote: general.Quote, ignore: bool) -> set[str]:
+def brackets(middle: digit.Amount, quote: general.Quote, ignore: bool) -> typing.Iterator[str]:
 	"""
 	Testing adding brackets and extending the inner elements.
 	"""
-	tmp = []
 	quote = general.Quote.DOUBLE.value if quote == general.Quote.NONE else quote.value
 	separator = general.Separator.COMMA.value
 	for bracket in [general.Bracket.PARENTHESIS, general.Bracket.SQUARE, general.Bracket.CURLY]:
@@ -100,47 +92,49 @@ def brackets(middle: digit.Amount, quote: general.Quote, ignore: bool) -> set[st
 		if not ignore:
 			values = ["", separator * 2] + values
 		for value in values:
-			tmp.append(bracket.left + value + bracket.right)
-	return tmp
+			yield bracket.left + value + bracket.right
 
 # ----------------------------------------
 
-def flows(minimum: digit.Amount, maximum: digit.Amount, ignore: bool) -> set[str]:
+def flows(minimum: digit.Amount, maximum: digit.Amount, ignore: bool) -> typing.Iterator[str]:
 	"""
 	Test overflows, underflows, and infinite values.
 	"""
-	tmp = []
 	if minimum:
-		tmp.append(minimum.underflow)
+		yield minimum.underflow
 	if maximum:
-		tmp.append(maximum.overflow)
+		yield maximum.overflow
 	if not ignore:
 		for scope in [digit.Scope.MINUS, digit.Scope.NONE]:
 			scope = scope.value
 			for value in ["NaN", "Infinity", "inf"]:
-				tmp.append(scope + value)
-	return tmp
+				yield scope + value
 
 # ----------------------------------------
 
-def notations(minimum: digit.Amount, maximum: digit.Amount, middle: digit.Amount, ignore: bool) -> set[str]:
+def notations(minimum: digit.Amount, maximum: digit.Amount, middle: digit.Amount, ignore: bool, precisions: typing.Iterable[ieee754.Precision] = (), encoded: dict[tuple[ieee754.Precision, str], list[str]] | None = None) -> typing.Iterator[str]:
 	"""
-	Test binary and hexadecimal representations, exponential notations, and byte and Unicode escape sequences.
+	Test binary and hexadecimal representations, exponential notations, and byte and Unicode escape sequences.\n
+	If precisions are specified, also test the IEEE 754 bit patterns of the minimum, maximum, and middle amounts, and their nearest representable neighbours, at each precision.\n
+	If specified, the encodings are looked up in the values encoded at once by 'ieee754.lookup()' instead of being encoded again.
 	"""
-	tmp = [middle.bin, middle.hex, middle.hex_no_fp, middle.hex.strip(), middle.byte, middle.unicode, f"{middle.string}e0", f"{middle.string}e{digit.Scope.MINUS.value}50", format(middle.numeric*decimal.Decimal(10**-50), '.50f')]
+	yield from [middle.bin, middle.hex, middle.hex_no_fp, middle.hex.strip(), middle.byte, middle.unicode, f"{middle.string}e0", f"{middle.string}e{digit.Scope.MINUS.value}50", format(middle.numeric*decimal.Decimal(10**-50), '.50f')]
 	if minimum:
 		if minimum.numeric > 0:
-			tmp.append(f"{minimum.string}e\x2D1")
+			yield f"{minimum.string}e\x2D1"
 		elif minimum.numeric < 0:
-			tmp.append(f"{minimum.string}e1")
+			yield f"{minimum.string}e1"
 	if maximum:
 		if maximum.numeric > 0:
-			tmp.append(f"{maximum.string}e1")
+			yield f"{maximum.string}e1"
 		elif maximum.numeric < 0:
-			tmp.append(f"{maximum.string}e\x2D1")
+			yield f"{maximum.string}e\x2D1"
 	if not ignore:
-		tmp.extend([f"{general.Separator.AND.value}h00", f"{general.Separator.AND.value}hff"])
-	return tmp
+		yield from [f"{general.Separator.AND.value}h00", f"{general.Separator.AND.value}hff"]
+	amounts = [amount.string for amount in [minimum, maximum, middle] if amount]
+	for precision in precisions:
+		for values in ieee754.encode(amounts, precision) if encoded is None else [encoded[precision, amount] for amount in amounts]:
+			yield from values
 
 # ----------------------------------------
 
@@ -163,40 +157,41 @@ def __spread(amount: digit.Amount, separator: str):
 	tmp = amount.scope.value + tmp + decimal
 	return tmp
 
-def other(middle: digit.Amount, ignore: bool) -> set[str]:
+def other(middle: digit.Amount, ignore: bool) -> typing.Iterator[str]:
 	"""
 	Test boolean, empty, integer minimum, integer maximum, and other special values.
 	"""
-	tmp = [__spread(middle, general.Separator.COMMA.value * 2), f"%20%09{middle.string}", f"{middle.string}%20%00%00"]
+	yield from [__spread(middle, general.Separator.COMMA.value * 2), f"%20%09{middle.string}", f"{middle.string}%20%00%00"]
 	if not ignore:
-		tmp.extend(["true", "false", "1", "0", f"{digit.Scope.MINUS.value}1", f"{digit.Scope.PLUS.value}1", f"{digit.Scope.MINUS.value}0", f"{digit.Scope.PLUS.value}0", f"0e{digit.Scope.MINUS.value}1", "0e1"])
-		tmp.extend(["null", "None", "nil", "An Array"])
-		tmp.extend([f"{digit.Scope.MINUS.value}2147483648", "2147483647", f"{digit.Scope.MINUS.value}2147483649", "2147483648", "4294967295", "4294967296"])
-	return tmp
+		yield from hardcoded()
+
+def hardcoded() -> typing.Iterator[str]:
+	"""
+	Test the hardcoded boolean, empty, integer minimum, integer maximum, and other special values, which do not depend on any amount.
+	"""
+	yield from ["true", "false", "1", "0", f"{digit.Scope.MINUS.value}1", f"{digit.Scope.PLUS.value}1", f"{digit.Scope.MINUS.value}0", f"{digit.Scope.PLUS.value}0", f"0e{digit.Scope.MINUS.value}1", "0e1"]
+	yield from ["null", "None", "nil", "An Array"]
+	yield from [f"{digit.Scope.MINUS.value}2147483648", "2147483647", f"{digit.Scope.MINUS.value}2147483649", "2147483648", "4294967295", "4294967296"]
 
 # ----------------------------------------
 
 def __generate(char: str, length: int, iterations: int, prepend: str = "", append: str = ""):
 	"""
-	Generate a string based on the specified parameters.
+	Generate strings based on the specified parameters.
 	"""
-	tmp = []
 	for i in range(1, iterations + 1):
 		string = char * length * i
 		if prepend:
 			string = prepend + string[len(prepend):]
 		if append:
 			string = string[:-len(append)] + append
-		tmp.append(string)
-	return tmp
+		yield string
 
-def lengths(ignore: bool):
+def lengths(ignore: bool) -> typing.Iterator[str]:
 	"""
 	Test lengths.
 	"""
-	tmp = []
 	if not ignore:
 		for scope in [digit.Scope.NONE, digit.Scope.MINUS]:
 			scope = scope.value
-			tmp.extend(__generate("9", 128, 3, scope))
-	return tmp
+			yield from __generate("9", 128, 3, scope)
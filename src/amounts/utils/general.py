@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+from . import array
+
 import dataclasses, enum
 
 def print_error(message: str):
@@ -8,7 +10,21 @@ def print_error(message: str):
 	"""
 	print(f"ERROR: {message}")
 
-class __QuoteType(enum.Enum):
+SIZE_UNITS = {"": 1, "k": 1024, "m": 1024 ** 2, "g": 1024 ** 3}
+
+def parse_size(value: str) -> int | None:
+	"""
+	Parse a size in bytes with an optional 'K', 'M', or 'G' binary suffix, e.g., '8M'.\n
+	Returns 'None' on failure.
+	"""
+	number, unit = value[:-1], value[-1:].lower()
+	if unit.isdigit():
+		number, unit = value, ""
+	if not number.isdigit() or unit not in SIZE_UNITS:
+		return None
+	return int(number) * SIZE_UNITS[unit]
+
+class _QuoteType(enum.Enum):
 	"""
 	Enum containing supported quote types.
 	"""
@@ -31,7 +47,7 @@ class Quote(enum.Enum):
 		"""
 		Get all supported quote types.
 		"""
-		return [__QuoteType.NONE, __QuoteType.SINGLE, __QuoteType.DOUBLE, __QuoteType.BACKTICK]
+		return [_QuoteType.NONE, _QuoteType.SINGLE, _QuoteType.DOUBLE, _QuoteType.BACKTICK]
 
 	@classmethod
 	def all(cls):
@@ -46,12 +62,39 @@ class Quote(enum.Enum):
 		Get a quote for the specified quote type.
 		"""
 		mapping = {
-			__QuoteType.NONE    : cls.NONE,
-			__QuoteType.SINGLE  : cls.SINGLE,
-			__QuoteType.DOUBLE  : cls.DOUBLE,
-			__QuoteType.BACKTICK: cls.BACKTICK
+			_QuoteType.NONE    : cls.NONE,
+			_QuoteType.SINGLE  : cls.SINGLE,
+			_QuoteType.DOUBLE  : cls.DOUBLE,
+			_QuoteType.BACKTICK: cls.BACKTICK
 		}
-		return mapping[__QuoteType(type)]
+		return mapping[_QuoteType(type)]
+
+def validate_quotes(value: str) -> tuple[list[Quote], str]:
+	"""
+	Validate comma-separated quote types.\n
+	Returns an empty list and an error message on failure.
+	"""
+	tmp = []
+	message = ""
+	if value:
+		types = array.remove_empty_strings(value.lower().split(","))
+		if not types:
+			message = "No quotes were specified"
+		else:
+			supported = [type.value for type in Quote.types()]
+			for type in types:
+				if type == "all":
+					tmp.extend(Quote.all())
+				elif type not in supported:
+					tmp = []
+					message = "Supported quotes are 'none', 'single', 'double', 'backtick', or 'all'"
+					break
+				else:
+					tmp.append(Quote.get(type))
+			tmp = array.unique(tmp)
+	else:
+		tmp = [Quote.NONE]
+	return tmp, message
 
 class Separator(enum.Enum):
 	"""
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+
+from . import array
+
+import dataclasses, enum, math, typing
+
+@dataclasses.dataclass(frozen = True)
+class PrecisionDetails:
+	"""
+	Class for storing IEEE 754 precision details, i.e., the 'struct' format of the float, the 'struct' format of its bit pattern, the number of bits, the smallest magnitude that rounds to infinity, and the number of significant digits that always round-trip.
+	"""
+	float   : str
+	integer : str
+	bits    : int
+	overflow: float
+	digits  : int
+
+class Precision(enum.Enum):
+	"""
+	Enum containing IEEE 754 precisions.
+	"""
+	HALF   = PrecisionDetails("e", "H", 16, 65520.0, 5)
+	SINGLE = PrecisionDetails("f", "I", 32, (2 - 2 ** -24) * 2 ** 127, 9)
+	DOUBLE = PrecisionDetails("d", "Q", 64, math.inf, 17)
+
+	@classmethod
+	def all(cls):
+		"""
+		Get all precisions.
+		"""
+		return [cls.HALF, cls.SINGLE, cls.DOUBLE]
+
+CHUNK = 1000
+
+# ----------------------------------------
+
+def __pack(values: list[float], precision: Precision) -> bytes:
+	"""
+	Pack all values into a single big-endian buffer in a single call.\n
+	Values that round to infinity at the precision are packed as infinity instead of raising 'OverflowError'.
+	"""
+	import struct
+	details = precision.value
+	values = [math.copysign(math.inf, value) if abs(value) >= details.overflow else value for value in values]
+	return struct.pack(f">{len(values)}{details.float}", *values)
+
+def __unpack(data: bytes, format: str) -> list:
+	"""
+	Unpack all values of a single big-endian buffer.
+	"""
+	import struct
+	return [value for value, in struct.iter_unpack(f">{format}", data)]
+
+def __neighbours(patterns: list[int], precision: Precision) -> tuple[list[int], list[int]]:
+	"""
+	Get the bit patterns of the nearest representable values above and below each bit pattern, i.e., next-up and next-down.\n
+	Bit patterns are sign-magnitude, so the magnitude is incremented away from zero and decremented towards it, and zeros step to the smallest subnormals.\n
+	Infinities step towards the largest finite values, and NaNs are their own neighbours.
+	"""
+	sign = 1 << (precision.value.bits - 1)
+	infinity = __unpack(__pack([math.inf], precision), precision.value.integer)[0]
+	ups = []
+	downs = []
+	for pattern in patterns:
+		magnitude = pattern & ~sign
+		if magnitude > infinity:
+			up, down = pattern, pattern
+		elif magnitude == infinity:
+			up, down = (pattern - 1, pattern) if pattern & sign else (pattern, pattern - 1)
+		elif magnitude == 0:
+			up, down = 1, sign | 1
+		elif pattern & sign:
+			up, down = pattern - 1, pattern + 1
+		else:
+			up, down = pattern + 1, pattern - 1
+		ups.append(up)
+		downs.append(down)
+	return ups, downs
+
+def shortest(value: float, precision: Precision) -> str:
+	"""
+	Get the shortest decimal representation of a value that round-trips at the precision, e.g., '1.0000001' instead of '1.0000001192092896' for the next-up neighbour of one at single precision.\n
+	A value rounded to more significant digits is never further from the original value, so the number of digits is binary searched up to the number that always round-trips.\n
+	Candidates too large for the precision do not round-trip, and infinities and NaNs, and all values at double precision, are represented as they are.
+	"""
+	if precision == Precision.DOUBLE or not math.isfinite(value):
+		return repr(value)
+	import struct
+	pack = struct.Struct(f">{precision.value.float}").pack
+	target = pack(value)
+	low, high = 1, precision.value.digits
+	while low < high:
+		middle = (low + high) // 2
+		try:
+			found = pack(float(f"{value:.{middle}g}")) == target
+		except OverflowError:
+			found = False
+		if found:
+			high = middle
+		else:
+			low = middle + 1
+	return repr(float(f"{value:.{low}g}"))
+
+def encode(values: list[str], precision: Precision) -> list[list[str]]:
+	"""
+	Encode many values at the specified precision at once.\n
+	For each value, returns its binary bit pattern, its hexadecimal bit pattern, its big-endian byte escape sequence, and the shortest decimal representations of its next-up and next-down neighbours.\n
+	All values are packed into a single buffer, and unpacked with 'struct.iter_unpack()', instead of being packed and unpacked one at a time.
+	"""
+	import struct
+	details = precision.value
+	data = __pack([float(value) for value in values], precision)
+	patterns = __unpack(data, details.integer)
+	ups, downs = __neighbours(patterns, precision)
+	neighbours = __unpack(struct.pack(f">{len(patterns) * 2}{details.integer}", *ups, *downs), details.float)
+	width = details.bits // 4
+	size = details.bits // 8
+	tmp = []
+	for index, pattern in enumerate(patterns):
+		escape = "\\x" + data[index * size:(index + 1) * size].hex(" ").replace(" ", "\\x")
+		tmp.append([f"0b{pattern:0{details.bits}b}", f"0x{pattern:0{width}x}", escape, shortest(neighbours[index], precision), shortest(neighbours[len(patterns) + index], precision)])
+	return tmp
+
+def lookup(values: list[str], precisions: typing.Iterable[Precision]) -> dict[tuple[Precision, str], list[str]]:
+	"""
+	Encode many values at each of the specified precisions at once, e.g., all middle amounts of a sweep chunk, and map each precision and value to its encoding.
+	"""
+	tmp = {}
+	for precision in precisions:
+		tmp.update(((precision, value), encoded) for value, encoded in zip(values, encode(values, precision)))
+	return tmp
+
+def validate_precisions(value: str) -> tuple[list[Precision], str]:
+	"""
+	Validate comma-separated IEEE 754 precisions.\n
+	Returns an empty list and an error message on failure.
+	"""
+	tmp = []
+	message = ""
+	if value:
+		names = array.remove_empty_strings(value.lower().split(","))
+		if not names:
+			message = "No precisions were specified"
+		else:
+			supported = [precision.name.lower() for precision in Precision.all()]
+			for name in names:
+				if name == "all":
+					tmp.extend(Precision.all())
+				elif name not in supported:
+					tmp = []
+					message = "Supported precisions are 'half', 'single', 'double', or 'all'"
+					break
+				else:
+					tmp.append(Precision[name.upper()])
+			tmp = array.unique(tmp)
+	return tmp, message
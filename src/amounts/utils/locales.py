@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+
+from . import array, digit, general
+
+import dataclasses, functools
+
+NBSP = "\u00A0"
+
+NNBSP = "\u202F"
+
+@dataclasses.dataclass(frozen = True)
+class LocaleDetails:
+	"""
+	Class for storing locale details, i.e., the group separator, the decimal separator, the size of the first group and of all the other groups, the position of the currency, and the spacing between the currency and the amount.
+	"""
+	group    : str
+	decimal  : str
+	primary  : int
+	secondary: int
+	suffix   : bool
+	spacing  : str
+
+LOCALES: dict[str, LocaleDetails] = {
+	"en-us"      : LocaleDetails(",", ".", 3, 3, False, ""),
+	"en-in"      : LocaleDetails(",", ".", 3, 2, False, ""),
+	"en-za"      : LocaleDetails(NBSP, ",", 3, 3, False, ""),
+	"de-de"      : LocaleDetails(".", ",", 3, 3, True, NBSP),
+	"de-ch"      : LocaleDetails("\u2019", ".", 3, 3, False, " "),
+	"de-ch-ascii": LocaleDetails("\x27", ".", 3, 3, False, " "),
+	"fr-fr"      : LocaleDetails(NNBSP, ",", 3, 3, True, NBSP),
+	"fr-ch"      : LocaleDetails(NNBSP, ",", 3, 3, True, NBSP),
+	"fr-ca"      : LocaleDetails(NBSP, ",", 3, 3, True, NBSP),
+	"es-es"      : LocaleDetails(".", ",", 3, 3, True, NBSP),
+	"es-mx"      : LocaleDetails(",", ".", 3, 3, False, ""),
+	"it-it"      : LocaleDetails(".", ",", 3, 3, True, NBSP),
+	"nl-nl"      : LocaleDetails(".", ",", 3, 3, False, NBSP),
+	"pt-br"      : LocaleDetails(".", ",", 3, 3, False, NBSP),
+	"pl-pl"      : LocaleDetails(NBSP, ",", 3, 3, True, NBSP),
+	"ru-ru"      : LocaleDetails(NBSP, ",", 3, 3, True, NBSP),
+	"sv-se"      : LocaleDetails(NBSP, ",", 3, 3, True, NBSP),
+	"ja-jp"      : LocaleDetails(",", ".", 3, 3, False, ""),
+	"zh-cn"      : LocaleDetails(",", ".", 3, 3, False, ""),
+	"ar-eg"      : LocaleDetails("\u066C", "\u066B", 3, 3, True, NBSP),
+	"fa-ir"      : LocaleDetails("\u066C", "\u066B", 3, 3, True, NBSP)
+}
+
+CURRENCIES: dict[str, str] = {
+	"AED": "\u062F.\u0625", "AFN": "\u060B", "ALL": "L", "AMD": "\u058F", "ANG": "\u0192", "AOA": "Kz", "ARS": "$", "AUD": "A$",
+	"AWG": "\u0192", "AZN": "\u20BC", "BAM": "KM", "BBD": "$", "BDT": "\u09F3", "BGN": "\u043B\u0432", "BHD": ".\u062F.\u0628", "BIF": "FBu",
+	"BMD": "$", "BND": "$", "BOB": "Bs", "BOV": "", "BRL": "R$", "BSD": "$", "BTN": "Nu.", "BWP": "P",
+	"BYN": "Br", "BZD": "$", "CAD": "CA$", "CDF": "FC", "CHE": "", "CHF": "Fr.", "CHW": "", "CLF": "UF",
+	"CLP": "$", "CNY": "\u00A5", "COP": "$", "COU": "", "CRC": "\u20A1", "CUC": "CUC$", "CUP": "$", "CVE": "$",
+	"CZK": "K\u010D", "DJF": "Fdj", "DKK": "kr", "DOP": "RD$", "DZD": "\u062F.\u062C", "EGP": "E\u00A3", "ERN": "Nfk", "ETB": "Br",
+	"EUR": "\u20AC", "FJD": "FJ$", "FKP": "\u00A3", "GBP": "\u00A3", "GEL": "\u20BE", "GHS": "\u20B5", "GIP": "\u00A3", "GMD": "D",
+	"GNF": "FG", "GTQ": "Q", "GYD": "G$", "HKD": "HK$", "HNL": "L", "HTG": "G", "HUF": "Ft", "IDR": "Rp",
+	"ILS": "\u20AA", "INR": "\u20B9", "IQD": "\u0639.\u062F", "IRR": "\uFDFC", "ISK": "kr", "JMD": "J$", "JOD": "\u062F.\u0627", "JPY": "\u00A5",
+	"KES": "KSh", "KGS": "\u0441\u043E\u043C", "KHR": "\u17DB", "KMF": "CF", "KPW": "\u20A9", "KRW": "\u20A9", "KWD": "\u062F.\u0643", "KYD": "CI$",
+	"KZT": "\u20B8", "LAK": "\u20AD", "LBP": "\u0644.\u0644", "LKR": "Rs", "LRD": "L$", "LSL": "L", "LYD": "\u0644.\u062F", "MAD": "\u062F.\u0645.",
+	"MDL": "L", "MGA": "Ar", "MKD": "\u0434\u0435\u043D", "MMK": "K", "MNT": "\u20AE", "MOP": "MOP$", "MRU": "UM", "MUR": "\u20A8",
+	"MVR": "Rf", "MWK": "MK", "MXN": "$", "MXV": "", "MYR": "RM", "MZN": "MT", "NAD": "N$", "NGN": "\u20A6",
+	"NIO": "C$", "NOK": "kr", "NPR": "\u20A8", "NZD": "NZ$", "OMR": "\u0631.\u0639.", "PAB": "B/.", "PEN": "S/", "PGK": "K",
+	"PHP": "\u20B1", "PKR": "\u20A8", "PLN": "z\u0142", "PYG": "\u20B2", "QAR": "\u0631.\u0642", "RON": "lei", "RSD": "\u0434\u0438\u043D.", "RUB": "\u20BD",
+	"RWF": "FRw", "SAR": "\u0631.\u0633", "SBD": "SI$", "SCR": "SRe", "SDG": "\u062C.\u0633.", "SEK": "kr", "SGD": "S$", "SHP": "\u00A3",
+	"SLE": "Le", "SLL": "Le", "SOS": "Sh", "SRD": "$", "SSP": "\u00A3", "STN": "Db", "SVC": "\u20A1", "SYP": "\u00A3",
+	"SZL": "E", "THB": "\u0E3F", "TJS": "SM", "TMT": "m", "TND": "\u062F.\u062A", "TOP": "T$", "TRY": "\u20BA", "TTD": "TT$",
+	"TWD": "NT$", "TZS": "TSh", "UAH": "\u20B4", "UGX": "USh", "USD": "$", "USN": "", "UYI": "", "UYU": "$U",
+	"UYW": "", "UZS": "so\u02BBm", "VED": "Bs.D", "VES": "Bs.S", "VND": "\u20AB", "VUV": "VT", "WST": "WS$", "XAF": "FCFA",
+	"XAG": "", "XAU": "", "XBA": "", "XBB": "", "XBC": "", "XBD": "", "XCD": "EC$", "XDR": "SDR",
+	"XOF": "CFA", "XPD": "", "XPF": "\u20A3", "XPT": "", "XSU": "Sucre", "XUA": "", "YER": "\uFDFC", "ZAR": "R",
+	"ZMW": "ZK", "ZWG": "ZiG", "ZWL": "Z$"
+}
+
+SYMBOLS = tuple(dict.fromkeys(symbol for symbol in CURRENCIES.values() if symbol))
+
+CODES = tuple(CURRENCIES)
+
+# ----------------------------------------
+
+def group(base: str, separator: str, primary: int = 3, secondary: int = 3):
+	"""
+	Group integer digits using the specified separator, i.e., the rightmost group by the primary size, and all the other groups by the secondary size, e.g., '12,34,567' for the Indian lakh grouping.\n
+	The groups are sliced in a single pass and joined once.
+	"""
+	if len(base) <= primary:
+		return base
+	head, tail = base[:-primary], base[-primary:]
+	first = len(head) % secondary or secondary
+	return separator.join([head[:first]] + [head[i:i+secondary] for i in range(first, len(head), secondary)] + [tail])
+
+def localize(amount: digit.Amount, details: LocaleDetails):
+	"""
+	Format the amount without its scope using the group separator, the decimal separator, and the grouping of the locale.
+	"""
+	base, point, decimal = amount.string_no_scope.partition(general.Separator.DOT.value)
+	return group(base, details.group, details.primary, details.secondary) + (details.decimal if point else "") + decimal
+
+@functools.lru_cache(maxsize = None)
+def affixes(name: str, scope: str) -> tuple[tuple[str, str], ...]:
+	"""
+	Get the prefix and the suffix of the locale's formatted amount with the specified scope, without a currency, and with each currency symbol and code.\n
+	Currency codes are always spaced, as they are letters.\n
+	Affixes are precomputed per locale and scope, so each entry is rendered with a single string concatenation.
+	"""
+	details = LOCALES[name]
+	tmp = [(scope, "")]
+	for currencies, spacing in [(SYMBOLS, details.spacing), (CODES, details.spacing or " ")]:
+		for currency in currencies:
+			tmp.append((scope, spacing + currency) if details.suffix else (scope + currency + spacing, ""))
+	return tuple(tmp)
+
+def render(amount: digit.Amount, names: tuple[str, ...]) -> list[str]:
+	"""
+	Render the amount in each of the specified locales, without a currency, and with each currency symbol and code.\n
+	The amount is formatted once per locale, so the time spent grows linearly with the number of locales.
+	"""
+	tmp = []
+	scope = amount.scope.value
+	for name in names:
+		value = localize(amount, LOCALES[name])
+		tmp.extend(prefix + value + suffix for prefix, suffix in affixes(name, scope))
+	return tmp
+
+def validate_locales(value: str) -> tuple[list[str], str]:
+	"""
+	Validate comma-separated locale names.\n
+	Returns an empty list and an error message on failure.
+	"""
+	tmp = []
+	message = ""
+	if value:
+		names = array.remove_empty_strings(value.lower().split(","))
+		if not names:
+			message = "No locales were specified"
+		else:
+			for name in names:
+				if name == "all":
+					tmp.extend(LOCALES)
+				elif name not in LOCALES:
+					tmp = []
+					message = f"Supported locales are {', '.join(LOCALES)}, or 'all'"
+					break
+				else:
+					tmp.append(name)
+			tmp = array.unique(tmp)
+	return tmp, message
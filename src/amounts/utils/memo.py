@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+from . import digit
+
+import collections, threading, typing
+
+SIZE = 256
+
+class Memo:
+
+	def __init__(self, size: int = SIZE):
+		"""
+		Class for memoising the entries of categories in a size-bounded LRU cache keyed by the inputs each category depends on.\n
+		Shared by all the amounts in a process, e.g., by all quotes of a wordlist, all rows of a batch handled by the same worker, and all requests of a server.
+		"""
+		self.__size    = size
+		self.__entries = collections.OrderedDict()
+		self.__lock    = threading.Lock()
+
+	def get(self, key: tuple, function: typing.Callable[[], typing.Iterable[str]]) -> tuple[tuple[str, ...], bool]:
+		"""
+		Get the memoised entries for the key, or generate them with the function and memoise them.\n
+		Returns the entries, and 'True' on a cache hit.\n
+		Lookups are not locked, as a single lookup is atomic, and an entry evicted by another thread in the meantime is still returned.
+		"""
+		entries = self.__entries.get(key)
+		if entries is not None:
+			try:
+				self.__entries.move_to_end(key)
+			except KeyError:
+				pass
+			return entries, True
+		entries = tuple(function())
+		with self.__lock:
+			self.__entries[key] = entries
+			while len(self.__entries) > self.__size:
+				self.__entries.popitem(last = False)
+		return entries, False
+
+	def clear(self):
+		"""
+		Remove all the memoised entries.
+		"""
+		with self.__lock:
+			self.__entries.clear()
+
+def key(amount: digit.Amount | None) -> tuple[str, str] | None:
+	"""
+	Get the part of a memoisation key that identifies an amount.\n
+	Enum values are used instead of enum members, as enum members are slower to hash.
+	"""
+	return (amount.string, amount.type.value) if amount else None
+
+CACHE = Memo()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+
+from . import digit, general
+
+import typing
+
+ENCODING = "UTF-8"
+
+CHUNK_SIZE = 64 * 1024
+
+MIN_LENGTH = 1024
+
+class Payload:
+
+	__slots__ = ("prefix", "char", "count", "suffix")
+
+	def __init__(self, prefix: str, char: str, count: int, suffix: str = ""):
+		"""
+		Class for storing a long entry as a prefix, a single ASCII character repeated the specified number of times, and a suffix, without materializing it.\n
+		Written in chunks of memoryviews over a single shared block, so a multi-megabyte entry never exists in memory as a whole.
+		"""
+		self.prefix = prefix
+		self.char   = char
+		self.count  = count
+		self.suffix = suffix
+
+	def __len__(self):
+		return len(self.prefix) + self.count + len(self.suffix)
+
+	def __eq__(self, other: typing.Any):
+		return isinstance(other, Payload) and (self.prefix, self.char, self.count, self.suffix) == (other.prefix, other.char, other.count, other.suffix)
+
+	def __hash__(self):
+		return hash((self.prefix, self.char, self.count, self.suffix))
+
+	def __repr__(self):
+		return f"Payload({self.prefix!r} + {self.char!r} * {self.count} + {self.suffix!r})"
+
+	def __str__(self):
+		return self.prefix + self.char * self.count + self.suffix
+
+	def chunks(self) -> typing.Iterator[bytes | memoryview]:
+		"""
+		Generate the encoded entry in chunks of at most 'CHUNK_SIZE' bytes.\n
+		Repeated characters are memoryviews over a single block shared by all entries with the same character.
+		"""
+		if self.prefix:
+			yield self.prefix.encode(ENCODING)
+		block = _block(self.char)
+		for i in range(self.count // CHUNK_SIZE):
+			yield block
+		remainder = self.count % CHUNK_SIZE
+		if remainder:
+			yield block[:remainder]
+		if self.suffix:
+			yield self.suffix.encode(ENCODING)
+
+	def write(self, stream: typing.BinaryIO) -> int:
+		"""
+		Write the encoded entry to a binary stream in chunks.\n
+		Returns the number of bytes written.
+		"""
+		tmp = 0
+		for chunk in self.chunks():
+			stream.write(chunk)
+			tmp += len(chunk)
+		return tmp
+
+_blocks: dict[str, memoryview] = {}
+
+def _block(char: str) -> memoryview:
+	"""
+	Get a shared block of the specified character repeated 'CHUNK_SIZE' times.
+	"""
+	block = _blocks.get(char)
+	if block is None:
+		block = _blocks[char] = memoryview((char * CHUNK_SIZE).encode(ENCODING))
+	return block
+
+def crc32(entry: str | Payload) -> int:
+	"""
+	Get the CRC-32 checksum of an encoded entry, computed in chunks for payloads.
+	"""
+	import zlib
+	if not isinstance(entry, Payload):
+		return zlib.crc32(entry.encode(ENCODING))
+	tmp = 0
+	for chunk in entry.chunks():
+		tmp = zlib.crc32(chunk, tmp)
+	return tmp
+
+# ----------------------------------------
+
+def lengths(maximum: int) -> list[int]:
+	"""
+	Get a ladder of lengths, i.e., the powers of two from 'MIN_LENGTH' up to the maximum length, and the maximum length itself.
+	"""
+	tmp = []
+	length = MIN_LENGTH
+	while length <= maximum:
+		tmp.append(length)
+		length *= 2
+	if maximum not in tmp:
+		tmp.append(maximum)
+	return tmp
+
+def ladder(maximum: int) -> typing.Iterator[Payload]:
+	"""
+	Test long digits, decimals, and scoped values for each length in the ladder.
+	"""
+	point = general.Separator.DOT.value
+	for length in lengths(maximum):
+		yield Payload("", "9", length)
+		yield Payload("0" + point, "9", length - 2)
+		yield Payload(digit.Scope.MINUS.value, "9", length - 1)
+
+def validate_length(value: str) -> tuple[int | None, str]:
+	"""
+	Validate a length in bytes with an optional 'K', 'M', or 'G' binary suffix, e.g., '8M'.\n
+	Returns 'None' and an error message on failure.
+	"""
+	tmp = general.parse_size(value)
+	message = ""
+	if tmp is None or not MIN_LENGTH <= tmp <= general.SIZE_UNITS["g"]:
+		tmp = None
+		message = f"Maximum length must be between {MIN_LENGTH} and 1G bytes, with an optional 'K', 'M', or 'G' suffix, e.g., '8M'"
+	return tmp, message
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+from . import digit, wordlist
+
+import array, decimal, heapq, typing
+
+BOUNDARY = 100
+
+OUT_OF_RANGE = 90
+
+SPECIAL = 80
+
+NOTATION = 70
+
+TYPE_CONFUSION = 65
+
+IN_RANGE = 45
+
+LONG = 42
+
+FORMATTING = 40
+
+NOTATIONS = ("0x", "0b", "-0x", "-0b", "\\x", "\\u", "&h")
+
+CONFUSIONS = ("", "(", "[", "{", "<", "\x22", "\x27", "\x60")
+
+class Scorer:
+
+	def __init__(self, minimum: digit.Amount | None, maximum: digit.Amount | None):
+		"""
+		Class for scoring entries by their expected impact, from the highest to the lowest:\n
+		- the overflow of the maximum amount, the underflow of the minimum amount, and the minimum and maximum amounts themselves,\n
+		- numeric values outside the range,\n
+		- NaNs and infinities,\n
+		- binary, hexadecimal, exponential, and escaped notations,\n
+		- type confusion, i.e., empty values, brackets, and quotes,\n
+		- numeric values inside the range, the closer to the minimum or maximum amount, the higher, up to 'TYPE_CONFUSION',\n
+		- long values,\n
+		- other formatting, e.g., separators, currencies, and locales.
+		"""
+		self.__minimum = minimum.numeric if minimum else None
+		self.__maximum = maximum.numeric if maximum else None
+		self.__range   = self.__maximum - self.__minimum if minimum and maximum else None
+		self.__exact   = {}
+		for amount, flow in [(minimum, "underflow"), (maximum, "overflow")]:
+			if amount:
+				self.__exact[amount.string] = BOUNDARY
+				self.__exact[getattr(amount, flow)] = BOUNDARY
+
+	def score(self, entry: typing.Any) -> int:
+		"""
+		Score an entry.
+		"""
+		if not isinstance(entry, str):
+			return LONG
+		score = self.__exact.get(entry)
+		if score is not None:
+			return score
+		try:
+			value = decimal.Decimal(entry)
+		except decimal.InvalidOperation:
+			if entry.lower().startswith(NOTATIONS):
+				return NOTATION
+			if entry[:1] in CONFUSIONS:
+				return TYPE_CONFUSION
+			return FORMATTING
+		if not value.is_finite():
+			return SPECIAL
+		if (self.__minimum is not None and value < self.__minimum) or (self.__maximum is not None and value > self.__maximum):
+			return OUT_OF_RANGE
+		if "e" in entry or "E" in entry:
+			return NOTATION
+		if self.__range:
+			distance = min(value - self.__minimum, self.__maximum - value)
+			return IN_RANGE + int((TYPE_CONFUSION - IN_RANGE - 1) * (1 - 2 * distance / self.__range))
+		return IN_RANGE
+
+def rank(iterable: typing.Iterable[str], scorer: Scorer) -> typing.Iterator[str]:
+	"""
+	Generate all entries from the highest to the lowest score.\n
+	Entries are kept in a compact wordlist, and their indexes are sorted by score with a counting sort into an 'array("Q")' per score, so entries with the same score keep their order.
+	"""
+	entries = wordlist.Wordlist()
+	buckets: dict[int, array.array] = {}
+	for entry in iterable:
+		score = scorer.score(entry)
+		bucket = buckets.get(score)
+		if bucket is None:
+			bucket = buckets[score] = array.array("Q")
+		bucket.append(len(entries))
+		entries.append(entry)
+	for score in sorted(buckets, reverse = True):
+		for index in buckets[score]:
+			yield entries[index]
+
+def top(iterable: typing.Iterable[str], scorer: Scorer, count: int) -> list[str]:
+	"""
+	Select the specified number of entries with the highest scores, from the highest to the lowest score, with a heap of at most the specified number of entries.\n
+	Entries with the same score keep their order.\n
+	Takes 'O(total * log(count))' time and 'O(count)' memory.
+	"""
+	return heapq.nlargest(count, iterable, key = scorer.score)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+
+from . import array, fuzz
+
+import dataclasses, enum, functools, typing
+
+GROUP = "amounts.categories"
+
+class Input(enum.Enum):
+	"""
+	Enum containing the inputs a category can depend on.
+	"""
+	MINIMUM = "minimum"
+	MAXIMUM = "maximum"
+	MIDDLE  = "middle"
+	QUOTE   = "quote"
+	IGNORE  = "ignore"
+
+	@classmethod
+	def all(cls):
+		"""
+		Get all inputs.
+		"""
+		return [cls.MINIMUM, cls.MAXIMUM, cls.MIDDLE, cls.QUOTE, cls.IGNORE]
+
+@dataclasses.dataclass(frozen = True)
+class Category:
+	"""
+	Class for storing a fuzz category, i.e., its name, the inputs it depends on, a function that generates its entries from the inputs passed as keyword arguments, and the representations of the middle amount it uses.\n
+	The entries of a category are memoised on its inputs, so a category must not depend on anything else.
+	"""
+	name           : str
+	inputs         : tuple[Input, ...]
+	function       : typing.Callable[..., typing.Iterable[str]]
+	representations: tuple[str, ...] = ()
+
+BUILTIN = (
+	Category("separators", (Input.MIDDLE,), fuzz.separators, ("string", "string_no_scope", "scope")),
+	Category("zeros"     , (Input.MIDDLE,), fuzz.zeros, ("string", "string_no_scope", "scope")),
+	Category("scopes"    , (Input.MIDDLE,), fuzz.scopes, ("string", "string_no_scope", "scope")),
+	Category("currencies", (Input.MIDDLE,), fuzz.currencies, ("string", "string_no_scope", "scope")),
+	Category("brackets"  , (Input.MIDDLE, Input.QUOTE, Input.IGNORE), fuzz.brackets, ("string", "underflow")),
+	Category("flows"     , (Input.MINIMUM, Input.MAXIMUM, Input.IGNORE), fuzz.flows),
+	Category("notations" , (Input.MINIMUM, Input.MAXIMUM, Input.MIDDLE, Input.IGNORE), fuzz.notations, ("string", "numeric", "bin", "hex", "hex_no_fp", "byte", "unicode")),
+	Category("other"     , (Input.MIDDLE, Input.IGNORE), fuzz.other, ("string", "string_no_scope", "scope")),
+	Category("lengths"   , (Input.IGNORE,), fuzz.lengths)
+)
+
+REGISTERED: dict[str, Category] = {}
+
+VERSIONS: dict[str, str] = {}
+
+def register(category: Category):
+	"""
+	Register a category, e.g., from a library, in addition to the categories loaded from the 'amounts.categories' entry points.\n
+	Category names are selected case-insensitively, so a name must be lowercase, and must not contain commas.\n
+	Raises 'ValueError' if a category with the same name already exists, if its name is invalid, or if the category depends on an unknown input.
+	"""
+	if category.name in [builtin.name for builtin in BUILTIN] or category.name in REGISTERED:
+		raise ValueError(f"Category '{category.name}' already exists")
+	if not category.name or "," in category.name or category.name != category.name.lower() or any(not isinstance(input, Input) for input in category.inputs):
+		raise ValueError(f"Category '{category.name}' is invalid")
+	REGISTERED[category.name] = category
+
+@functools.cache
+def __load() -> dict[str, str]:
+	"""
+	Load and register the categories of the 'amounts.categories' entry points, once, in the order of their names.\n
+	An entry point must refer to a 'Category', and should have the same name.\n
+	An entry point that cannot be loaded is skipped with a 'RuntimeWarning', so a single broken plugin does not break every run.\n
+	The name and the version of the distribution of each loaded category are recorded, e.g., to invalidate cached wordlists when a plugin is upgraded.\n
+	Returns an error message for each entry point that cannot be loaded, by its name.
+	"""
+	import importlib.metadata, warnings
+	tmp = {}
+	for entry_point in sorted(importlib.metadata.entry_points(group = GROUP), key = lambda entry_point: entry_point.name):
+		try:
+			category = entry_point.load()
+			if not isinstance(category, Category):
+				raise TypeError("not a category")
+			register(category)
+			if entry_point.dist:
+				VERSIONS[category.name] = f"{entry_point.dist.name} {entry_point.dist.version}"
+		except Exception as ex:
+			tmp[entry_point.name.lower()] = f"Cannot load the category '{entry_point.name}': {ex}"
+			warnings.warn(f"Skipping the category '{entry_point.name}': {ex}", RuntimeWarning)
+	return tmp
+
+def categories() -> list[Category]:
+	"""
+	Get all built-in and third-party categories, in the order they are generated in.\n
+	Third-party categories are generated after the built-in categories.
+	"""
+	return list(BUILTIN) + list(REGISTERED.values())
+
+def plugins(selected: typing.Iterable[Category]) -> dict[str, str | None]:
+	"""
+	Get the distribution name and version of each selected third-party category, or 'None' for the categories registered from Python.
+	"""
+	return {category.name: VERSIONS.get(category.name) for category in selected if category.name in REGISTERED}
+
+def representations(selected: typing.Iterable[Category]) -> set[str]:
+	"""
+	Get the representations of the middle amount used by the selected categories.
+	"""
+	return {name for category in selected for name in category.representations}
+
+def validate_categories(only: str, skip: str) -> tuple[list[Category], str]:
+	"""
+	Validate comma-separated category names to generate only, and to skip.\n
+	Third-party categories are loaded from the 'amounts.categories' entry points first, and the ones that cannot be loaded are skipped, unless they are specified to generate only.\n
+	Returns all categories if no names are specified, or an empty list and an error message on failure.
+	"""
+	broken = __load()
+	tmp = categories()
+	message = ""
+	supported = [category.name for category in tmp]
+	for value, keep in [(only, True), (skip, False)]:
+		if value:
+			names = array.remove_empty_strings(value.lower().split(","))
+			unknown = [name for name in names if name not in supported and name not in broken]
+			if not names:
+				message = "No categories were specified"
+			elif unknown:
+				message = f"Supported categories are {', '.join(supported)}"
+			elif keep and any(name in broken for name in names):
+				message = ("\n").join(broken[name] for name in names if name in broken)
+			else:
+				tmp = [category for category in tmp if (category.name in names) == keep]
+				continue
+			tmp = []
+			break
+	if not message and not tmp:
+		message = "At least one category must be generated"
+	return tmp, message
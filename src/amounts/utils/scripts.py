@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+from . import array, digit
+
+DIGITS = "0123456789"
+
+SCRIPTS: dict[str, str] = {
+	"fullwidth"  : ("").join(chr(0xFF10 + i) for i in range(10)),
+	"arabic"     : ("").join(chr(0x0660 + i) for i in range(10)),
+	"persian"    : ("").join(chr(0x06F0 + i) for i in range(10)),
+	"devanagari" : ("").join(chr(0x0966 + i) for i in range(10)),
+	"bengali"    : ("").join(chr(0x09E6 + i) for i in range(10)),
+	"thai"       : ("").join(chr(0x0E50 + i) for i in range(10)),
+	"bold"       : ("").join(chr(0x1D7CE + i) for i in range(10)),
+	"monospace"  : ("").join(chr(0x1D7F6 + i) for i in range(10)),
+	"superscript": "\u2070\u00B9\u00B2\u00B3\u2074\u2075\u2076\u2077\u2078\u2079"
+}
+
+TABLES: dict[str, dict[int, str]] = {name: str.maketrans(DIGITS, digits) for name, digits in SCRIPTS.items()}
+
+TABLES["superscript"].update(str.maketrans({digit.Scope.MINUS.value: "\u207B", digit.Scope.PLUS.value: "\u207A"}))
+
+MIXED = "mixed"
+
+SEPARATOR = "\n"
+
+# ----------------------------------------
+
+def render(entries: list[str], names: tuple[str, ...]) -> list[str]:
+	"""
+	Translate the digits of all entries to each of the specified scripts.\n
+	If mixed-script forms are selected, also translate only the second half of each entry, so ASCII digits and the digits of the script are mixed in a single value.\n
+	All entries are joined once and translated with a single 'str.translate()' call per script, so no Python code runs per character.
+	"""
+	tmp = []
+	joined = SEPARATOR.join(entries)
+	mixed = MIXED in names
+	for name in names:
+		if name == MIXED:
+			continue
+		translated = joined.translate(TABLES[name]).split(SEPARATOR)
+		tmp.extend(translated)
+		if mixed:
+			tmp.extend(entry[:len(entry) // 2] + variant[len(entry) // 2:] for entry, variant in zip(entries, translated))
+	return tmp
+
+def validate_scripts(value: str) -> tuple[list[str], str]:
+	"""
+	Validate comma-separated digit script names.\n
+	Mixed-script forms require at least one script.\n
+	Returns an empty list and an error message on failure.
+	"""
+	tmp = []
+	message = ""
+	if value:
+		names = array.remove_empty_strings(value.lower().split(","))
+		if not names:
+			message = "No scripts were specified"
+		else:
+			for name in names:
+				if name == "all":
+					tmp.extend([*SCRIPTS, MIXED])
+				elif name != MIXED and name not in SCRIPTS:
+					tmp = []
+					message = f"Supported scripts are {', '.join(SCRIPTS)}, '{MIXED}', or 'all'"
+					break
+				else:
+					tmp.append(name)
+			tmp = array.unique(tmp)
+			if tmp == [MIXED]:
+				tmp = []
+				message = "Mixed-script forms require at least one script"
+	return tmp, message
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+
+from . import file, wordlist
+
+import collections, http.server, ipaddress, json, os, socket, socketserver, statistics, threading, time, typing, urllib.parse
+
+UNIX = "unix:"
+
+LOCALHOST = "localhost"
+
+SIZE = 256 * 1024 ** 2
+
+PARAMETERS = ["minimum", "maximum", "middle", "sweep", "quotes", "ignore", "dedup", "false_positive", "shard", "offset", "count", "combine", "limit", "sample", "seed", "max_length", "locales", "ieee754", "priority", "top", "only", "skip", "scripts", "encode", "variants", "profile"]
+
+class Cache:
+
+	def __init__(self, size: int = SIZE):
+		"""
+		Class for caching generated wordlists in an LRU cache keyed by normalized parameters, and bounded by the bytes used by the wordlists.\n
+		Also tracks the cache hit rate and request latencies.
+		"""
+		self.__size      = size
+		self.__bytes     = 0
+		self.__entries   = collections.OrderedDict()
+		self.__lock      = threading.Lock()
+		self.__hits      = 0
+		self.__misses    = 0
+		self.__errors    = 0
+		self.__latencies = collections.deque(maxlen = 1000)
+
+	def get(self, key: str) -> wordlist.Wordlist | None:
+		"""
+		Get a cached wordlist, and mark it as recently used.\n
+		Returns 'None' on a cache miss.
+		"""
+		with self.__lock:
+			results = self.__entries.get(key)
+			if results is None:
+				self.__misses += 1
+			else:
+				self.__hits += 1
+				self.__entries.move_to_end(key)
+			return results
+
+	def fits(self, memory: int) -> bool:
+		"""
+		Check if a wordlist of the specified size in bytes can be cached.
+		"""
+		return memory <= self.__size
+
+	def put(self, key: str, results: wordlist.Wordlist):
+		"""
+		Cache a wordlist, and evict the least recently used wordlists above the size limit in bytes.\n
+		A wordlist larger than the size limit on its own is not cached.
+		"""
+		memory = results.memory()
+		if memory > self.__size:
+			return
+		with self.__lock:
+			previous = self.__entries.pop(key, None)
+			if previous is not None:
+				self.__bytes -= previous.memory()
+			self.__entries[key] = results
+			self.__bytes += memory
+			while self.__bytes > self.__size:
+				self.__bytes -= self.__entries.popitem(last = False)[1].memory()
+
+	def record(self, latency: float, error: bool = False):
+		"""
+		Record the latency of a request in seconds.
+		"""
+		with self.__lock:
+			self.__latencies.append(latency)
+			if error:
+				self.__errors += 1
+
+	def stats(self) -> dict[str, typing.Any]:
+		"""
+		Get the cache hit rate, the bytes used by the cached wordlists, and the latencies of the most recent requests in milliseconds.
+		"""
+		with self.__lock:
+			lookups = self.__hits + self.__misses
+			latencies = sorted(latency * 1000 for latency in self.__latencies)
+			return {
+				"entries" : len(self.__entries),
+				"size"    : self.__size,
+				"bytes"   : self.__bytes,
+				"hits"    : self.__hits,
+				"misses"  : self.__misses,
+				"errors"  : self.__errors,
+				"hit_rate": self.__hits / lookups if lookups else 0,
+				"latency" : {
+					"requests": len(latencies),
+					"mean_ms" : statistics.fmean(latencies) if latencies else 0,
+					"p50_ms"  : latencies[len(latencies) // 2] if latencies else 0,
+					"p95_ms"  : latencies[int(len(latencies) * 0.95)] if latencies else 0,
+					"max_ms"  : latencies[-1] if latencies else 0
+				}
+			}
+
+# ----------------------------------------
+
+class Handler(http.server.BaseHTTPRequestHandler):
+
+	server_version = "Amounts"
+
+	wbufsize = file.BUFFER_SIZE
+
+	def log_message(self, format: str, *args: typing.Any):
+		pass
+
+	def do_GET(self):
+		start = time.perf_counter()
+		url = urllib.parse.urlsplit(self.path)
+		error = False
+		if url.path == "/stats":
+			self.__send(200, "application/json", json.dumps(self.server.cache.stats(), indent = "\t"))
+		elif url.path in ["/", "/generate"]:
+			error = not self.__generate(urllib.parse.parse_qs(url.query))
+		else:
+			error = True
+			self.__send(404, "text/plain", "Supported endpoints are '/generate' and '/stats'")
+		if url.path != "/stats":
+			self.server.cache.record(time.perf_counter() - start, error)
+
+	def __send(self, status: int, type: str, body: str):
+		"""
+		Send a complete response.
+		"""
+		data = body.encode(file.ENCODING)
+		self.send_response(status)
+		self.send_header("Content-Type", f"{type}; charset={file.ENCODING}")
+		self.send_header("Content-Length", str(len(data)))
+		self.end_headers()
+		self.wfile.write(data)
+
+	def __generate(self, query: dict[str, list[str]]):
+		"""
+		Stream a wordlist, either from the cache, or while generating it.\n
+		Generated entries are collected for the cache only until they exceed its size limit, so a large wordlist is never held in memory as a whole.\n
+		Random samples without a seed are never cached, the same as on the disk, as each request should get a new sample.\n
+		Returns 'False' if the parameters are invalid.
+		"""
+		from ..main import create
+		unknown = [name for name in query if name not in PARAMETERS]
+		try:
+			if unknown:
+				raise ValueError(f"Supported parameters are {', '.join(PARAMETERS)}")
+			parameters = {name: values[-1] for name, values in query.items()}
+			false_positive = float(parameters.get("false_positive") or 0.001)
+			offset = int(parameters.get("offset") or 0)
+			count = int(parameters["count"]) if parameters.get("count") else None
+			limit = int(parameters["limit"]) if parameters.get("limit") else None
+			seed = int(parameters["seed"]) if parameters.get("seed") else None
+			top = int(parameters["top"]) if parameters.get("top") else None
+			amounts = create(parameters.get("minimum", ""), parameters.get("maximum", ""), parameters.get("middle", ""), parameters.get("sweep", ""), parameters.get("quotes", ""), parameters.get("ignore", "").lower() in ["true", "yes", "y", "1"], parameters.get("dedup", ""), false_positive, parameters.get("shard", ""), offset, count, None, parameters.get("combine", "").lower() in ["true", "yes", "y", "1"], limit, parameters.get("sample", ""), seed, parameters.get("max_length", ""), parameters.get("locales", ""), parameters.get("ieee754", ""), "", parameters.get("priority", "").lower() in ["true", "yes", "y", "1"], top, parameters.get("only", ""), parameters.get("skip", ""), parameters.get("scripts", ""), parameters.get("encode", ""), parameters.get("variants", "").lower() in ["true", "yes", "y", "1"], parameters.get("profile", ""))
+		except ValueError as ex:
+			self.__send(400, "text/plain", str(ex))
+			return False
+		key = json.dumps(amounts.parameters(), sort_keys = True)
+		cacheable = limit is None or seed is not None
+		results = self.server.cache.get(key) if cacheable else None
+		self.send_response(200)
+		self.send_header("Content-Type", f"text/plain; charset={file.ENCODING}")
+		self.send_header("X-Cache", "HIT" if results is not None else "MISS")
+		self.end_headers()
+		collected = wordlist.Wordlist() if cacheable and results is None and self.server.cache.fits(0) else None
+		try:
+			if results is not None:
+				results.write(self.wfile)
+			else:
+				separator = ""
+				for entry in amounts.run():
+					try:
+						self.wfile.write((separator + entry).encode(file.ENCODING))
+					except TypeError:
+						self.wfile.write(separator.encode(file.ENCODING))
+						entry.write(self.wfile)
+					separator = "\n"
+					if collected is not None:
+						collected.append(entry)
+						if not self.server.cache.fits(collected.memory()):
+							collected = None
+			self.wfile.flush()
+		except (BrokenPipeError, ConnectionResetError):
+			return True
+		if collected is not None:
+			self.server.cache.put(key, collected)
+		return True
+
+class HTTPServer(http.server.ThreadingHTTPServer):
+
+	def __init__(self, address: tuple[str, int], cache: Cache):
+		"""
+		Class for serving wordlists over HTTP.
+		"""
+		self.cache = cache
+		super().__init__(address, Handler)
+
+class UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+
+	daemon_threads = True
+
+	def __init__(self, path: str, cache: Cache):
+		"""
+		Class for serving wordlists over HTTP on a Unix socket.\n
+		A stale socket file left behind by a previous run is replaced.
+		"""
+		self.cache = cache
+		if os.path.exists(path):
+			probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+			try:
+				probe.connect(path)
+				raise OSError(f"'{path}' is already in use")
+			except ConnectionRefusedError:
+				os.remove(path)
+			finally:
+				probe.close()
+		super().__init__(path, Handler)
+
+	def get_request(self):
+		request, address = super().get_request()
+		return request, ("unix", 0)
+
+	def server_close(self):
+		super().server_close()
+		if os.path.exists(self.server_address):
+			os.remove(self.server_address)
+
+# ----------------------------------------
+
+def __loopback(host: str) -> bool:
+	"""
+	Check if a host is 'localhost' or a loopback IP address.
+	"""
+	if host.lower() == LOCALHOST:
+		return True
+	try:
+		return ipaddress.ip_address(host).is_loopback
+	except ValueError:
+		return False
+
+def validate_address(value: str, public: bool = False) -> tuple[str | tuple[str, int] | None, str]:
+	"""
+	Validate a server address, either 'unix:/path/to/socket' or 'host:port'.\n
+	The host must be a loopback address, unless binding to other addresses is explicitly allowed.\n
+	Returns 'None' and an error message on failure.
+	"""
+	tmp = None
+	message = ""
+	if value.startswith(UNIX):
+		if not value[len(UNIX):]:
+			message = "Unix socket path is required"
+		else:
+			tmp = value[len(UNIX):]
+	else:
+		host, separator, port = value.rpartition(":")
+		host = host.strip("[]")
+		if not separator or not host or not port.isdigit() or not 0 < int(port) < 65536:
+			message = "Server address must be either 'unix:/path/to/socket' or 'host:port'"
+		elif not public and not __loopback(host):
+			message = "Server address must be a loopback address, e.g., '127.0.0.1:8080', use '-sp' to bind to other addresses"
+		else:
+			tmp = (host, int(port))
+	return tmp, message
+
+def serve(address: str | tuple[str, int], cache_size: int = SIZE):
+	"""
+	Serve wordlists until interrupted.
+	"""
+	cache = Cache(cache_size)
+	try:
+		server = UnixServer(address, cache) if isinstance(address, str) else HTTPServer(address, cache)
+	except OSError as ex:
+		print(f"Cannot start the server: {ex}")
+		return
+	with server:
+		where = f"{UNIX}{address}" if isinstance(address, str) else f"http://{address[0]}:{address[1]}"
+		print(f"Serving wordlists on '{where}', press CTRL + C to stop")
+		print("Endpoints: '/generate?middle=20&minimum=1&maximum=1000&quotes=all', '/stats'")
+		try:
+			server.serve_forever()
+		except KeyboardInterrupt:
+			print("")
+		print(json.dumps(cache.stats()))
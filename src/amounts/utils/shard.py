@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+import itertools, typing
+
+ENCODING = "UTF-8"
+
+def select(iterable: typing.Iterable[str], shard: int, total: int, checksum: typing.Callable[[typing.Any], int] | None = None) -> typing.Iterator[str]:
+	"""
+	Select the entries belonging to the specified one-based shard out of the specified number of shards.\n
+	Shards are disjoint and complete regardless of the order of the entries and deduplication.\n
+	The same entry can be generated from different middle amounts, categories, and quotes, so the shard is selected by the entry itself, and every shard still generates all the entries.\n
+	If specified, the checksum function is used instead of the CRC-32 checksum of the encoded entry, e.g., for entries that are not strings.
+	"""
+	shard -= 1
+	if checksum:
+		for entry in iterable:
+			if checksum(entry) % total == shard:
+				yield entry
+		return
+	import zlib
+	for entry in iterable:
+		if zlib.crc32(entry.encode(ENCODING)) % total == shard:
+			yield entry
+
+def window(iterable: typing.Iterable[str], offset: int, count: int | None) -> typing.Iterator[str]:
+	"""
+	Skip the specified number of entries, and stop after the specified number of entries.\n
+	Once the window is exhausted, no further entries are pulled, so no further entries are generated.
+	"""
+	return itertools.islice(iterable, offset, None if count is None else offset + count)
+
+def validate_shard(value: str) -> tuple[tuple[int, int] | None, str]:
+	"""
+	Validate a shard in the 'i/n' format, where 'i' is between one and 'n'.\n
+	Returns 'None' and an error message on failure.
+	"""
+	tmp = None
+	message = ""
+	shard, separator, total = value.partition("/")
+	if not separator or not shard.isdigit() or not total.isdigit() or not 1 <= int(shard) <= int(total):
+		message = "Shard must be in the 'i/n' format, where 'i' is between one and 'n', e.g., '1/4'"
+	else:
+		tmp = (int(shard), int(total))
+	return tmp, message
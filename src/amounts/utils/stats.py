@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+from . import dedup
+
+import enum, time, typing
+
+class Format(enum.Enum):
+	"""
+	Enum containing statistics report formats.
+	"""
+	TEXT = "text"
+	JSON = "json"
+
+	@classmethod
+	def all(cls):
+		"""
+		Get all statistics report formats.
+		"""
+		return [cls.TEXT, cls.JSON]
+
+class Stats:
+
+	def __init__(self, hook: typing.Callable[[dict[str, typing.Any]], typing.Any] | None = None):
+		"""
+		Class for recording the time spent, the entries produced, and the duplicates removed per category, and the bytes written.\n
+		Time is measured only while a category is producing entries, so time spent by the consumer is not included.\n
+		A duplicate is attributed to the category that produced it, and the minimum, maximum, and middle amounts moved to the end are attributed to 'reorder'.\n
+		If specified, the hook is called with the report once the generation is exhausted or closed.
+		"""
+		self.__hook       = hook
+		self.__categories = {}
+		self.__current    = None
+		self.__unique     = 0
+		self.__hits       = 0
+		self.__misses     = 0
+		self.__start      = None
+		self.__elapsed    = 0.0
+		self.__bytes      = None
+		self.__writing    = 0.0
+
+	def measure(self, name: str, entries: typing.Callable[[], typing.Iterable[str]]) -> typing.Iterator[str]:
+		"""
+		Generate the entries of a category, and record the time spent producing them and their number.
+		"""
+		record = self.__categories.setdefault(name, [0.0, 0, 0])
+		clock = time.perf_counter
+		start = clock()
+		iterator = iter(entries())
+		record[0] += clock() - start
+		while True:
+			start = clock()
+			try:
+				entry = next(iterator)
+			except StopIteration:
+				record[0] += clock() - start
+				return
+			record[0] += clock() - start
+			record[1] += 1
+			self.__current = record
+			yield entry
+
+	def lookup(self, hit: bool):
+		"""
+		Record a cache hit or miss of the memoised categories.
+		"""
+		if hit:
+			self.__hits += 1
+		else:
+			self.__misses += 1
+
+	def hold(self):
+		"""
+		Stop counting the most recent entry, as it has been held back to be emitted later.
+		"""
+		if self.__current:
+			self.__current[1] -= 1
+
+	def deduplicate(self, deduplicator: dedup.Dedup, iterable: typing.Iterable[str]) -> typing.Iterator[str]:
+		"""
+		Remove duplicates from an iterable while streaming it, and attribute each duplicate to the category that produced it.
+		"""
+		for entry in iterable:
+			if deduplicator.add(entry):
+				yield entry
+			else:
+				deduplicator.dropped += 1
+				if self.__current:
+					self.__current[2] += 1
+
+	def count(self, iterable: typing.Iterable[str]) -> typing.Iterator[str]:
+		"""
+		Count the unique entries and the total time while streaming them, and call the hook once the iterable is exhausted or closed.
+		"""
+		self.__start = time.perf_counter()
+		try:
+			for entry in iterable:
+				self.__unique += 1
+				yield entry
+		finally:
+			self.__elapsed = time.perf_counter() - self.__start
+			if self.__hook:
+				self.__hook(self.report())
+
+	def written(self, size: int, elapsed: float):
+		"""
+		Record the number of bytes written and the time spent writing them, including the generation.
+		"""
+		self.__bytes = size
+		self.__writing = elapsed
+
+	def report(self) -> dict[str, typing.Any]:
+		"""
+		Get the report as a dictionary.
+		"""
+		elapsed = self.__elapsed if self.__elapsed or self.__start is None else time.perf_counter() - self.__start
+		tmp = {
+			"categories": {name: {"seconds": seconds, "entries": entries, "duplicates": duplicates} for name, (seconds, entries, duplicates) in self.__categories.items()},
+			"total": {
+				"seconds"   : elapsed,
+				"entries"   : sum(record[1] for record in self.__categories.values()),
+				"duplicates": sum(record[2] for record in self.__categories.values()),
+				"unique"    : self.__unique
+			},
+			"cache": {
+				"hits"     : self.__hits,
+				"misses"   : self.__misses,
+				"hit_ratio": self.__hits / (self.__hits + self.__misses) if self.__hits + self.__misses else 0
+			}
+		}
+		if self.__bytes is not None:
+			tmp["writer"] = {
+				"bytes"           : self.__bytes,
+				"seconds"         : self.__writing,
+				"bytes_per_second": self.__bytes / self.__writing if self.__writing else 0
+			}
+		return tmp
+
+	def summary(self, format: Format = Format.TEXT) -> str:
+		"""
+		Get the report as a table or as JSON.
+		"""
+		report = self.report()
+		if format == Format.JSON:
+			import json
+			return json.dumps(report)
+		tmp = [f"{'Category':<12} {'Seconds':>10} {'Entries':>12} {'Duplicates':>12}"]
+		for name, record in report["categories"].items():
+			tmp.append(f"{name:<12} {record['seconds']:>10.4f} {record['entries']:>12} {record['duplicates']:>12}")
+		total = report["total"]
+		tmp.append(f"{'Total':<12} {total['seconds']:>10.4f} {total['entries']:>12} {total['duplicates']:>12}")
+		tmp.append(f"Unique entries: {total['unique']}")
+		cache = report["cache"]
+		tmp.append(f"Cache: {cache['hits']} hits, {cache['misses']} misses ({cache['hit_ratio'] * 100:.1f}% hit ratio)")
+		if "writer" in report:
+			writer = report["writer"]
+			tmp.append(f"Written: {writer['bytes']} bytes in {writer['seconds']:.4f} seconds ({writer['bytes_per_second'] / 1024 / 1024:.2f} MiB/s)")
+		return ("\n").join(tmp)
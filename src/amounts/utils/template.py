@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+
+from . import digit, general
+
+import dataclasses, functools
+
+CATEGORIES = ("separators", "zeros", "scopes", "currencies", "brackets")
+
+MIDDLE_CATEGORIES = ("separators", "zeros", "scopes", "currencies")
+
+Field = tuple[str, ...]
+
+Template = tuple[str, Field, str]
+
+@dataclasses.dataclass(frozen = True)
+class Plan:
+	"""
+	Class for storing a flat plan of '(prefix, field, suffix)' templates, and the distinct fields they use.
+	"""
+	fields   : tuple[Field, ...]
+	templates: tuple[Template, ...]
+
+EMPTY           : Field = ("empty",)
+STRING          : Field = ("string",)
+STRING_NO_SCOPE : Field = ("string_no_scope",)
+
+def __grouped(separator: str) -> Field:
+	"""
+	Field of the amount without its scope, with its integer digits grouped by three using the specified separator.
+	"""
+	return ("grouped", separator)
+
+def __replaced(separator: str) -> Field:
+	"""
+	Field of the amount with its decimal point replaced with the specified separator.
+	"""
+	return ("replaced", separator)
+
+def __pair(infix: str) -> Field:
+	"""
+	Field of the amount, followed by the specified infix, followed by its underflow.
+	"""
+	return ("pair", infix)
+
+# ----------------------------------------
+
+def __separators(type: digit.Type, scope: digit.Scope) -> list[Template]:
+	"""
+	Compile 'fuzz.separators()'.
+	"""
+	return [(scope.value, __grouped(separator.value), "") for separator in [general.Separator.SPACE, general.Separator.COMMA, general.Separator.DOT]]
+
+def __zeros(type: digit.Type, scope: digit.Scope) -> list[Template]:
+	"""
+	Compile 'fuzz.zeros()'.
+	"""
+	zeros = "00"
+	tmp = [(scope.value + zeros, STRING_NO_SCOPE, "")]
+	for separator in [general.Separator.COMMA, general.Separator.DOT]:
+		separator = separator.value
+		if type == digit.Type.INTEGER:
+			tmp.append(("", STRING, separator + zeros))
+		elif type == digit.Type.DECIMAL:
+			tmp.extend([("", __replaced(separator), ""), ("", __replaced(separator), zeros)])
+	return tmp
+
+def __scopes(type: digit.Type, scope: digit.Scope) -> list[Template]:
+	"""
+	Compile 'fuzz.scopes()'.
+	"""
+	tmp = []
+	for scope in [digit.Scope.MINUS, digit.Scope.PLUS, digit.Scope.NONE]:
+		scope = scope.value
+		tmp.extend([(scope, STRING_NO_SCOPE, ""), ("", STRING_NO_SCOPE, scope)])
+	return tmp
+
+def __currencies(type: digit.Type, scope: digit.Scope) -> list[Template]:
+	"""
+	Compile 'fuzz.currencies()'.
+	"""
+	tmp = []
+	for currency in [general.Currency.USD, general.Currency.EUR, general.Currency.GBP]:
+		currency = currency.value
+		for scope in [digit.Scope.MINUS, digit.Scope.PLUS, digit.Scope.NONE]:
+			scope = scope.value
+			tmp.extend([(currency + scope, STRING_NO_SCOPE, ""), (scope + currency, STRING_NO_SCOPE, "")])
+	return tmp
+
+def __brackets(type: digit.Type, scope: digit.Scope, quote: general.Quote, ignore: bool) -> list[Template]:
+	"""
+	Compile 'fuzz.brackets()'.\n
+	Amounts never contain quotes, so enquoting them does not require escaping.
+	"""
+	tmp = []
+	quote = general.Quote.DOUBLE.value if quote == general.Quote.NONE else quote.value
+	separator = general.Separator.COMMA.value
+	for bracket in [general.Bracket.PARENTHESIS, general.Bracket.SQUARE, general.Bracket.CURLY]:
+		bracket = bracket.value
+		if not ignore:
+			tmp.extend([(bracket.left, EMPTY, bracket.right), (bracket.left + separator * 2, EMPTY, bracket.right)])
+		tmp.extend([
+			(bracket.left, STRING, bracket.right),
+			(bracket.left + quote, STRING, quote + bracket.right),
+			(bracket.left, __pair(separator), bracket.right),
+			(bracket.left + quote, __pair(quote + separator + quote), quote + bracket.right)
+		])
+	return tmp
+
+@functools.lru_cache(maxsize = None)
+def compile_plan(categories: tuple[str, ...], type: digit.Type, scope: digit.Scope, quote: general.Quote, ignore: bool) -> Plan:
+	"""
+	Compile the specified categories into a flat plan of '(prefix, field, suffix)' templates.\n
+	Plans are cached per category set, numeric type, scope, quote, and ignore flag.
+	"""
+	compilers = {
+		"separators": lambda: __separators(type, scope),
+		"zeros"     : lambda: __zeros(type, scope),
+		"scopes"    : lambda: __scopes(type, scope),
+		"currencies": lambda: __currencies(type, scope),
+		"brackets"  : lambda: __brackets(type, scope, quote, ignore)
+	}
+	tmp = []
+	for category in categories:
+		tmp.extend(compilers[category]())
+	return Plan(tuple(dict.fromkeys(field for prefix, field, suffix in tmp)), tuple(tmp))
+
+# ----------------------------------------
+
+def __separate(amount: digit.Amount, separator: str):
+	"""
+	Group the integer digits of the amount by three using the specified separator, without its scope.
+	"""
+	base, point, decimal = amount.string_no_scope.partition(general.Separator.DOT.value)
+	head = len(base) % 3 or 3
+	return separator.join([base[:head]] + [base[i:i+3] for i in range(head, len(base), 3)]) + point + decimal
+
+def __value(amount: digit.Amount, field: Field):
+	"""
+	Compute the value of a field for the amount.
+	"""
+	name = field[0]
+	if name == "empty":
+		return ""
+	elif name == "grouped":
+		return __separate(amount, field[1])
+	elif name == "replaced":
+		return amount.string.replace(general.Separator.DOT.value, field[1])
+	elif name == "pair":
+		return amount.string + field[1] + amount.underflow
+	return getattr(amount, name)
+
+def render(plan: Plan, amount: digit.Amount) -> list[str]:
+	"""
+	Render a plan for the amount.\n
+	Each field is computed once, and each entry is rendered with a single string concatenation.
+	"""
+	values = {field: __value(amount, field) for field in plan.fields}
+	return [prefix + values[field] + suffix for prefix, field, suffix in plan.templates]
@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 
-from . import array, config, digit, general
+from . import batch, boundary, cache, combine, config, dedup, digit, encoding, file, general, ieee754, locales, payload, registry, scripts, serve, shard, stats
 
-import argparse, sys, typing
+import argparse, os, sys
 
 class MyArgParser(argparse.ArgumentParser):
 
@@ -12,6 +12,15 @@ class MyArgParser(argparse.ArgumentParser):
 		print("Usage:   amounts [-min minimum] [-max maximum] -mid middle -o out         [-q quotes]")
 		print("Example: amounts [-min 1      ] [-max 1000   ] -mid 20     -o amounts.txt [-q double]")
 		print("")
+		print("Usage:   amounts [-min minimum] [-max maximum] -sw start:stop[:step] -o out         [-q quotes]")
+		print("Example: amounts [-min 1      ] [-max 1000   ] -sw 1:1000:7          -o amounts.txt [-q double]")
+		print("")
+		print("Usage:   amounts -b batch        -o out         [-q quotes]")
+		print("Example: amounts -b manifest.csv -o amounts.txt [-q double]")
+		print("")
+		print("Usage:   amounts -s address")
+		print("Example: amounts -s 127.0.0.1:8080")
+		print("")
 		print("DESCRIPTION")
 		print("    Generate a wordlist to fuzz amounts or any other numerical values")
 		print("MINIMUM")
@@ -31,13 +40,145 @@ class MyArgParser(argparse.ArgumentParser):
 		print("IGNORE")
 		print("    Ignore hardcoded values")
 		print("    -i, --ignore")
+		print("SWEEP")
+		print("    Generate the wordlist for every middle amount in an inclusive range instead of a single middle amount")
+		print("    Integer representations are computed in bulk")
+		print("    -sw, --sweep = 1:1000 | 1:1000000:7 | 1000:1:-1 | 0.5:10:0.5 | etc.")
+		print("BATCH")
+		print("    CSV or JSONL manifest with 'minimum', 'maximum', 'middle', 'quotes', 'ignore', 'profile', and optional 'name' columns")
+		print("    Quotes, ignore, and profile options are used for rows that leave them empty")
+		print("    Rows are processed in parallel across all CPU cores")
+		print("    -b, --batch = manifest.csv | manifest.jsonl | etc.")
+		print("DEDUP")
+		print("    Deduplication strategy")
+		print("    'exact' keeps all entries in memory, 'hash' keeps 64-bit fingerprints, 'bloom' uses a Bloom filter, 'none' keeps all duplicates")
+		print("    Default: exact")
+		print("    -d, --dedup = exact | hash | bloom | none")
+		print("FALSE POSITIVE")
+		print("    False positive rate of the Bloom filter, i.e., the share of unique entries wrongly dropped")
+		print("    Default: 0.001")
+		print("    -fp, --false-positive = 0.01 | etc.")
+		print("SHARD")
+		print("    Output only the specified shard out of the specified number of shards")
+		print("    Shards are disjoint and complete, and each entry always belongs to the same shard")
+		print("    -sh, --shard = 1/4 | 2/4 | etc.")
+		print("OFFSET")
+		print("    Skip the specified number of entries, e.g., to resume a previous run")
+		print("    Applied after the shard")
+		print("    -of, --offset = 1000 | etc.")
+		print("COUNT")
+		print("    Stop after the specified number of entries")
+		print("    Applied after the shard")
+		print("    -c, --count = 1000 | etc.")
+		print("COMBINE")
+		print("    Generate the full cross product of scopes, currency symbols, digit groupings, brackets, and quotes instead of the hand-picked categories")
+		print("    -cb, --combine")
+		print("ESTIMATE")
+		print("    Print the exact number of entries and the size in bytes of the combinatorial mode without generating them")
+		print("    -e, --estimate")
+		print("LIMIT")
+		print("    Select a sample of the specified number of entries in the combinatorial mode, in one pass and in constant memory")
+		print("    -l, --limit = 1000 | etc.")
+		print("SAMPLE")
+		print("    Sampling method")
+		print("    'random' selects a uniform random sample, 'stratified' selects one random entry from each of the equal consecutive parts of the product")
+		print("    Default: random")
+		print("    -sa, --sample = random | stratified")
+		print("SEED")
+		print("    Seed of the sampling method, so the same sample is selected on every run")
+		print("    -se, --seed = 1337 | etc.")
+		print("MAX LENGTH")
+		print("    Append long digits, decimals, and scoped values for the powers of two from 1K up to the maximum length, and the maximum length itself")
+		print("    Long values are written in chunks, and are never held in memory as a whole")
+		print("    -ml, --max-length = 64K | 8M | etc.")
+		print("LOCALES")
+		print("    Format the middle amount with each locale's grouping and separators, e.g., the Indian lakh grouping, Swiss apostrophes, and narrow no-break spaces")
+		print("    Each locale is also combined with each ISO 4217 currency symbol and code, before or after the amount as the locale does")
+		print("    Use comma-separated values")
+		print(f"    -lc, --locales = {' | '.join(locales.LOCALES)} | all")
+		print("SCRIPTS")
+		print("    Translate the digits of the middle amount and of its separators, zeros, scopes, and currencies to each script, e.g., to bypass parsers that accept non-ASCII digits")
+		print("    Mixed-script forms translate only the second half of each entry to each selected script")
+		print("    Use comma-separated values")
+		print(f"    -sc, --scripts = {' | '.join(scripts.SCRIPTS)} | {scripts.MIXED} | all")
+		print("PROFILE")
+		print("    Add the boundaries of each type profile, i.e., the edge values and their neighbours of integer, floating-point, and fixed-point column types")
+		print("    Integer widths from 8 to 128 bits, signed and unsigned, float32, float64, and 'decimal(p,s)', optionally prefixed by a database, e.g., 'postgres-numeric(12,2)'")
+		print("    Use comma-separated values")
+		print(f"    -pf, --profile = int32 | uint64 | float32 | decimal(12,2) | {' | '.join(f'{database}-...' for database in boundary.DATABASES)} | etc.")
+		print("IEEE 754")
+		print("    Add the bit patterns of the minimum, maximum, and middle amounts, their byte escape sequences, and their nearest representable neighbours at each precision")
+		print("    Use comma-separated values")
+		print("    -ie, --ieee754 = half | single | double | all")
+		print("SINCE")
+		print("    Output only the entries that are not already present in a previous wordlist in any output format, e.g., after an upgrade or a parameter change")
+		print("    The fingerprints of the previous wordlist are indexed once in '<since>.fpi' next to it, and the index is reused as long as the wordlist does not change")
+		print("    -si, --since = previous.txt | etc.")
+		print("PRIORITY")
+		print("    Rank the entries by their expected impact, e.g., boundaries, overflows, and notations first, and output them from the highest to the lowest rank")
+		print("    -pr, --priority")
+		print("TOP")
+		print("    Output only the specified number of the highest ranked entries, e.g., against rate-limited targets")
+		print("    Selected with a heap, so only the top entries are kept in memory")
+		print("    -t, --top = 100 | etc.")
+		print("ONLY")
+		print("    Generate only the specified categories, including third-party categories installed through the 'amounts.categories' entry points")
+		print("    Categories that are not generated, and the representations of the middle amount only they use, are never computed")
+		print("    Use comma-separated values")
+		print(f"    -on, --only = {' | '.join(category.name for category in registry.BUILTIN)} | etc.")
+		print("SKIP")
+		print("    Skip the specified categories")
+		print("    Use comma-separated values")
+		print("    -sk, --skip = notations | lengths | etc.")
+		print("ENCODE")
+		print("    Apply a chain of encoding stages, in the specified order, to each entry as it streams out, e.g., 'url,base64'")
+		print("    Use comma-separated values")
+		print(f"    -en, --encode = {' | '.join(stage.value for stage in encoding.Stage.all())}")
+		print("ENCODE VARIANTS")
+		print("    Keep each entry as it is, and add a variant for each encoding stage applied to it on its own, instead of the chain")
+		print("    -ev, --encode-variants")
+		print("STATS")
+		print("    Record the time spent, the entries produced, and the duplicates removed per category, and the bytes written")
+		print("    Print the statistics as a table or as a single line of JSON once the wordlist is generated")
+		print("    -st, --stats = text | json")
+		print("CACHE DIR")
+		print("    Cache the wordlists on disk in the specified directory, keyed by the options above, the output format, and the version")
+		print("    Cached wordlists are streamed from the disk instead of being generated again")
+		print("    -cd, --cache-dir = ~/.cache/amounts | etc.")
+		print("CACHE LIMIT")
+		print("    Total size of the cached wordlists, the least recently used ones are removed first")
+		print("    Default: 1G")
+		print("    -cl, --cache-limit = 512M | 8G | etc.")
+		print("CACHE STATS")
+		print("    Print the number of cached wordlists, their total size, and the hit rate, and exit")
+		print("    -cst, --cache-stats")
+		print("SERVE")
+		print("    Keep the process running, and serve wordlists over HTTP on a localhost port or a Unix socket")
+		print("    Endpoints: '/generate' with the same parameters as the options above, e.g., '?middle=20&minimum=1&quotes=all&ignore=true', and '/stats'")
+		print("    -s, --serve = 127.0.0.1:8080 | unix:/tmp/amounts.sock | etc.")
+		print("SERVE PUBLIC")
+		print("    Allow the server to bind to addresses other than the loopback addresses, e.g., '0.0.0.0:8080'")
+		print("    Anyone who can reach the address can use the server")
+		print("    -sp, --serve-public")
+		print("CACHE SIZE")
+		print("    Total size of the wordlists to keep in the server's LRU cache")
+		print("    Default: 256M")
+		print("    -cs, --cache-size = 64M | 1G | etc.")
+		print("FORMAT")
+		print("    Output format")
+		print("    'text' separates entries with newlines, 'nul' terminates entries with NUL characters, 'jsonl' writes a JSON string per line")
+		print("    'gzip' compresses the text format, 'indexed' writes a header, a payload, and an offsets table for random access")
+		print("    Default: text")
+		print("    -f, --format = text | nul | jsonl | gzip | indexed")
 		print("OUT")
 		print("    Output file")
-		print("    -o, --out = amounts.txt | etc.")
+		print("    Use '-' to stream the results to the standard output")
+		print("    In batch mode, if a directory is specified, the results of each row are saved to '<name>.txt' or another extension depending on the format, otherwise, to a single file tagged with row names")
+		print("    -o, --out = amounts.txt | - | etc.")
 
 	def error(self, message):
 		if len(sys.argv) > 1:
-			print("Missing a mandatory option (-mid, -o) and/or optional (-min, -max, -q)")
+			print("Missing a mandatory option (-mid, -sw, -b, or -s, and -o) and/or optional (-min, -max, -q, -i)")
 			print("Use -h or --help for more info")
 		else:
 			self.print_help()
@@ -52,10 +193,42 @@ class Validate:
 		self.__parser = MyArgParser()
 		self.__parser.add_argument("-min", "--minimum", required = False, type   = str         , default = ""   )
 		self.__parser.add_argument("-max", "--maximum", required = False, type   = str         , default = ""   )
-		self.__parser.add_argument("-mid", "--middle" , required = True , type   = str         , default = ""   )
+		self.__parser.add_argument("-mid", "--middle" , required = False, type   = str         , default = ""   )
 		self.__parser.add_argument("-q"  , "--quotes" , required = False, type   = str.lower   , default = ""   )
 		self.__parser.add_argument("-i"  , "--ignore" , required = False, action = "store_true", default = False)
-		self.__parser.add_argument("-o"  , "--out"    , required = True , type   = str         , default = ""   )
+		self.__parser.add_argument("-sw" , "--sweep"  , required = False, type   = str         , default = ""   )
+		self.__parser.add_argument("-b"  , "--batch"  , required = False, type   = str         , default = ""   )
+		self.__parser.add_argument("-d"  , "--dedup"  , required = False, type   = str.lower   , default = ""   )
+		self.__parser.add_argument("-fp" , "--false-positive", required = False, type = str   , default = ""   )
+		self.__parser.add_argument("-sh" , "--shard"  , required = False, type   = str         , default = ""   )
+		self.__parser.add_argument("-of" , "--offset" , required = False, type   = str         , default = ""   )
+		self.__parser.add_argument("-c"  , "--count"  , required = False, type   = str         , default = ""   )
+		self.__parser.add_argument("-cb" , "--combine", required = False, action = "store_true", default = False)
+		self.__parser.add_argument("-e"  , "--estimate", required = False, action = "store_true", default = False)
+		self.__parser.add_argument("-l"  , "--limit"  , required = False, type   = str         , default = ""   )
+		self.__parser.add_argument("-sa" , "--sample" , required = False, type   = str.lower   , default = ""   )
+		self.__parser.add_argument("-se" , "--seed"   , required = False, type   = str         , default = ""   )
+		self.__parser.add_argument("-ml" , "--max-length", required = False, type = str       , default = ""   )
+		self.__parser.add_argument("-lc" , "--locales", required = False, type   = str.lower   , default = ""   )
+		self.__parser.add_argument("-sc" , "--scripts", required = False, type   = str.lower   , default = ""   )
+		self.__parser.add_argument("-pf" , "--profile", required = False, type   = str.lower   , default = ""   )
+		self.__parser.add_argument("-ie" , "--ieee754", required = False, type   = str.lower   , default = ""   )
+		self.__parser.add_argument("-si" , "--since"  , required = False, type   = str         , default = ""   )
+		self.__parser.add_argument("-pr" , "--priority", required = False, action = "store_true", default = False)
+		self.__parser.add_argument("-t"  , "--top"    , required = False, type   = str         , default = ""   )
+		self.__parser.add_argument("-on" , "--only"   , required = False, type   = str.lower   , default = ""   )
+		self.__parser.add_argument("-sk" , "--skip"   , required = False, type   = str.lower   , default = ""   )
+		self.__parser.add_argument("-en" , "--encode" , required = False, type   = str.lower   , default = ""   )
+		self.__parser.add_argument("-ev" , "--encode-variants", required = False, action = "store_true", default = False)
+		self.__parser.add_argument("-st" , "--stats"  , required = False, type   = str.lower   , default = ""   )
+		self.__parser.add_argument("-cd" , "--cache-dir", required = False, type = str        , default = ""   )
+		self.__parser.add_argument("-cl" , "--cache-limit", required = False, type = str      , default = ""   )
+		self.__parser.add_argument("-cst", "--cache-stats", required = False, action = "store_true", default = False)
+		self.__parser.add_argument("-s"  , "--serve"  , required = False, type   = str         , default = ""   )
+		self.__parser.add_argument("-sp" , "--serve-public", required = False, action = "store_true", default = False)
+		self.__parser.add_argument("-cs" , "--cache-size", required = False, type = str       , default = ""   )
+		self.__parser.add_argument("-f"  , "--format" , required = False, type   = str.lower   , default = ""   )
+		self.__parser.add_argument("-o"  , "--out"    , required = False, type   = str         , default = ""   )
 
 	def validate_args(self):
 		"""
@@ -63,10 +236,27 @@ class Validate:
 		"""
 		self.__success = True
 		self.__args = self.__parser.parse_args()
-		self.__validate_minimum()
-		self.__validate_maximum()
-		self.__validate_middle()
+		self.__validate_cache()
+		if self.__args.cache_stats:
+			return self.__success, self.__args
+		self.__validate_amounts()
 		self.__validate_quotes()
+		self.__validate_dedup()
+		self.__validate_profile()
+		self.__validate_batch()
+		self.__validate_serve()
+		self.__validate_format()
+		self.__validate_shard()
+		self.__validate_stats()
+		self.__validate_combine()
+		self.__validate_length()
+		self.__validate_locales()
+		self.__validate_scripts()
+		self.__validate_ieee754()
+		self.__validate_since()
+		self.__validate_priority()
+		self.__validate_categories()
+		self.__validate_encode()
 		return self.__success, self.__args
 
 	def __error(self, message: str):
@@ -78,54 +268,272 @@ class Validate:
 
 	# ------------------------------------
 
-	def __is_amount(self, arg: typing.Any):
-		return isinstance(arg, digit.Amount)
+	def __validate_amounts(self):
+		if self.__args.serve:
+			if self.__args.minimum or self.__args.maximum or self.__args.middle or self.__args.sweep or self.__args.batch or self.__args.out:
+				self.__error("Minimum, maximum, and middle amounts, sweep, batch manifest, and output file cannot be used in server mode")
+		elif self.__args.batch:
+			if self.__args.minimum or self.__args.maximum or self.__args.middle or self.__args.sweep:
+				self.__error("Minimum, maximum, and middle amounts, and sweep cannot be used in batch mode")
+		elif self.__args.sweep:
+			if self.__args.middle:
+				self.__error("Middle amount and sweep cannot be used together")
+			else:
+				self.__validate_sweep()
+		elif not self.__args.middle:
+			self.__error("Missing a mandatory option (-mid), sweep (-sw), batch manifest (-b), or server address (-s)")
+		else:
+			self.__args.minimum, self.__args.maximum, self.__args.middle, messages = digit.validate_range(self.__args.minimum, self.__args.maximum, self.__args.middle)
+			for message in messages:
+				self.__error(message)
 
-	def __validate_minimum(self):
-		if self.__args.minimum:
-			self.__args.minimum, message = digit.validate_minimum(self.__args.minimum)
+	def __validate_sweep(self):
+		self.__args.minimum, self.__args.maximum, messages = digit.validate_limits(self.__args.minimum, self.__args.maximum)
+		for message in messages:
+			self.__error(message)
+		if self.__success:
+			self.__args.sweep, message = digit.validate_sweep(self.__args.sweep, self.__args.minimum, self.__args.maximum)
 			if message:
 				self.__error(message)
-			elif self.__is_amount(self.__args.maximum) and self.__args.minimum.numeric > self.__args.maximum.numeric:
-				self.__error("Minimum amount must be lesser than or equal to maximum amount")
+
+	def __validate_quotes(self):
+		self.__args.quotes, message = general.validate_quotes(self.__args.quotes)
+		if message:
+			self.__error(message)
+
+	def __validate_dedup(self):
+		if self.__args.dedup:
+			supported = [strategy.value for strategy in dedup.Strategy.all()]
+			if self.__args.dedup not in supported:
+				self.__error("Supported deduplication strategies are 'exact', 'hash', 'bloom', or 'none'")
+			else:
+				self.__args.dedup = dedup.Strategy(self.__args.dedup)
+		else:
+			self.__args.dedup = dedup.Strategy.EXACT
+		if self.__args.false_positive:
+			try:
+				self.__args.false_positive = float(self.__args.false_positive)
+				if not 0 < self.__args.false_positive < 1:
+					raise ValueError()
+			except ValueError:
+				self.__error("False positive rate must be greater than zero and lesser than one")
+		else:
+			self.__args.false_positive = 0.001
+
+	def __validate_serve(self):
+		if self.__args.serve:
+			self.__args.serve, message = serve.validate_address(self.__args.serve, self.__args.serve_public)
+			if message:
+				self.__error(message)
+		elif not self.__args.out and not self.__args.estimate:
+			self.__error("Missing a mandatory option (-o)")
+		elif self.__args.serve_public:
+			self.__error("Public server address can only be allowed in server mode")
+		if self.__args.cache_size:
+			self.__args.cache_size = general.parse_size(self.__args.cache_size)
+			if self.__args.cache_size is None:
+				self.__error("Cache size must be a non-negative integer, with an optional 'K', 'M', or 'G' suffix, e.g., '256M'")
 		else:
-			self.__args.minimum = None
+			self.__args.cache_size = serve.SIZE
 
-	def __validate_maximum(self):
-		if self.__args.maximum:
-			self.__args.maximum, message = digit.validate_maximum(self.__args.maximum)
+	def __validate_format(self):
+		if self.__args.format:
+			supported = [format.value for format in file.Format.all()]
+			if self.__args.format not in supported:
+				self.__error("Supported output formats are 'text', 'nul', 'jsonl', 'gzip', or 'indexed'")
+				return
+			self.__args.format = file.Format(self.__args.format)
+		else:
+			self.__args.format = file.Format.TEXT
+		if self.__args.format == file.Format.INDEXED and self.__args.out == file.STDOUT:
+			self.__error("Indexed output format cannot be streamed to the standard output")
+
+	def __validate_length(self):
+		if self.__args.max_length:
+			self.__args.max_length, message = payload.validate_length(self.__args.max_length)
 			if message:
 				self.__error(message)
-			elif self.__is_amount(self.__args.minimum) and self.__args.maximum.numeric < self.__args.minimum.numeric:
-				self.__error("Maximum amount must be greater than or equal to minimum amount")
+			elif self.__args.batch:
+				self.__error("Maximum length cannot be used in batch mode")
+			elif self.__args.serve:
+				self.__error("Maximum length cannot be used in server mode, use the 'max_length' parameter instead")
 		else:
-			self.__args.maximum = None
+			self.__args.max_length = 0
 
-	def __validate_middle(self):
-		self.__args.middle, message = digit.validate_middle(self.__args.middle)
+	def __validate_locales(self):
+		self.__args.locales, message = locales.validate_locales(self.__args.locales)
 		if message:
 			self.__error(message)
-		elif self.__is_amount(self.__args.minimum) and self.__args.middle.numeric < self.__args.minimum.numeric:
-			self.__error("Middle amount must be greater than or equal to minimum amount")
-		elif self.__is_amount(self.__args.maximum) and self.__args.middle.numeric > self.__args.maximum.numeric:
-			self.__error("Middle amount must be lesser than or equal to maximum amount")
+		elif self.__args.locales and self.__args.batch:
+			self.__error("Locales cannot be used in batch mode")
+		elif self.__args.locales and self.__args.serve:
+			self.__error("Locales cannot be used in server mode, use the 'locales' parameter instead")
+		elif self.__args.locales and self.__args.combine:
+			self.__error("Locales cannot be used in the combinatorial mode")
 
-	def __validate_quotes(self):
-		if self.__args.quotes:
-			types = array.remove_empty_strings(self.__args.quotes.split(","))
-			self.__args.quotes = []
-			if not types:
-				self.__error("No quotes were specified")
+	def __validate_scripts(self):
+		self.__args.scripts, message = scripts.validate_scripts(self.__args.scripts)
+		if message:
+			self.__error(message)
+		elif self.__args.scripts and self.__args.batch:
+			self.__error("Digit scripts cannot be used in batch mode")
+		elif self.__args.scripts and self.__args.serve:
+			self.__error("Digit scripts cannot be used in server mode, use the 'scripts' parameter instead")
+		elif self.__args.scripts and self.__args.combine:
+			self.__error("Digit scripts cannot be used in the combinatorial mode")
+
+	def __validate_profile(self):
+		self.__args.profile, message = boundary.validate_profiles(self.__args.profile)
+		if message:
+			self.__error(message)
+		elif self.__args.profile and self.__args.serve:
+			self.__error("Type profiles cannot be used in server mode, use the 'profile' parameter instead")
+		elif self.__args.profile and self.__args.combine:
+			self.__error("Type profiles cannot be used in the combinatorial mode")
+
+	def __validate_ieee754(self):
+		self.__args.ieee754, message = ieee754.validate_precisions(self.__args.ieee754)
+		if message:
+			self.__error(message)
+		elif self.__args.ieee754 and self.__args.batch:
+			self.__error("IEEE 754 precisions cannot be used in batch mode")
+		elif self.__args.ieee754 and self.__args.serve:
+			self.__error("IEEE 754 precisions cannot be used in server mode, use the 'ieee754' parameter instead")
+		elif self.__args.ieee754 and self.__args.combine:
+			self.__error("IEEE 754 precisions cannot be used in the combinatorial mode")
+
+	def __validate_since(self):
+		if self.__args.since:
+			if not os.path.isfile(self.__args.since):
+				self.__error("Previous wordlist does not exist or is not a file")
+			elif self.__args.batch or self.__args.serve:
+				self.__error("Previous wordlist cannot be used in batch or server mode")
+
+	def __validate_priority(self):
+		if self.__args.top:
+			if not self.__args.top.isdigit():
+				self.__error("Top must be a non-negative integer")
+			else:
+				self.__args.top = int(self.__args.top)
+		else:
+			self.__args.top = None
+		if (self.__args.priority or self.__args.top is not None) and self.__args.batch:
+			self.__error("Priority and top cannot be used in batch mode")
+		elif (self.__args.priority or self.__args.top is not None) and self.__args.serve:
+			self.__error("Priority and top cannot be used in server mode, use the 'priority' and 'top' parameters instead")
+
+	def __validate_categories(self):
+		selected = self.__args.only or self.__args.skip
+		self.__args.categories, message = registry.validate_categories(self.__args.only, self.__args.skip)
+		if message:
+			self.__error(message)
+		elif selected and self.__args.batch:
+			self.__error("Categories cannot be selected in batch mode")
+		elif selected and self.__args.serve:
+			self.__error("Categories cannot be selected in server mode, use the 'only' and 'skip' parameters instead")
+		elif selected and self.__args.combine:
+			self.__error("Categories cannot be selected in the combinatorial mode")
+
+	def __validate_encode(self):
+		self.__args.encode, message = encoding.validate_stages(self.__args.encode)
+		if message:
+			self.__error(message)
+		elif (self.__args.encode or self.__args.encode_variants) and self.__args.batch:
+			self.__error("Encoding stages cannot be used in batch mode")
+		elif (self.__args.encode or self.__args.encode_variants) and self.__args.serve:
+			self.__error("Encoding stages cannot be used in server mode, use the 'encode' and 'variants' parameters instead")
+		elif encoding.Stage.BASE64 in self.__args.encode and self.__args.max_length:
+			self.__error("Base64 encoding cannot be used with the maximum length")
+		elif self.__args.encode_variants and not self.__args.encode:
+			self.__error("Encoded variants require at least one encoding stage")
+
+	def __validate_combine(self):
+		if self.__args.limit:
+			if not self.__args.limit.isdigit():
+				self.__error("Limit must be a non-negative integer")
+			else:
+				self.__args.limit = int(self.__args.limit)
+		else:
+			self.__args.limit = None
+		if self.__args.sample:
+			supported = [method.value for method in combine.Sample.all()]
+			if self.__args.sample not in supported:
+				self.__error("Supported sampling methods are 'random' or 'stratified'")
 			else:
-				supported = [type.value for type in general.Quote.types()]
-				for type in types:
-					if type == "all":
-						self.__args.quotes.extend(general.Quote.all())
-					elif type not in supported:
-						self.__error("Supported quotes are 'none', 'single', 'double', 'backtick', or 'all'")
-						break
-					else:
-						self.__args.quotes.append(general.Quote.get(type))
-				self.__args.quotes = array.unique(self.__args.quotes)
-		else:
-			self.__args.quotes = [general.Quote.NONE]
+				self.__args.sample = combine.Sample(self.__args.sample)
+		else:
+			self.__args.sample = combine.Sample.RANDOM
+		if self.__args.seed:
+			if not self.__args.seed.lstrip("\x2D").isdigit():
+				self.__error("Seed must be an integer")
+			else:
+				self.__args.seed = int(self.__args.seed)
+		else:
+			self.__args.seed = None
+		if (self.__args.estimate or self.__args.limit is not None or self.__args.seed is not None) and not self.__args.combine:
+			self.__error("Estimate, limit, sampling method, and seed can only be used in the combinatorial mode")
+		if self.__args.combine and (self.__args.batch or self.__args.serve):
+			self.__error("Combinatorial mode cannot be used in batch or server mode")
+
+	def __validate_cache(self):
+		if self.__args.cache_limit:
+			self.__args.cache_limit = general.parse_size(self.__args.cache_limit)
+			if self.__args.cache_limit is None:
+				self.__error("Cache limit must be a non-negative integer, with an optional 'K', 'M', or 'G' suffix, e.g., '512M'")
+		else:
+			self.__args.cache_limit = cache.LIMIT
+		if self.__args.cache_dir:
+			self.__args.cache_dir = os.path.expanduser(self.__args.cache_dir)
+			if os.path.exists(self.__args.cache_dir) and not os.path.isdir(self.__args.cache_dir):
+				self.__error("Cache directory is not a directory")
+			elif self.__args.batch or self.__args.serve:
+				self.__error("Cache directory cannot be used in batch or server mode")
+		elif self.__args.cache_stats:
+			self.__error("Missing a mandatory option (-cd)")
+
+	def __validate_stats(self):
+		if self.__args.stats:
+			supported = [format.value for format in stats.Format.all()]
+			if self.__args.stats not in supported:
+				self.__error("Supported statistics formats are 'text' or 'json'")
+				return
+			self.__args.stats = stats.Format(self.__args.stats)
+			if self.__args.batch or self.__args.serve:
+				self.__error("Statistics cannot be recorded in batch or server mode")
+		else:
+			self.__args.stats = None
+
+	def __validate_shard(self):
+		if self.__args.shard:
+			self.__args.shard, message = shard.validate_shard(self.__args.shard)
+			if message:
+				self.__error(message)
+		else:
+			self.__args.shard = None
+		if self.__args.offset:
+			if not self.__args.offset.isdigit():
+				self.__error("Offset must be a non-negative integer")
+			else:
+				self.__args.offset = int(self.__args.offset)
+		else:
+			self.__args.offset = 0
+		if self.__args.count:
+			if not self.__args.count.isdigit():
+				self.__error("Count must be a non-negative integer")
+			else:
+				self.__args.count = int(self.__args.count)
+		else:
+			self.__args.count = None
+		if (self.__args.shard or self.__args.offset or self.__args.count is not None) and self.__args.batch:
+			self.__error("Shard, offset, and count cannot be used in batch mode")
+		elif (self.__args.shard or self.__args.offset or self.__args.count is not None) and self.__args.serve:
+			self.__error("Shard, offset, and count cannot be used in server mode, use the 'shard', 'offset', and 'count' parameters instead")
+
+	def __validate_batch(self):
+		if self.__args.batch:
+			if not os.path.isfile(self.__args.batch):
+				self.__error("Batch manifest does not exist or is not a file")
+			elif self.__success:
+				self.__args.batch, messages = batch.read_manifest(self.__args.batch, self.__args.quotes, self.__args.ignore, self.__args.profile)
+				for message in messages:
+					self.__error(message)
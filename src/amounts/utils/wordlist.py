@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+
+import array, typing
+
+ENCODING = "UTF-8"
+
+SEPARATOR = b"\n"
+
+def _digest(encoded: bytes) -> int:
+	"""
+	Get a non-zero unsigned 64-bit hash of an encoded entry.
+	"""
+	return (hash(encoded) & 0xFFFFFFFFFFFFFFFF) or 1
+
+class Wordlist:
+
+	def __init__(self, deduplicate: bool = False):
+		"""
+		Class for storing a wordlist compactly, i.e., all encoded entries in a single growable arena, each followed by a newline, and an 'array("Q")' of their end offsets, instead of a Python string per entry.\n
+		Objects that are not strings, e.g., long length payloads, are kept as they are, outside the arena.\n
+		If deduplication is enabled, duplicates are dropped with an open addressing hash table of entry indexes, compared directly against the arena.\n
+		The arena is written as a whole in the text format, without copying it.
+		"""
+		self.dropped       = 0
+		self.__data        = bytearray()
+		self.__offsets     = array.array("Q", [0])
+		self.__objects     = {}
+		self.__deduplicate = deduplicate
+		self.__hashes      = array.array("Q")
+		self.__table       = array.array("Q", bytes(8 * 16)) if deduplicate else None
+
+	def __len__(self):
+		return len(self.__offsets) - 1
+
+	def __getitem__(self, index: int) -> typing.Any:
+		if index < 0:
+			index += len(self)
+		if not 0 <= index < len(self):
+			raise IndexError("Entry index out of range")
+		return self.__get(index)
+
+	def __iter__(self) -> typing.Iterator[typing.Any]:
+		return map(self.__get, range(len(self)))
+
+	def __reduce__(self):
+		"""
+		Pickle the arena and the offsets as buffers, e.g., to return a wordlist from a worker process.
+		"""
+		return (Wordlist.from_buffers, (bytes(self.__data), self.__offsets.tobytes(), self.__objects, self.dropped))
+
+	@classmethod
+	def from_buffers(cls, data: bytes, offsets: bytes, objects: dict[int, typing.Any], dropped: int):
+		"""
+		Restore a pickled wordlist.\n
+		Deduplication is not restored, as the entries are already deduplicated.
+		"""
+		tmp = cls()
+		tmp.__data = bytearray(data)
+		tmp.__offsets = array.array("Q", offsets)
+		tmp.__objects = objects
+		tmp.dropped = dropped
+		return tmp
+
+	def __get(self, index: int) -> typing.Any:
+		"""
+		Get the entry stored at the specified index of the arena.
+		"""
+		if self.__objects and index in self.__objects:
+			return self.__objects[index]
+		return self.__data[self.__offsets[index]:self.__offsets[index + 1] - 1].decode(ENCODING)
+
+	def __slot(self, digest: int, encoded: bytes) -> tuple[int, int]:
+		"""
+		Find the slot of an encoded entry in the hash table.\n
+		Returns the slot, and the index of the entry plus one, or zero if the slot is empty.
+		"""
+		table = self.__table
+		mask = len(table) - 1
+		slot = digest & mask
+		data = self.__data
+		offsets = self.__offsets
+		size = len(encoded)
+		while True:
+			index = table[slot]
+			if not index:
+				return slot, 0
+			start = offsets[index - 1]
+			if self.__hashes[index - 1] == digest and offsets[index] - 1 - start == size and data.startswith(encoded, start):
+				return slot, index
+			slot = (slot + 1) & mask
+
+	def __grow(self):
+		"""
+		Double the size of the hash table, and re-insert all the entry indexes.
+		"""
+		self.__table = table = array.array("Q", bytes(16 * len(self.__table)))
+		mask = len(table) - 1
+		for index, digest in enumerate(self.__hashes, 1):
+			if digest:
+				slot = digest & mask
+				while table[slot]:
+					slot = (slot + 1) & mask
+				table[slot] = index
+
+	def append(self, entry: typing.Any) -> bool:
+		"""
+		Append an entry.\n
+		Returns 'False' if deduplication is enabled, and the entry has already been appended.
+		"""
+		index = len(self)
+		digest = 0
+		if isinstance(entry, str):
+			encoded = entry.encode(ENCODING)
+			if self.__deduplicate:
+				digest = _digest(encoded)
+				slot, found = self.__slot(digest, encoded)
+				if found:
+					self.dropped += 1
+					return False
+				self.__table[slot] = index + 1
+			self.__data += encoded
+		else:
+			self.__objects[index] = entry
+		self.__data += SEPARATOR
+		self.__offsets.append(len(self.__data))
+		if self.__deduplicate:
+			self.__hashes.append(digest)
+			if 2 * len(self) > len(self.__table):
+				self.__grow()
+		return True
+
+	def extend(self, iterable: typing.Iterable[typing.Any]):
+		"""
+		Append all entries of an iterable.
+		"""
+		append = self.append
+		for entry in iterable:
+			append(entry)
+
+	def memory(self):
+		"""
+		Get the number of bytes used by the arena, the offsets, and the hash table.
+		"""
+		tmp = len(self.__data) + self.__offsets.itemsize * len(self.__offsets) + self.__hashes.itemsize * len(self.__hashes)
+		if self.__table is not None:
+			tmp += self.__table.itemsize * len(self.__table)
+		return tmp
+
+	def write(self, stream: typing.BinaryIO, separator: bytes = SEPARATOR, terminate: bool = False):
+		"""
+		Write the entries to a binary stream, separated or terminated by the specified separator.\n
+		If the entries are newline-separated, the arena is written as a whole, without copying it.
+		"""
+		if separator == SEPARATOR and not terminate and not self.__objects:
+			if self.__data:
+				with memoryview(self.__data) as view:
+					stream.write(view[:-1])
+			return
+		data = self.__data
+		offsets = self.__offsets
+		first = True
+		for index in range(len(self)):
+			if not first and not terminate:
+				stream.write(separator)
+			first = False
+			entry = self.__objects.get(index) if self.__objects else None
+			if entry is not None:
+				entry.write(stream)
+			else:
+				with memoryview(data) as view:
+					stream.write(view[offsets[index]:offsets[index + 1] - 1])
+			if terminate:
+				stream.write(separator)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+"""
+Tests of the combinatorial mode, i.e., its exact estimates and its samples.
+
+Usage: python3 -m unittest discover tests
+"""
+
+import os, sys, unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+from amounts.main import create
+from amounts.utils import combine, digit, general
+
+SWEEPS = ["-10:10", "10:-10:-1", "-10:10:3", "-1000:999:7", "-20:7:3", "-5:-1", "0:9", "-1.5:1.5:0.5", "-0.5:1.50:0.25"]
+
+class TestCombine(unittest.TestCase):
+
+	def test_estimate(self):
+		"""
+		The estimate matches the generated entries exactly, and the entries are distinct, also for sweeps that cross zero.
+		"""
+		for sweep in SWEEPS:
+			with self.subTest(sweep = sweep):
+				amounts = create(sweep = sweep, quotes = "all", dedup_strategy = "none", combinatorial = True)
+				entries = list(amounts.run())
+				self.assertEqual(len(set(entries)), len(entries))
+				self.assertEqual(amounts.estimate(), (len(entries), len(("\n").join(entries).encode(combine.ENCODING))))
+
+	def test_lengths(self):
+		"""
+		The estimate of an integer sweep computed from its range matches the one computed from its distinct amounts.
+		"""
+		quotes = general.Quote.all()
+		for start in range(-40, 41, 7):
+			for stop in range(-40, 41, 9):
+				for step in [1, 2, 5, 13]:
+					step = step if stop >= start else -step
+					with self.subTest(start = start, stop = stop, step = step):
+						sweep, message = digit.validate_sweep(f"{start}:{stop}:{step}", None, None)
+						self.assertEqual(combine.estimate(sweep, quotes), combine.estimate(list(combine.distinct(sweep)), quotes))
+
+	def test_limit(self):
+		"""
+		A sample of a sweep that crosses zero contains exactly the specified number of unique entries.
+		"""
+		for sampling in [method.value for method in combine.Sample.all()]:
+			with self.subTest(sampling = sampling):
+				entries = list(create(sweep = "-10:10", combinatorial = True, limit = 200, sampling = sampling, seed = 1).run())
+				self.assertEqual(len(entries), 200)
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+"""
+Tests of the sweep validation and its number of values.
+
+Usage: python3 -m unittest discover tests
+"""
+
+import os, sys, unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+from amounts.utils import digit
+
+class TestSweep(unittest.TestCase):
+
+	def test_count(self):
+		"""
+		The number of values matches the generated values in both step directions.
+		"""
+		for value, expected in [("1:10", 10), ("1:10:3", 4), ("10:1:-3", 4), ("0:0", 1), ("-1.5:1.5:0.5", 7), ("1.5:-1.5:-0.5", 7), ("0:1:0.3", 4)]:
+			with self.subTest(sweep = value):
+				sweep, message = digit.validate_sweep(value, None, None)
+				self.assertEqual(message, "")
+				self.assertEqual(sweep.count(), expected)
+				self.assertEqual(len(list(sweep)), expected)
+
+	def test_direction(self):
+		"""
+		A step in the wrong direction is rejected, even if it is larger than the range.
+		"""
+		for value in ["1:0:3", "0:1:-3", "10:1", "1:10:-1", "0.5:0.1:0.5", "0.1:0.5:-0.5"]:
+			with self.subTest(sweep = value):
+				sweep, message = digit.validate_sweep(value, None, None)
+				self.assertIsNone(sweep)
+				self.assertEqual(message, "Sweep must contain at least one value, use a negative step for descending ranges")
+
+	def test_maximum(self):
+		"""
+		A sweep with more than the maximum number of values is rejected without an overflow.
+		"""
+		sweep, message = digit.validate_sweep("1:100000000000000000000", None, None)
+		self.assertIsNone(sweep)
+		self.assertEqual(message, f"Sweep must contain at most {digit.MAX_SWEEP} values")
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+"""
+Tests of the modules imported by the library API, each checked in a fresh interpreter.
+
+Usage: python3 -m unittest discover tests
+"""
+
+import json, os, subprocess, sys, unittest
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src")
+
+PROBE = """
+import json, sys
+before = set(sys.modules)
+import amounts
+imported = set(sys.modules)
+next(amounts.generate(minimum = 1, maximum = 10000, middle = 2200))
+print(json.dumps({"import": sorted(imported - before), "first": sorted(set(sys.modules) - imported)}))
+"""
+
+def probe() -> dict[str, list[str]]:
+	"""
+	Get the modules imported by importing the package, and by generating the first result, in a fresh interpreter.
+	"""
+	return json.loads(subprocess.run([sys.executable, "-c", PROBE], cwd = SRC, capture_output = True, text = True, check = True).stdout)
+
+class TestImports(unittest.TestCase):
+
+	def test_import(self):
+		"""
+		Importing the package imports nothing but the package itself.
+		"""
+		modules = probe()["import"]
+		self.assertEqual([name for name in modules if name.split(".")[0] != "amounts"], [])
+		for name in ["decimal", "importlib.metadata", "struct"]:
+			self.assertNotIn(name, modules)
+
+	def test_first(self):
+		"""
+		Generating the first result does not import the CLI, the cache, the previous wordlist, or the encoding stages.
+		"""
+		modules = probe()["first"]
+		for name in ["argparse", "amounts.utils.batch", "amounts.utils.cache", "amounts.utils.delta", "amounts.utils.encoding", "amounts.utils.serve", "amounts.utils.validate", "json", "mmap"]:
+			self.assertNotIn(name, modules)
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+"""
+Equivalence tests of the compiled template plans and the fuzz categories they replace.
+
+Usage: python3 -m unittest discover tests
+"""
+
+import itertools, os, sys, unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+from amounts.utils import digit, fuzz, general, template
+
+MIDDLES = ["0", "7", "-7", "1000", "-1234567", "1234567", "0.5", "-0.05", "1234.5678", "-1000000.01", "-0.0"]
+
+SWEEPS = ["-1000:1000:7", "-50.5:50.5:0.25"]
+
+SWEEP_SAMPLE = 50
+
+def categories(middle: digit.Amount, quote: general.Quote, ignore: bool) -> dict[str, list[str]]:
+	"""
+	Generate the entries of each category the template plans replace, with the fuzz functions.
+	"""
+	return {
+		"separators": list(fuzz.separators(middle)),
+		"zeros"     : list(fuzz.zeros(middle)),
+		"scopes"    : list(fuzz.scopes(middle)),
+		"currencies": list(fuzz.currencies(middle)),
+		"brackets"  : list(fuzz.brackets(middle, quote, ignore))
+	}
+
+def middles() -> list[digit.Amount]:
+	"""
+	Get the middle amounts to test, i.e., single amounts of all types and scopes, and a sample of the amounts of each sweep, computed in bulk.
+	"""
+	tmp = []
+	for value in MIDDLES:
+		amount, message = digit.validate_middle(value)
+		if message:
+			raise ValueError(message)
+		tmp.append(amount)
+	for value in SWEEPS:
+		sweep, message = digit.validate_sweep(value, None, None)
+		if message:
+			raise ValueError(message)
+		amounts = list(sweep)
+		tmp.extend(amounts[::max(1, len(amounts) // SWEEP_SAMPLE)])
+	return tmp
+
+class TestTemplate(unittest.TestCase):
+
+	def test_categories(self):
+		"""
+		Each category rendered from its own plan matches its fuzz function, across all quotes, scopes, the ignore flag, and a sweep sample.
+		"""
+		for middle, quote, ignore in itertools.product(middles(), general.Quote.all(), [False, True]):
+			expected = categories(middle, quote, ignore)
+			for name in template.CATEGORIES:
+				with self.subTest(middle = middle.string, quote = quote.name, ignore = ignore, category = name):
+					plan = template.compile_plan((name,), middle.type, middle.scope, quote, ignore)
+					self.assertEqual(template.render(plan, middle), expected[name])
+
+	def test_combined(self):
+		"""
+		All categories rendered from a single plan match their fuzz functions in order.
+		"""
+		for middle, quote, ignore in itertools.product(middles(), general.Quote.all(), [False, True]):
+			expected = categories(middle, quote, ignore)
+			with self.subTest(middle = middle.string, quote = quote.name, ignore = ignore):
+				plan = template.compile_plan(template.CATEGORIES, middle.type, middle.scope, quote, ignore)
+				self.assertEqual(template.render(plan, middle), [entry for name in template.CATEGORIES for entry in expected[name]])
+
+if __name__ == "__main__":
+	unittest.main()